@@ -55,6 +55,7 @@ class BaseSeriesAnnotator(BaseEstimator):
 
     _tags = {
         "distribution_type": "None",  # Tag to determine test in test_all_annotators
+        "remember_data": True,  # whether all data seen is remembered as self._X
     }  # for unit test cases
 
     def __init__(self, fmt="dense", labels="indicator"):
@@ -95,8 +96,9 @@ class BaseSeriesAnnotator(BaseEstimator):
         if Y is not None:
             Y = check_series(Y)
 
-        self._X = X
-        self._Y = Y
+        if self.get_tag("remember_data"):
+            self._X = X
+            self._Y = Y
 
         # fkiraly: insert checks/conversions here, after PR #1012 I suggest
 
@@ -169,10 +171,11 @@ class BaseSeriesAnnotator(BaseEstimator):
         if Y is not None:
             Y = check_series(Y)
 
-        self._X = X.combine_first(self._X)
+        if self.get_tag("remember_data"):
+            self._X = X.combine_first(self._X)
 
-        if Y is not None:
-            self._Y = Y.combine_first(self._Y)
+            if Y is not None:
+                self._Y = Y.combine_first(self._Y)
 
         self._update(X=X, Y=Y)
 
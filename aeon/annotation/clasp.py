@@ -13,18 +13,33 @@ As described in
 """
 
 import warnings
+from copy import deepcopy
 
 from aeon.annotation.base import BaseSeriesAnnotator
 
 __author__ = ["ermshaua", "patrickzib"]
-__all__ = ["ClaSPSegmentation", "find_dominant_window_sizes"]
+__all__ = [
+    "ClaSPSegmentation",
+    "StreamingClaSPSegmentation",
+    "find_dominant_window_sizes",
+]
 
 from queue import PriorityQueue
 
 import numpy as np
 import pandas as pd
-
-from aeon.transformations.series.clasp import ClaSPTransformer
+from numba import njit
+from scipy.stats import ranksums
+
+from aeon.transformations.series.clasp import (
+    ClaSPTransformer,
+    _calc_knn_labels,
+    _calc_profile,
+    _compute_distances_iterative,
+    _constrain_knn,
+    _exclusion_bounds,
+)
+from aeon.transformations.series.clasp import clasp as _clasp_profile
 from aeon.utils.validation.series import check_series
 
 
@@ -120,10 +135,19 @@ def _segmentation(X, clasp, n_change_points=None, exclusion_radius=0.05):
         (predicted_change_points, clasp_profiles, scores)
     """
     period_size = clasp.window_length
+    scoring_metric = clasp._check_scoring_metric(clasp.scoring_metric)
     queue = PriorityQueue()
 
-    # compute global clasp
-    profile = clasp.transform(X)
+    # compute global clasp, the knn graph of the whole series is then reused for
+    # the local profiles
+    knn = _compute_distances_iterative(X, period_size, 3)
+    profile, _ = _clasp_profile(
+        X,
+        period_size,
+        score=scoring_metric,
+        exclusion_radius=clasp.exclusion_radius,
+        knn=knn,
+    )
     queue.put(
         (
             -np.max(profile),
@@ -158,7 +182,15 @@ def _segmentation(X, clasp, n_change_points=None, exclusion_radius=0.05):
             # create and enqueue left local profile
             exclusion_zone = np.int64(len(ranges) * exclusion_radius)
             if len(ranges) - period_size > 2 * exclusion_zone:
-                profile = clasp.transform(X[ranges])
+                profile, _ = _clasp_profile(
+                    X[ranges],
+                    period_size,
+                    score=scoring_metric,
+                    exclusion_radius=clasp.exclusion_radius,
+                    knn=_constrain_knn(
+                        X, knn, period_size, 3, ranges[0], ranges[-1] + 1
+                    ),
+                )
                 change_point = np.argmax(profile)
                 score = profile[change_point]
 
@@ -373,3 +405,424 @@ class ClaSPSegmentation(BaseSeriesAnnotator):
             `create_test_instance` uses the first (or only) dictionary in `params`
         """
         return {"period_length": 5, "n_cps": 1}
+
+
+class StreamingClaSPSegmentation(BaseSeriesAnnotator):
+    """Streaming ClaSP (Classification Score Stream) Segmentation.
+
+    Change points are searched in a sliding window over an unbounded stream, in the
+    spirit of ClaSS. The stream is started with ``fit`` and extended with
+    ``update``. The k nearest neighbours of the subsequences of the window are
+    updated incrementally when a point arrives: the dot products of the new
+    subsequence with the others are derived from the ones of the previous
+    subsequence, and the new subsequence is inserted in the neighbours of the
+    others if it is closer than their current ones. Every ``jump`` points, the
+    ClaSP profile of the window is scored from these neighbours and its maximum is
+    reported as a change point if the labels predicted by the neighbours on both
+    sides of it significantly differ, according to a rank-sum test. The window then
+    restarts at the change point.
+
+    Memory is bounded by ``n_timepoints``, and a change point is reported at most
+    ``n_timepoints`` points after it happened. The subsequences whose neighbour
+    leaves the window search their neighbours in the window again, so that the
+    neighbours are always the ones of the current window. The points of the stream
+    are not remembered as ``self._X``.
+
+    ``predict`` returns the change points found if ``X`` was appended to the stream,
+    without updating it, and ``update_predict`` appends ``X`` and returns the change
+    points found with it.
+
+    Parameters
+    ----------
+    period_length : int, default=10
+        Size of window for sliding, based on the period length of the data.
+    n_timepoints : int, default=1000
+        Number of points of the sliding window.
+    k_neighbours : int, default=3
+        The number of nearest neighbours of each subsequence.
+    scoring_metric : str, default="ROC_AUC"
+        The scoring metric to use in ClaSP, "ROC_AUC" or "F1".
+    threshold : float, default=1e-15
+        Maximum p-value of the rank-sum test for the maximum of the profile to be
+        reported as a change point.
+    exclusion_radius : float, default=0.05
+        Exclusion Radius for change points to be non-trivial matches, as a fraction
+        of the number of subsequences in the window.
+    min_segment_length : int, default=None
+        Minimum distance of a change point to the start and the end of the window.
+        If None, 5 * period_length is used, small windows giving unreliable scores.
+    jump : int, default=10
+        Number of points between two scorings of the profile.
+    fmt : str {"dense", "sparse"}, default="sparse"
+        Annotation output format:
+        * If "sparse", a pd.Series of the found change points is returned.
+        * If "dense", a pd.IntervalIndex with the segmentation of the stream up to
+        the end of X is returned.
+
+    Attributes
+    ----------
+    change_points_ : list of int
+        The change points found so far, counted from the first point given in
+        ``fit``.
+    scores_ : list of float
+        The profile scores of the change points.
+    n_timepoints_seen_ : int
+        The number of points given in ``fit`` and ``update``.
+
+    References
+    ----------
+    .. [1] Ermshaus, A., Schäfer, P. and Leser, U. (2023). Raising the ClaSS of
+    Streaming Time Series Segmentation. arXiv:2310.20431.
+
+    Examples
+    --------
+    >>> from aeon.annotation.clasp import StreamingClaSPSegmentation
+    >>> from aeon.datasets import load_gun_point_segmentation
+    >>> X, true_period_size, cps = load_gun_point_segmentation()
+    >>> clasp = StreamingClaSPSegmentation(true_period_size, n_timepoints=1000)
+    >>> clasp = clasp.fit(X[:500])
+    >>> found_cps = clasp.update_predict(X[500:])
+    """
+
+    _tags = {"univariate-only": True, "remember_data": False}
+
+    def __init__(
+        self,
+        period_length=10,
+        n_timepoints=1000,
+        k_neighbours=3,
+        scoring_metric="ROC_AUC",
+        threshold=1e-15,
+        exclusion_radius=0.05,
+        min_segment_length=None,
+        jump=10,
+        fmt="sparse",
+    ):
+        self.period_length = period_length
+        self.n_timepoints = n_timepoints
+        self.k_neighbours = k_neighbours
+        self.scoring_metric = scoring_metric
+        self.threshold = threshold
+        self.exclusion_radius = exclusion_radius
+        self.min_segment_length = min_segment_length
+        self.jump = jump
+        super(StreamingClaSPSegmentation, self).__init__(fmt)
+
+    def _fit(self, X, Y=None):
+        """Start the stream with the series X and search it for change points.
+
+        Parameters
+        ----------
+        X : pd.Series or np.ndarray
+            The first points of the stream.
+        Y : ignored argument for interface compatibility
+
+        Returns
+        -------
+        self :
+            Reference to self.
+        """
+        self._period_length = int(self.period_length)
+        self._min_segment_length = (
+            5 * self._period_length
+            if self.min_segment_length is None
+            else self.min_segment_length
+        )
+        if self.n_timepoints <= 2 * self._min_segment_length:
+            raise ValueError(
+                f"n_timepoints must be greater than twice the minimum segment length, "
+                f"got {self.n_timepoints} for {self._min_segment_length}."
+            )
+        self._score = ClaSPTransformer()._check_scoring_metric(self.scoring_metric)
+
+        self.change_points_ = []
+        self.scores_ = []
+        self.n_timepoints_seen_ = 0
+        self._n = 0
+        self._n_since_scoring = 0
+        self._T = np.zeros(self.n_timepoints)
+        self._means = np.zeros(self.n_timepoints)
+        self._stds = np.zeros(self.n_timepoints)
+        self._QT = np.zeros(self.n_timepoints)
+        self._knn = np.full((self.n_timepoints, self.k_neighbours), -1, dtype=np.int64)
+        self._knn_dist = np.full((self.n_timepoints, self.k_neighbours), np.inf)
+
+        self._append(X)
+        return self
+
+    def _update(self, X, Y=None):
+        """Append the points of X to the stream and search for change points.
+
+        Parameters
+        ----------
+        X : pd.Series or np.ndarray
+            The new points of the stream, in chronological order.
+        Y : ignored argument for interface compatibility
+
+        Returns
+        -------
+        self :
+            Reference to self.
+        """
+        self._append(X)
+        return self
+
+    def _predict(self, X):
+        """Find the change points of X as if it was appended to the stream.
+
+        Parameters
+        ----------
+        X : pd.Series or np.ndarray
+            The points following the stream given in ``fit`` and ``update``.
+
+        Returns
+        -------
+        Y : pd.Series or pd.IntervalIndex
+            fmt=sparse : the change points found with X, counted from the first
+            point given in ``fit``.
+            fmt=dense : the segmentation of the stream up to the end of X.
+        """
+        stream = deepcopy(self)
+        change_points = stream._append(X)
+        return stream._format(change_points)
+
+    def update_predict(self, X):
+        """Append X to the stream and return the change points found with it.
+
+        Parameters
+        ----------
+        X : pd.Series or np.ndarray
+            The new points of the stream, in chronological order.
+
+        Returns
+        -------
+        Y : pd.Series or pd.IntervalIndex
+            The change points found with X, see ``predict``.
+        """
+        n_found = len(self.change_points_)
+        self.update(X)
+        return self._format(self.change_points_[n_found:])
+
+    def _format(self, change_points):
+        if self.fmt == "dense":
+            start = np.insert(np.asarray(self.change_points_, dtype=np.int64), 0, 0)
+            end = np.append(start[1:], self.n_timepoints_seen_)
+            return pd.IntervalIndex.from_arrays(start, end)
+        return pd.Series(change_points, dtype="int64")
+
+    def _append(self, X):
+        X = check_series(X, enforce_univariate=True, allow_numpy=True)
+        new_points = np.asarray(X, dtype=np.float64).flatten()
+        n_found = len(self.change_points_)
+
+        start = 0
+        while start < new_points.shape[0]:
+            end = min(start + self.jump - self._n_since_scoring, new_points.shape[0])
+            self._n = _class_update(
+                new_points[start:end],
+                self._n,
+                self._period_length,
+                self.n_timepoints_seen_ - self._n,
+                *_exclusion_bounds(self._period_length),
+                self._T,
+                self._means,
+                self._stds,
+                self._QT,
+                self._knn,
+                self._knn_dist,
+            )
+            self.n_timepoints_seen_ += end - start
+            self._n_since_scoring += end - start
+            if self._n_since_scoring == self.jump:
+                self._n_since_scoring = 0
+                self._score_window()
+            start = end
+
+        return self.change_points_[n_found:]
+
+    def _score_window(self):
+        m = self._period_length
+        n_subs = self._n - m + 1
+        exclusion_zone = max(
+            m, self._min_segment_length, np.int64(n_subs * self.exclusion_radius)
+        )
+        if n_subs <= 2 * exclusion_zone:
+            return
+        # every subsequence needs all of its neighbours in the window to be scored
+        knn = self._knn[:n_subs]
+        if np.any(knn < 0):
+            return
+
+        offset = self.n_timepoints_seen_ - self._n
+        knn_mask = np.ascontiguousarray((knn - offset).T)
+        profile = _calc_profile(m, knn_mask, self._score, exclusion_zone)
+        if np.all(np.isnan(profile)):
+            return
+        change_point = np.nanargmax(profile)
+        # the split is significant if the neighbours predict different labels on
+        # both of its sides
+        _, y_pred = _calc_knn_labels(knn_mask, change_point, m)
+        p_value = ranksums(y_pred[:change_point], y_pred[change_point:]).pvalue
+        if p_value <= self.threshold:
+            self.change_points_.append(offset + change_point)
+            self.scores_.append(profile[change_point])
+
+            # restart the window at the change point
+            n = self._n - change_point
+            for buffer in (self._T, self._means, self._stds, self._QT):
+                buffer[:n] = buffer[change_point : self._n].copy()
+            self._knn[:n] = self._knn[change_point : self._n].copy()
+            self._knn_dist[:n] = self._knn_dist[change_point : self._n].copy()
+            self._n = n
+
+            n_subs = n - m + 1
+            rows = np.flatnonzero(
+                np.any(self._knn[:n_subs] < offset + change_point, axis=1)
+            )
+            _recompute_neighbours(
+                rows,
+                n,
+                m,
+                offset + change_point,
+                *_exclusion_bounds(m),
+                self._T,
+                self._means,
+                self._stds,
+                self._knn,
+                self._knn_dist,
+            )
+
+    @classmethod
+    def get_test_params(cls, parameter_set="default"):
+        """Return testing parameter settings for the estimator.
+
+        Parameters
+        ----------
+        parameter_set : str, default="default"
+            Name of the set of test parameters to return, for use in tests. If no
+            special parameters are defined for a value, will return `"default"` set.
+
+        Returns
+        -------
+        params : dict or list of dict, default = {}
+            Parameters to create testing instances of the class
+            Each dict are parameters to construct an "interesting" test instance, i.e.,
+            `MyClass(**params)` or `MyClass(**params[i])` creates a valid test instance.
+            `create_test_instance` uses the first (or only) dictionary in `params`
+        """
+        return {"period_length": 3, "n_timepoints": 40, "jump": 5}
+
+
+@njit(fastmath=True, cache=True)
+def _insert_neighbour(knn, knn_dist, idx, dist):
+    # keep the neighbours sorted, ties going to the one inserted first
+    k = knn.shape[0]
+    if dist < knn_dist[k - 1]:
+        pos = k - 1
+        while pos > 0 and knn_dist[pos - 1] > dist:
+            knn_dist[pos] = knn_dist[pos - 1]
+            knn[pos] = knn[pos - 1]
+            pos -= 1
+        knn_dist[pos] = dist
+        knn[pos] = idx
+
+
+@njit(fastmath=True, cache=True)
+def _recompute_neighbours(
+    rows, n, m, offset, ez_left, ez_right, T, means, stds, knn, knn_dist
+):
+    n_subs = n - m + 1
+    for r in rows:
+        knn[r] = -1
+        knn_dist[r] = np.inf
+        for j in range(n_subs):
+            # self-join: exclusion zone
+            if r - ez_left <= j < r + ez_right:
+                continue
+            dot = 0.0
+            for t in range(m):
+                dot += T[r + t] * T[j + t]
+            dist = (
+                2 * m * (1 - (dot - m * means[j] * means[r]) / (m * stds[j] * stds[r]))
+            )
+            _insert_neighbour(knn[r], knn_dist[r], j + offset, dist)
+
+
+@njit(fastmath=True, cache=True)
+def _class_update(
+    new_points,
+    n,
+    m,
+    offset,
+    ez_left,
+    ez_right,
+    T,
+    means,
+    stds,
+    QT,
+    knn,
+    knn_dist,
+):
+    capacity = T.shape[0]
+    for x in new_points:
+        if n == capacity:
+            # discard the oldest point and subsequence
+            n_subs = n - m + 1
+            T[:-1] = T[1:]
+            means[: n_subs - 1] = means[1:n_subs]
+            stds[: n_subs - 1] = stds[1:n_subs]
+            QT[: n_subs - 1] = QT[1:n_subs]
+            knn[: n_subs - 1] = knn[1:n_subs]
+            knn_dist[: n_subs - 1] = knn_dist[1:n_subs]
+            n -= 1
+            offset += 1
+
+            # the subsequences which had the discarded one as neighbour search
+            # their neighbours in the window again
+            rows = np.flatnonzero((knn[: n_subs - 1] == offset - 1).sum(axis=1) > 0)
+            _recompute_neighbours(
+                rows, n, m, offset, ez_left, ez_right, T, means, stds, knn, knn_dist
+            )
+
+        T[n] = x
+        n += 1
+        s = n - m
+        if s < 0:
+            continue
+
+        _mean = 0.0
+        for t in range(m):
+            _mean += T[s + t]
+        _mean /= m
+        _var = 0.0
+        for t in range(m):
+            _var += (T[s + t] - _mean) ** 2
+        means[s] = _mean
+        # avoid dividing by too small std, as in _sliding_mean_std
+        stds[s] = np.sqrt(_var / m)
+        if stds[s] < 0.001:
+            stds[s] = 1.0
+
+        # QT holds the dot products of the previous last subsequence with all the
+        # others, shift them to the new last subsequence.
+        for j in range(s, 0, -1):
+            QT[j] = QT[j - 1] - T[s - 1] * T[j - 1] + T[s + m - 1] * T[j + m - 1]
+        QT[0] = 0.0
+        for t in range(m):
+            QT[0] += T[s + t] * T[t]
+
+        knn[s] = -1
+        knn_dist[s] = np.inf
+        for j in range(s):
+            dist = (
+                2
+                * m
+                * (1 - (QT[j] - m * means[j] * means[s]) / (m * stds[j] * stds[s]))
+            )
+            # self-join: exclusion zone of each subsequence
+            if j < s - ez_left:
+                _insert_neighbour(knn[s], knn_dist[s], j + offset, dist)
+            if s >= j + ez_right:
+                _insert_neighbour(knn[j], knn_dist[j], s + offset, dist)
+
+    return n
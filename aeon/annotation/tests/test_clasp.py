@@ -4,9 +4,15 @@ __author__ = ["patrickzib"]
 __all__ = []
 
 import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
 
-from aeon.annotation.clasp import ClaSPSegmentation
+from aeon.annotation.clasp import ClaSPSegmentation, StreamingClaSPSegmentation
 from aeon.datasets import load_gun_point_segmentation
+from aeon.transformations.series.clasp import (
+    _compute_distances_iterative,
+    _constrain_knn,
+)
 
 
 def test_clasp_sparse():
@@ -43,3 +49,52 @@ def test_clasp_dense():
 
     assert len(segmentation) == 2 and segmentation[0].right == 893
     assert np.argmax(scores) == 893
+
+
+def test_clasp_constrained_knn():
+    """Test the local knns derived from the global ones against a recomputation."""
+    X = np.random.default_rng(0).normal(size=300)
+    knn = _compute_distances_iterative(X, 10, 3)
+    for lbound, ubound in [(0, 120), (80, 300), (100, 250)]:
+        local_knn = _constrain_knn(X, knn, 10, 3, lbound, ubound)
+        assert_array_equal(
+            local_knn, _compute_distances_iterative(X[lbound:ubound], 10, 3)
+        )
+
+
+def test_streaming_clasp_knn():
+    """Test the incremental knns against the ones of the current window."""
+    X = np.random.default_rng(0).normal(size=700)
+    clasp = StreamingClaSPSegmentation(10, n_timepoints=300, threshold=0.0)
+    clasp.fit(X[:13])
+    for i in range(13, 700, 13):
+        clasp.update(X[i : i + 13])
+    assert clasp.n_timepoints_seen_ == 700
+    assert_array_equal(
+        clasp._knn[:291] - 400, _compute_distances_iterative(X[400:], 10, 3)
+    )
+
+
+def test_streaming_clasp_segmentation():
+    """Test the change point found on a stream."""
+    ts, period_size, cps = load_gun_point_segmentation()
+    clasp = StreamingClaSPSegmentation(period_size, n_timepoints=1000)
+    chunks = np.split(ts.to_numpy(), 15)
+    clasp.fit(chunks[0])
+    assert len(clasp.change_points_) == 0
+
+    # predict does not change the stream
+    predicted = clasp.predict(np.concatenate(chunks[1:]))
+    assert clasp.n_timepoints_seen_ == len(chunks[0])
+
+    found_cps = np.concatenate([clasp.update_predict(x) for x in chunks[1:]])
+    assert_array_equal(found_cps, clasp.change_points_)
+    assert_array_equal(found_cps, predicted)
+    assert len(found_cps) == 1 and abs(found_cps[0] - cps[0]) < 100
+
+    # parameters are not changed and the state is rebuilt by fit
+    clone = clasp.clone()
+    assert clone.get_params() == clasp.get_params()
+    assert not hasattr(clone, "change_points_")
+    with pytest.raises(ValueError, match="n_timepoints"):
+        StreamingClaSPSegmentation(period_size, n_timepoints=100).fit(chunks[0])
@@ -67,9 +67,15 @@ from aeon.exceptions import NotFittedError
 class BaseObject(_BaseEstimator):
     """Base class for parametric objects with tags aeon.
 
-    Extends scikit-learn's BaseEstimator to include aeon interface for tags.
+    Extends scikit-learn's BaseEstimator to include aeon interface for tags and
+    configs.
     """
 
+    _config = {
+        "backend:parallel": None,
+        "backend:parallel:params": None,
+    }
+
     def __init__(self):
         self._tags_dynamic = dict()
         super(BaseObject, self).__init__()
@@ -108,9 +114,11 @@ class BaseObject(_BaseEstimator):
         Not affected by the reset are:
         object attributes containing double-underscores
         class and object methods, class attributes
+        dynamic configs set by set_config
         """
-        # retrieve parameters to copy them later
+        # retrieve parameters and configs to copy them later
         params = self.get_params(deep=False)
+        config_dynamic = getattr(self, "_config_dynamic", None)
 
         # delete all object attributes in self
         attrs = [attr for attr in dir(self) if "__" not in attr]
@@ -122,6 +130,9 @@ class BaseObject(_BaseEstimator):
         # run init with a copy of parameters self had at the start
         self.__init__(**params)
 
+        if config_dynamic is not None:
+            self._config_dynamic = config_dynamic
+
         return self
 
     def clone(self):
@@ -129,14 +140,18 @@ class BaseObject(_BaseEstimator):
         Obtain a clone of the object with same hyper-parameters.
 
         A clone is a different object without shared references, in post-init state.
-        This function is equivalent to returning sklearn.clone of self.
+        This function is equivalent to returning sklearn.clone of self, with the
+        dynamic configs of self set by set_config.
         Equal in value to `type(self)(**self.get_params(deep=False))`.
 
         Returns
         -------
         instance of type(self), clone of self (see above)
         """
-        return clone(self)
+        self_clone = clone(self)
+        if hasattr(self, "_config_dynamic"):
+            self_clone.set_config(**self._config_dynamic)
+        return self_clone
 
     @classmethod
     def _get_init_signature(cls):
@@ -460,6 +475,87 @@ class BaseObject(_BaseEstimator):
 
         return self
 
+    def get_config(self):
+        """
+        Get config flags for self.
+
+        Configs are settings that change how an object computes, but not what it
+        computes. They are not hyper-parameters, are not reset by ``reset`` and are
+        kept by ``clone``.
+
+        Valid configs are:
+
+        backend:parallel : str or None, default=None
+            Backend used to loop over series and columns when vectorizing methods of
+            forecasters and transformers over data they do not natively support. One
+            of None (sequential loop), "loky", "threading", "multiprocessing" or
+            "dask". See ``aeon.utils.parallel.parallelize``.
+        backend:parallel:params : dict or None, default=None
+            Additional arguments passed to the parallel backend, for example
+            ``{"n_jobs": 4}`` for the joblib backends.
+
+        Returns
+        -------
+        config_dict : dict
+            Dictionary of config name : config value pairs. Collected from _config
+            class attribute via nested inheritance and then any overrides
+            and new configs from _config_dynamic object attribute.
+
+        Examples
+        --------
+        >>> from aeon.forecasting.naive import NaiveForecaster
+        >>> forecaster = NaiveForecaster()
+        >>> forecaster.get_config()["backend:parallel"] is None
+        True
+        """
+        config = dict()
+
+        # We exclude the last two parent classes: sklearn.base.BaseEstimator and
+        # the basic Python object.
+        for parent_class in reversed(inspect.getmro(type(self))[:-2]):
+            if hasattr(parent_class, "_config"):
+                config.update(parent_class._config)
+
+        if hasattr(self, "_config_dynamic"):
+            config.update(self._config_dynamic)
+
+        return deepcopy(config)
+
+    def set_config(self, **config_dict):
+        """
+        Set config flags to given values.
+
+        Parameters
+        ----------
+        **config_dict : dict
+            Dictionary of config name : config value pairs, see ``get_config`` for
+            valid configs.
+
+        Returns
+        -------
+        Self :
+            Reference to self.
+
+        Notes
+        -----
+        Changes object state by setting config values in config_dict as dynamic
+        configs in self.
+
+        Examples
+        --------
+        >>> from aeon.forecasting.naive import NaiveForecaster
+        >>> forecaster = NaiveForecaster().set_config(
+        ...     **{"backend:parallel": "loky", "backend:parallel:params": {"n_jobs": 2}}
+        ... )
+        """
+        config_update = deepcopy(config_dict)
+        if hasattr(self, "_config_dynamic"):
+            self._config_dynamic.update(config_update)
+        else:
+            self._config_dynamic = config_update
+
+        return self
+
     @classmethod
     def get_test_params(cls, parameter_set="default"):
         """
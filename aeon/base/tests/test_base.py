@@ -8,6 +8,7 @@ tests in this module:
     test_get_tags        - tests get_tags inheritance logic
     test_get_tag         - tests get_tag logic, incl default value
     test_set_tags        - tests set_tags logic and related get_tags inheritance
+    test_set_config      - tests set_config logic and persistence of configs
 
     test_reset           - tests reset logic on a simple, non-composite estimator
     test_reset_composite - tests reset logic on a composite estimator
@@ -26,6 +27,7 @@ __all__ = [
     "test_get_tags",
     "test_get_tag",
     "test_set_tags",
+    "test_set_config",
     "test_reset",
     "test_reset_composite",
     "test_components",
@@ -175,6 +177,28 @@ def test_set_tags():
     assert FIXTURE_OBJECT_SET.get_tags() == FIXTURE_OBJECT_SET_TAGS, msg
 
 
+def test_set_config():
+    """Tests set_config method of BaseObject for correctness.
+
+    Raises
+    ------
+    AssertionError if configs are not set, or not kept by reset and clone
+    """
+    obj = FixtureClassChild()
+    assert obj.get_config() == {
+        "backend:parallel": None,
+        "backend:parallel:params": None,
+    }
+
+    obj.set_config(**{"backend:parallel": "threading"})
+    assert obj.get_config()["backend:parallel"] == "threading"
+    assert obj.get_config()["backend:parallel:params"] is None
+    assert FixtureClassChild().get_config()["backend:parallel"] is None
+
+    assert obj.reset().get_config()["backend:parallel"] == "threading"
+    assert obj.clone().get_config()["backend:parallel"] == "threading"
+
+
 class CompositionDummy(BaseObject):
     """Potentially composite object, for testing."""
 
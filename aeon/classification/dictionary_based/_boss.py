@@ -10,13 +10,10 @@ __all__ = ["BOSSEnsemble", "IndividualBOSS", "pairwise_distances"]
 from itertools import compress
 
 import numpy as np
-from joblib import Parallel, effective_n_jobs
 from sklearn.metrics import pairwise
-from sklearn.utils import check_random_state, gen_even_slices
+from sklearn.utils import check_random_state
 from sklearn.utils.extmath import safe_sparse_dot
-from sklearn.utils.fixes import delayed
 from sklearn.utils.sparsefuncs_fast import csr_row_norms
-from sklearn.utils.validation import _num_samples
 
 from aeon.classification.base import BaseClassifier
 from aeon.transformations.collection.dictionary_based import SFAFast
@@ -699,31 +696,45 @@ class IndividualBOSS(BaseClassifier):
         self._transformed_data = self._transformer.fit_transform(X, y)
 
 
-def _dist_wrapper(dist_matrix, X, Y, s, XX_all=None, XY_all=None):
-    """Write in-place to a slice of a distance matrix."""
-    for i in range(s.start, s.stop):
-        dist_matrix[i] = boss_distance(X, Y, i, XX_all, XY_all)
+def pairwise_distances(X, Y=None, use_boss_distance=False, n_jobs=1):
+    """Find the euclidean distance between all pairs of bop-models.
 
+    The boss distances between all the rows of X and Y are computed at once with
+    sparse matrix products: the squared norms of the rows of Y restricted to the
+    words of each row of X are the product of the word indicator of X with the
+    squared counts of Y.
 
-def pairwise_distances(X, Y=None, use_boss_distance=False, n_jobs=1):
-    """Find the euclidean distance between all pairs of bop-models."""
+    Parameters
+    ----------
+    X : sparse matrix of shape (n_cases_X, n_words)
+        The bop-models to find the distances from.
+    Y : sparse matrix of shape (n_cases_Y, n_words) or None, default=None
+        The bop-models to find the distances to. If None, X is used and the
+        distances of each case to itself are set to infinity.
+    use_boss_distance : bool, default=False
+        Whether to use the non-symmetric boss distance instead of the euclidean
+        distance.
+    n_jobs : int, default=1
+        The number of jobs used by the euclidean distance. It is ignored when
+        ``use_boss_distance=True``, the sparse matrix products are single-threaded.
+
+    Returns
+    -------
+    distance_matrix : np.ndarray of shape (n_cases_X, n_cases_Y)
+        The distances between all the rows of X and Y.
+    """
     if use_boss_distance:
         if Y is None:
             Y = X
 
         XX_row_norms = csr_row_norms(X)
         XY = safe_sparse_dot(X, Y.T, dense_output=True)
+        YY_masked = safe_sparse_dot(
+            (X != 0).astype(np.float64), Y.multiply(Y).T, dense_output=True
+        )
 
-        distance_matrix = np.zeros((X.shape[0], Y.shape[0]))
-
-        if effective_n_jobs(n_jobs) > 1:
-            Parallel(n_jobs=n_jobs, prefer="threads")(
-                delayed(_dist_wrapper)(distance_matrix, X, Y, s, XX_row_norms, XY)
-                for s in gen_even_slices(_num_samples(X), effective_n_jobs(n_jobs))
-            )
-        else:
-            for i in range(len(distance_matrix)):
-                distance_matrix[i] = boss_distance(X, Y, i, XX_row_norms, XY)
+        distance_matrix = XX_row_norms[:, np.newaxis] - 2 * XY + YY_masked
+        np.maximum(distance_matrix, 0, out=distance_matrix)
 
     else:
         distance_matrix = pairwise.pairwise_distances(X, Y, n_jobs=n_jobs)
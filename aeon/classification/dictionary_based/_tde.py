@@ -15,8 +15,10 @@ from collections import defaultdict
 
 import numpy as np
 from joblib import Parallel, delayed
-from numba import njit, types
+from numba import get_num_threads, njit, prange, set_num_threads, types
+from numba.core.config import NUMBA_NUM_THREADS
 from numba.typed import Dict
+from scipy.sparse import csr_matrix
 from sklearn import preprocessing
 from sklearn.kernel_ridge import KernelRidge
 from sklearn.utils import check_random_state
@@ -88,6 +90,11 @@ class TemporalDictionaryEnsemble(BaseClassifier):
         be faster for larger datasets. As the Dict cannot be pickled currently, there
         will be some overhead converting it to a python dict with multiple threads and
         pickling.
+    sparse_bags : bool, default=False
+        Store the word counts of the ensemble members as a vocabulary and a CSR sparse
+        matrix. The histogram intersections of all test cases with all train cases
+        are then computed in a single compiled call, and the members can be pickled
+        without conversion.
     save_train_predictions : bool, default=False
         Save the ensemble member train predictions in fit for use in _get_train_probs
         leave-one-out cross-validation.
@@ -171,6 +178,7 @@ class TemporalDictionaryEnsemble(BaseClassifier):
         time_limit_in_minutes=0.0,
         contract_max_n_parameter_samples=np.inf,
         typed_dict=True,
+        sparse_bags=False,
         save_train_predictions=False,
         n_jobs=1,
         random_state=None,
@@ -189,6 +197,7 @@ class TemporalDictionaryEnsemble(BaseClassifier):
         self.time_limit_in_minutes = time_limit_in_minutes
         self.contract_max_n_parameter_samples = contract_max_n_parameter_samples
         self.typed_dict = typed_dict
+        self.sparse_bags = sparse_bags
         self.save_train_predictions = save_train_predictions
         self.random_state = random_state
         self.n_jobs = n_jobs
@@ -331,6 +340,7 @@ class TemporalDictionaryEnsemble(BaseClassifier):
                 dim_threshold=self.dim_threshold,
                 max_dims=self.max_dims,
                 typed_dict=self.typed_dict,
+                sparse_bags=self.sparse_bags,
                 n_jobs=self._n_jobs,
                 random_state=self.random_state,
             )
@@ -648,6 +658,10 @@ class IndividualTDE(BaseClassifier):
     typed_dict : bool, default=True
         Use a numba TypedDict to store word counts. May increase memory usage, but will
         be faster for larger datasets.
+    sparse_bags : bool, default=False
+        Store the word counts as a vocabulary and a CSR sparse matrix. The histogram
+        intersections of all test cases with all train cases are then computed in a
+        single compiled call, and the classifier can be pickled without conversion.
     n_jobs : int, default=1
         The number of jobs to run in parallel for both `fit` and `predict`.
         ``-1`` means using all processors.
@@ -714,6 +728,7 @@ class IndividualTDE(BaseClassifier):
         dim_threshold=0.85,
         max_dims=20,
         typed_dict=True,
+        sparse_bags=False,
         n_jobs=1,
         random_state=None,
     ):
@@ -730,6 +745,7 @@ class IndividualTDE(BaseClassifier):
         self.max_dims = max_dims
 
         self.typed_dict = typed_dict
+        self.sparse_bags = sparse_bags
         self.n_jobs = n_jobs
         self.random_state = random_state
 
@@ -742,6 +758,7 @@ class IndividualTDE(BaseClassifier):
 
         self._transformers = []
         self._transformed_data = []
+        self._vocabulary = {}
         self._class_vals = []
         self._dims = []
         self._highest_dim_bit = 0
@@ -755,7 +772,7 @@ class IndividualTDE(BaseClassifier):
     def __getstate__(self):
         """Return state as dictionary for pickling, required for typed Dict objects."""
         state = self.__dict__.copy()
-        if self._typed_dict:
+        if self._typed_dict and not self.sparse_bags:
             nl = [None] * len(self._transformed_data)
             for i, ndict in enumerate(state["_transformed_data"]):
                 pdict = dict()
@@ -768,7 +785,7 @@ class IndividualTDE(BaseClassifier):
     def __setstate__(self, state):
         """Set current state using input pickling, required for typed Dict objects."""
         self.__dict__.update(state)
-        if self._typed_dict:
+        if self._typed_dict and not self.sparse_bags:
             nl = [None] * len(self._transformed_data)
             for i, pdict in enumerate(self._transformed_data):
                 ndict = (
@@ -863,6 +880,12 @@ class IndividualTDE(BaseClassifier):
             sfa = self._transformers[0].transform(X, y)
             self._transformed_data = sfa[0]
 
+        if self.sparse_bags:
+            self._vocabulary = {}
+            self._transformed_data = _bags_to_csr(
+                self._transformed_data, self._vocabulary
+            )
+
     def _predict(self, X):
         """Predict class values of all instances in X.
 
@@ -914,6 +937,14 @@ class IndividualTDE(BaseClassifier):
             test_bags = self._transformers[0].transform(X)
             test_bags = test_bags[0]
 
+        if self.sparse_bags:
+            sims = _pairwise_histogram_intersection(
+                _bags_to_csr(test_bags, self._vocabulary, fixed_vocabulary=True),
+                self._transformed_data,
+                self._n_jobs,
+            )
+            return np.array([self._nn_from_similarities(sim) for sim in sims])
+
         classes = Parallel(n_jobs=self._n_jobs, prefer="threads")(
             delayed(self._test_nn)(
                 test_bag,
@@ -938,6 +969,22 @@ class IndividualTDE(BaseClassifier):
 
         return nn
 
+    def _nn_from_similarities(self, sims):
+        # Same choice as _test_nn, only the bags at least as similar as all the
+        # previous ones can be selected.
+        rng = check_random_state(self.random_state)
+
+        best_sim = -1
+        nn = None
+
+        prev_max = np.maximum.accumulate(np.concatenate(([-1], sims[:-1])))
+        for n in np.flatnonzero(sims >= prev_max):
+            if sims[n] > best_sim or (sims[n] == best_sim and rng.random() < 0.5):
+                best_sim = sims[n]
+                nn = self._class_vals[n]
+
+        return nn
+
     def _select_dims(self, X, y):
         self._highest_dim_bit = (math.ceil(math.log2(self.n_dims_))) + 1
         accs = []
@@ -1003,6 +1050,21 @@ class IndividualTDE(BaseClassifier):
         if bags is None:
             bags = self._transformed_data
 
+        if isinstance(bags, csr_matrix):
+            # serial kernel, this is called from the joblib threads of the
+            # LOOCV estimate and numba parallel regions must not be nested there
+            start, end = bags.indptr[train_num], bags.indptr[train_num + 1]
+            sims = _histogram_intersection_csr_row(
+                bags.indices[start:end],
+                bags.data[start:end],
+                bags.indptr,
+                bags.indices,
+                bags.data,
+                bags.shape[1],
+            )
+            sims[train_num] = -1
+            return self._class_vals[np.argmax(sims)]
+
         test_bag = bags[train_num]
         best_sim = -1
         nn = None
@@ -1062,3 +1124,100 @@ def _histogram_intersection_dict(first, second):
         val_b = second.get(word, types.uint32(0))
         sim += min(val_a, val_b)
     return sim
+
+
+def _bags_to_csr(bags, vocabulary, fixed_vocabulary=False):
+    """Convert a list of bags of words to a CSR sparse matrix.
+
+    Parameters
+    ----------
+    bags : list of dict or numba.Dict
+        The word counts of each case.
+    vocabulary : dict
+        Mapping from the words to the columns of the matrix. New words are added to
+        it unless fixed_vocabulary is True.
+    fixed_vocabulary : bool, default=False
+        Whether to ignore the words not in the vocabulary instead of adding them.
+        Their count does not change the histogram intersection with bags built with
+        the vocabulary.
+
+    Returns
+    -------
+    csr_matrix of shape (len(bags), len(vocabulary))
+        The word counts of each case.
+    """
+    indptr = np.zeros(len(bags) + 1, dtype=np.int64)
+    indices = []
+    data = []
+    for i, bag in enumerate(bags):
+        for word, count in bag.items():
+            column = vocabulary.get(word)
+            if column is None:
+                if fixed_vocabulary:
+                    continue
+                column = len(vocabulary)
+                vocabulary[word] = column
+            indices.append(column)
+            data.append(count)
+        indptr[i + 1] = len(indices)
+
+    return csr_matrix(
+        (
+            np.array(data, dtype=np.uint32),
+            np.array(indices, dtype=np.int64),
+            indptr,
+        ),
+        shape=(len(bags), len(vocabulary)),
+    )
+
+
+def _pairwise_histogram_intersection(X, Y, n_jobs):
+    prev_threads = get_num_threads()
+    set_num_threads(min(n_jobs, NUMBA_NUM_THREADS))
+    try:
+        return _histogram_intersection_csr(
+            X.indptr, X.indices, X.data, Y.indptr, Y.indices, Y.data, Y.shape[1]
+        )
+    finally:
+        set_num_threads(prev_threads)
+
+
+@njit(fastmath=True, cache=True, parallel=True)
+def _histogram_intersection_csr(
+    X_indptr, X_indices, X_data, Y_indptr, Y_indices, Y_data, n_words
+):
+    n_x = X_indptr.shape[0] - 1
+    sims = np.zeros((n_x, Y_indptr.shape[0] - 1))
+
+    for i in prange(n_x):
+        sims[i] = _histogram_intersection_csr_row(
+            X_indices[X_indptr[i] : X_indptr[i + 1]],
+            X_data[X_indptr[i] : X_indptr[i + 1]],
+            Y_indptr,
+            Y_indices,
+            Y_data,
+            n_words,
+        )
+
+    return sims
+
+
+@njit(fastmath=True, cache=True)
+def _histogram_intersection_csr_row(
+    x_indices, x_data, Y_indptr, Y_indices, Y_data, n_words
+):
+    n_y = Y_indptr.shape[0] - 1
+    sims = np.zeros(n_y)
+
+    # dense copy of the test bag, so that the train bags are scanned once
+    counts = np.zeros(n_words)
+    for p in range(x_indices.shape[0]):
+        counts[x_indices[p]] = x_data[p]
+
+    for j in range(n_y):
+        sim = 0.0
+        for p in range(Y_indptr[j], Y_indptr[j + 1]):
+            sim += min(counts[Y_indices[p]], Y_data[p])
+        sims[j] = sim
+
+    return sims
@@ -3,7 +3,9 @@ import numpy as np
 from sklearn.metrics import accuracy_score
 
 from aeon.classification.dictionary_based import BOSSEnsemble
+from aeon.classification.dictionary_based._boss import boss_distance, pairwise_distances
 from aeon.datasets import load_unit_test
+from aeon.transformations.collection.dictionary_based import SFAFast
 
 
 def test_boss_train_estimate():
@@ -22,3 +24,19 @@ def test_boss_train_estimate():
     assert train_probas.shape == (20, 2)
     train_preds = boss.classes_[np.argmax(train_probas, axis=1)]
     assert accuracy_score(y_train, train_preds) >= 0.6
+
+
+def test_boss_pairwise_distances():
+    """Test the batched boss distances against the distance of each bag."""
+    X_train, y_train = load_unit_test(split="train")
+    X_test, _ = load_unit_test(split="test")
+
+    sfa = SFAFast(word_length=6, window_size=10, remove_repeat_words=True)
+    train_bags = sfa.fit_transform(X_train, y_train)
+    test_bags = sfa.transform(X_test)
+
+    distances = pairwise_distances(test_bags, train_bags, use_boss_distance=True)
+    for i in range(test_bags.shape[0]):
+        np.testing.assert_array_almost_equal(
+            distances[i], boss_distance(test_bags, train_bags, i).ravel()
+        )
@@ -1,8 +1,15 @@
 """TDE test code."""
+import pickle
+
 import numpy as np
+import pytest
+from scipy.sparse import csr_matrix
 
-from aeon.classification.dictionary_based._tde import TemporalDictionaryEnsemble
-from aeon.datasets import load_unit_test
+from aeon.classification.dictionary_based._tde import (
+    IndividualTDE,
+    TemporalDictionaryEnsemble,
+)
+from aeon.datasets import load_basic_motions, load_unit_test
 
 
 def test_tde_oob_train_estimate():
@@ -24,3 +31,49 @@ def test_tde_oob_train_estimate():
     assert isinstance(train_proba, np.ndarray)
     assert train_proba.shape == (len(X_train), 2)
     np.testing.assert_almost_equal(train_proba.sum(axis=1), 1, decimal=4)
+
+
+@pytest.mark.parametrize("levels", [1, 2])
+def test_tde_sparse_bags(levels):
+    """Test that the sparse bags give the same predictions as the dictionaries."""
+    X_train, y_train = load_basic_motions(split="train")
+    X_test, _ = load_basic_motions(split="test")
+
+    tde = IndividualTDE(levels=levels, random_state=0)
+    tde.fit(X_train, y_train)
+    tde_sparse = IndividualTDE(levels=levels, sparse_bags=True, random_state=0)
+    tde_sparse.fit(X_train, y_train)
+
+    assert isinstance(tde_sparse._transformed_data, csr_matrix)
+    np.testing.assert_array_equal(tde.predict(X_test), tde_sparse.predict(X_test))
+    for i in range(len(y_train)):
+        assert tde._train_predict(i) == tde_sparse._train_predict(i)
+
+    tde_sparse = pickle.loads(pickle.dumps(tde_sparse))
+    np.testing.assert_array_equal(tde.predict(X_test), tde_sparse.predict(X_test))
+
+
+def test_tde_sparse_bags_n_jobs():
+    """Test the threaded train estimates and predictions with sparse bags."""
+    X_train, y_train = load_unit_test(split="train")
+    X_test, _ = load_unit_test(split="test")
+
+    params = {
+        "n_parameter_samples": 10,
+        "max_ensemble_size": 5,
+        "randomly_selected_params": 5,
+        "sparse_bags": True,
+        "random_state": 0,
+    }
+    tde = TemporalDictionaryEnsemble(**params)
+    tde.fit(X_train, y_train)
+    tde_threaded = TemporalDictionaryEnsemble(n_jobs=2, **params)
+    tde_threaded.fit(X_train, y_train)
+
+    np.testing.assert_array_equal(
+        tde.predict_proba(X_test), tde_threaded.predict_proba(X_test)
+    )
+    np.testing.assert_array_equal(
+        tde._get_train_probs(X_train, y_train, train_estimate_method="loocv"),
+        tde_threaded._get_train_probs(X_train, y_train, train_estimate_method="loocv"),
+    )
@@ -12,8 +12,10 @@ import numpy as np
 
 from aeon.classification.base import BaseClassifier
 from aeon.distances import get_distance_function
+from aeon.distances._lower_bound import _LowerBoundSearch
 
 WEIGHTS_SUPPORTED = ["uniform", "distance"]
+SEARCH_STRATEGIES_SUPPORTED = ["brute", "lower_bound"]
 
 
 class KNeighborsTimeSeriesClassifier(BaseClassifier):
@@ -49,6 +51,15 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         ``-1`` means using all processors. See :term:`Glossary <n_jobs>`
         for more details.
         Parameter for compatibility purposes, still unimplemented.
+    search_strategy : str, default="brute"
+        How the nearest neighbours of a case are found, one of:
+            'brute' computes the distance to every training case.
+            'lower_bound' visits the training cases in order of a lower bound,
+            skips cases whose LB_Kim, LB_Keogh or LB_Improved bound rules them out
+            and early abandons the distance computation once it exceeds the current
+            k-th best distance. Gives the same neighbours as 'brute'. It is used
+            for the 'dtw', 'wdtw' and 'msm' (without a window) distances on equal
+            length series, other settings fall back to 'brute'.
 
     Examples
     --------
@@ -76,6 +87,7 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         n_neighbors=1,
         weights="uniform",
         n_jobs=1,
+        search_strategy="brute",
     ):
         self.distance = distance
         self.distance_params = distance_params
@@ -93,6 +105,13 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
             )
         self.weights = weights
 
+        if search_strategy not in SEARCH_STRATEGIES_SUPPORTED:
+            raise ValueError(
+                f"Unrecognised kNN search_strategy: {search_strategy}. "
+                f"Allowed values are: {SEARCH_STRATEGIES_SUPPORTED}. "
+            )
+        self.search_strategy = search_strategy
+
         super(KNeighborsTimeSeriesClassifier, self).__init__()
 
     def _fit(self, X, y):
@@ -111,6 +130,12 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
             self.metric_ = get_distance_function(metric=self.distance)
 
         self.X_ = X
+        self._search = None
+        if self.search_strategy == "lower_bound" and _LowerBoundSearch.supports(
+            self.distance, self._distance_params, X
+        ):
+            self._search = _LowerBoundSearch(self.distance, self._distance_params)
+            self._search.fit(X)
         self.classes_, self.y_ = np.unique(y, return_inverse=True)
         return self
 
@@ -194,23 +219,27 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         ws : array
             Array representing the weights of each neighbor.
         """
-        distances = np.array(
-            [
-                self.metric_(X, self.X_[j], **self._distance_params)
-                for j in range(len(self.X_))
-            ]
-        )
-
-        # Find indices of k nearest neighbors using partitioning:
-        # [0..k-1], [k], [k+1..n-1]
-        # They might not be ordered within themselves,
-        # but it is not necessary and partitioning is
-        # O(n) while sorting is O(nlogn)
-        closest_idx = np.argpartition(distances, self.n_neighbors)
-        closest_idx = closest_idx[: self.n_neighbors]
+        if self._search is not None and X.shape == self.X_.shape[1:]:
+            closest_idx, closest_dist = self._search.kneighbors(X, self.n_neighbors)
+        else:
+            distances = np.array(
+                [
+                    self.metric_(X, self.X_[j], **self._distance_params)
+                    for j in range(len(self.X_))
+                ]
+            )
+
+            # Find indices of k nearest neighbors using partitioning:
+            # [0..k-1], [k], [k+1..n-1]
+            # They might not be ordered within themselves,
+            # but it is not necessary and partitioning is
+            # O(n) while sorting is O(nlogn)
+            closest_idx = np.argpartition(distances, self.n_neighbors)
+            closest_idx = closest_idx[: self.n_neighbors]
+            closest_dist = distances[closest_idx]
 
         if self.weights == "distance":
-            ws = distances[closest_idx]
+            ws = closest_dist
             ws = ws**2
 
             # Using epsilon ~= 0 to avoid division by zero
@@ -242,5 +271,6 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         """
         # non-default distance and algorithm
         params1 = {"distance": "euclidean"}
+        params2 = {"distance": "dtw", "search_strategy": "lower_bound"}
 
-        return [params1]
+        return [params1, params2]
@@ -1,4 +1,5 @@
 """Tests for KNeighborsTimeSeriesClassifier."""
+import numpy as np
 import pytest
 
 from aeon.classification.distance_based._time_series_neighbors import (
@@ -74,3 +75,23 @@ def test_knn_bounding_matrix(distance_key):
         if pred[j] == y_test[j]:
             correct = correct + 1
     assert correct == expected_correct_window[distance_key]
+
+
+@pytest.mark.parametrize("distance_key", ["dtw", "wdtw", "msm"])
+@pytest.mark.parametrize("distance_params", [None, {"window": 0.2}])
+def test_knn_lower_bound_search(distance_key, distance_params):
+    """Test the lower bound search gives the same predictions as brute force."""
+    X_train, y_train = load_unit_test(split="train")
+    X_test, _ = load_unit_test(split="test")
+    brute = KNeighborsTimeSeriesClassifier(
+        distance=distance_key, distance_params=distance_params, n_neighbors=3
+    )
+    pruned = KNeighborsTimeSeriesClassifier(
+        distance=distance_key,
+        distance_params=distance_params,
+        n_neighbors=3,
+        search_strategy="lower_bound",
+    )
+    brute.fit(X_train, y_train)
+    pruned.fit(X_train, y_train)
+    np.testing.assert_array_equal(brute.predict(X_test), pruned.predict(X_test))
@@ -142,28 +142,28 @@ class ContinuousIntervalTree(BaseEstimator):
 
         le = preprocessing.LabelEncoder()
         y = le.fit_transform(y)
+        X = X.astype(np.float64)
 
         rng = check_random_state(self.random_state)
-        self._root = _TreeNode(random_state=rng)
 
         thresholds = np.linspace(np.min(X, axis=0), np.max(X, axis=0), self.thresholds)
-
-        distribution = np.zeros(self.n_classes_)
-        for i in range(len(y)):
-            distribution[y[i]] += 1
-
-        entropy = _entropy(distribution, distribution.sum())
-
-        self._root.build_tree(
+        # the cases sorted by each attribute, missing values last
+        order = np.ascontiguousarray(np.argsort(X, axis=0, kind="stable").T)
+
+        (
+            self._feature,
+            self._threshold,
+            self._gain,
+            self._children,
+            self._leaf_distribution,
+        ) = _build_tree(
             X,
             y,
+            order,
             thresholds,
-            entropy,
-            distribution,
-            0,
-            self.max_depth,
             self.n_classes_,
-            False,
+            self.max_depth,
+            rng.randint(np.iinfo(np.int32).max),
         )
 
         self._is_fitted = True
@@ -223,281 +223,347 @@ class ContinuousIntervalTree(BaseEstimator):
             )
         X = self._validate_data(X=X, reset=False, force_all_finite="allow-nan")
 
-        dists = np.zeros((X.shape[0], self.n_classes_))
-        for i in range(X.shape[0]):
-            dists[i] = self._root.predict_proba(X[i], self.n_classes_)
-        return dists
+        return _predict_proba(
+            X.astype(np.float64),
+            self._feature,
+            self._threshold,
+            self._children,
+            self._leaf_distribution,
+        )
 
     def tree_node_splits_and_gain(self):
-        """Recursively find the split and information gain for each tree node."""
+        """Find the split and information gain for each tree node, depth first."""
         splits = []
         gains = []
 
-        if self._root.best_split > -1:
-            self._find_splits_gain(self._root, splits, gains)
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if self._feature[node] > -1:
+                splits.append(int(self._feature[node]))
+                gains.append(self._gain[node])
+                stack.extend(self._children[node, ::-1])
 
         return splits, gains
 
-    def _find_splits_gain(self, node, splits, gains):
-        """Recursively find the split and information gain for each tree node."""
-        splits.append(node.best_split)
-        gains.append(node.best_gain)
-
-        for next_node in node.children:
-            if next_node.best_split > -1:
-                self._find_splits_gain(next_node, splits, gains)
-
-
-class _TreeNode:
-    """ContinuousIntervalTree tree node."""
-
-    def __init__(
-        self,
-        random_state=None,
-    ):
-        self.random_state = random_state
-
-        self.best_split = -1
-        self.best_threshold = 0
-        self.best_gain = 0.000001
-        self.best_margin = -1
-        self.children = []
-        self.leaf_distribution = []
-        self.depth = -1
-
-    def build_tree(
-        self,
-        X,
-        y,
-        thresholds,
-        entropy,
-        distribution,
-        depth,
-        max_depth,
-        n_classes,
-        leaf,
-    ):
-        self.depth = depth
-        best_distributions = []
-        best_entropies = []
-
-        if leaf is False and self.remaining_classes(distribution) and depth < max_depth:
-            for (_, att), threshold in np.ndenumerate(thresholds):
-                (
-                    info_gain,
-                    distributions,
-                    entropies,
-                ) = self.information_gain(X, y, att, threshold, entropy, n_classes)
-
-                if info_gain > self.best_gain:
-                    self.best_split = att
-                    self.best_threshold = threshold
-                    self.best_gain = info_gain
-                    self.best_margin = -1
-                    best_distributions = distributions
-                    best_entropies = entropies
-                elif info_gain == self.best_gain and info_gain > 0.000001:
-                    margin = self.margin_gain(X, att, threshold)
-                    if self.best_margin == -1:
-                        self.best_margin = self.margin_gain(
-                            X, self.best_split, self.best_threshold
-                        )
-
-                    if margin > self.best_margin or (
-                        margin == self.best_margin
-                        and self.random_state.choice([True, False])
-                    ):
-                        self.best_split = att
-                        self.best_threshold = threshold
-                        self.best_margin = margin
-                        best_distributions = distributions
-                        best_entropies = entropies
-
-        if self.best_split > -1:
-            self.children = [None, None, None]
-
-            left_idx, right_idx, missing_idx = self.split_data(
-                X, self.best_split, self.best_threshold
-            )
 
-            if len(left_idx) > 0:
-                self.children[0] = _TreeNode(random_state=self.random_state)
-                self.children[0].build_tree(
-                    X[left_idx],
-                    y[left_idx],
-                    thresholds,
-                    best_entropies[0],
-                    best_distributions[0],
-                    depth + 1,
-                    max_depth,
-                    n_classes,
-                    False,
-                )
-            else:
-                self.children[0] = _TreeNode(random_state=self.random_state)
-                self.children[0].build_tree(
-                    X,
-                    y,
-                    thresholds,
-                    entropy,
-                    distribution,
-                    depth + 1,
-                    max_depth,
-                    n_classes,
-                    True,
-                )
+@njit(cache=True)
+def _build_tree(X, y, order, thresholds, n_classes, max_depth, seed):
+    """Build the tree depth first into flat node arrays.
 
-            if len(right_idx) > 0:
-                self.children[1] = _TreeNode(random_state=self.random_state)
-                self.children[1].build_tree(
-                    X[right_idx],
-                    y[right_idx],
-                    thresholds,
-                    best_entropies[1],
-                    best_distributions[1],
-                    depth + 1,
-                    max_depth,
-                    n_classes,
-                    False,
-                )
-            else:
-                self.children[1] = _TreeNode(random_state=self.random_state)
-                self.children[1].build_tree(
+    Each node owns a segment of the columns of ``order``, which hold the node cases
+    sorted by each attribute. All thresholds of an attribute are then evaluated in a
+    single sweep over its sorted values, and a split partitions every column stably so
+    that the child segments stay sorted.
+    """
+    np.random.seed(seed)
+    n_cases, n_atts = X.shape
+    n_thresholds = thresholds.shape[0]
+
+    capacity = 64
+    feature = np.full(capacity, -1, dtype=np.int_)
+    threshold = np.zeros(capacity)
+    gain = np.zeros(capacity)
+    children = np.full((capacity, 3), -1, dtype=np.int_)
+    leaf_distribution = np.zeros((capacity, n_classes))
+    node_start = np.zeros(capacity, dtype=np.int_)
+    node_end = np.zeros(capacity, dtype=np.int_)
+    node_depth = np.zeros(capacity, dtype=np.int_)
+    node_entropy = np.zeros(capacity)
+    node_distribution = np.zeros((capacity, n_classes))
+
+    distribution = np.zeros(n_classes)
+    for i in range(n_cases):
+        distribution[y[i]] += 1
+    node_end[0] = n_cases
+    node_entropy[0] = _entropy(distribution, distribution.sum())
+    node_distribution[0] = distribution
+    n_nodes = 1
+
+    gains = np.zeros((n_thresholds, n_atts))
+    positions = np.zeros((n_thresholds, n_atts), dtype=np.int_)
+    valid_ends = np.zeros(n_atts, dtype=np.int_)
+    dist_left = np.zeros(n_classes)
+    dist_right = np.zeros(n_classes)
+    dist_missing = np.zeros(n_classes)
+    side = np.zeros(n_cases, dtype=np.int8)
+    buffer = np.zeros(n_cases, dtype=np.int_)
+
+    # every node on the stack owns at least one case and the segments are disjoint
+    stack = np.zeros(n_cases + 1, dtype=np.int_)
+    stack_size = 1
+    while stack_size > 0:
+        stack_size -= 1
+        node = stack[stack_size]
+        start = node_start[node]
+        end = node_end[node]
+        distribution = node_distribution[node]
+        parent_entropy = node_entropy[node]
+
+        best_att = -1
+        best_t = -1
+        best_gain = 0.000001
+        if _remaining_classes(distribution) and node_depth[node] < max_depth:
+            for a in range(n_atts):
+                _attribute_gains(
                     X,
                     y,
-                    thresholds,
-                    entropy,
+                    order[a],
+                    a,
+                    thresholds[:, a],
+                    start,
+                    end,
                     distribution,
-                    depth + 1,
-                    max_depth,
-                    n_classes,
-                    True,
+                    parent_entropy,
+                    gains[:, a],
+                    positions[:, a],
+                    valid_ends,
+                    dist_left,
+                    dist_right,
+                    dist_missing,
                 )
 
-            if len(missing_idx) > 0:
-                self.children[2] = _TreeNode(random_state=self.random_state)
-                self.children[2].build_tree(
-                    X[missing_idx],
-                    y[missing_idx],
-                    thresholds,
-                    best_entropies[2],
-                    best_distributions[2],
-                    depth + 1,
-                    max_depth,
-                    n_classes,
-                    False,
-                )
+            # same evaluation order and tie breaking as the original recursive build,
+            # ties in gain are broken by the margin to the closest case
+            best_margin = -1.0
+            for t in range(n_thresholds):
+                for a in range(n_atts):
+                    if gains[t, a] > best_gain:
+                        best_att = a
+                        best_t = t
+                        best_gain = gains[t, a]
+                        best_margin = -1.0
+                    elif gains[t, a] == best_gain and gains[t, a] > 0.000001:
+                        margin = _margin_gain(
+                            X,
+                            order[a],
+                            a,
+                            thresholds[t, a],
+                            start,
+                            end,
+                            positions[t, a],
+                            valid_ends[a],
+                        )
+                        if best_margin == -1:
+                            best_margin = _margin_gain(
+                                X,
+                                order[best_att],
+                                best_att,
+                                thresholds[best_t, best_att],
+                                start,
+                                end,
+                                positions[best_t, best_att],
+                                valid_ends[best_att],
+                            )
+
+                        if margin > best_margin or (
+                            margin == best_margin and np.random.random() < 0.5
+                        ):
+                            best_att = a
+                            best_t = t
+                            best_margin = margin
+
+        if best_att == -1:
+            leaf_distribution[node] = distribution / np.sum(distribution)
+            continue
+
+        if n_nodes + 3 > capacity:
+            capacity *= 2
+            feature = _resize(feature, capacity, -1)
+            threshold = _resize(threshold, capacity, 0)
+            gain = _resize(gain, capacity, 0)
+            children = _resize(children, capacity, -1)
+            leaf_distribution = _resize(leaf_distribution, capacity, 0)
+            node_start = _resize(node_start, capacity, 0)
+            node_end = _resize(node_end, capacity, 0)
+            node_depth = _resize(node_depth, capacity, 0)
+            node_entropy = _resize(node_entropy, capacity, 0)
+            node_distribution = _resize(node_distribution, capacity, 0)
+            distribution = node_distribution[node]
+
+        best_threshold = thresholds[best_t, best_att]
+        feature[node] = best_att
+        threshold[node] = best_threshold
+        gain[node] = best_gain
+
+        counts = np.zeros(3, dtype=np.int_)
+        split_distributions = np.zeros((3, n_classes))
+        for i in range(start, end):
+            case = order[0, i]
+            if X[case, best_att] <= best_threshold:
+                side[case] = 0
+            elif X[case, best_att] > best_threshold:
+                side[case] = 1
             else:
-                self.children[2] = _TreeNode(random_state=self.random_state)
-                self.children[2].build_tree(
-                    X,
-                    y,
-                    thresholds,
-                    entropy,
-                    distribution,
-                    depth + 1,
-                    max_depth,
-                    n_classes,
-                    True,
+                side[case] = 2
+            counts[side[case]] += 1
+            split_distributions[side[case], y[case]] += 1
+
+        for a in range(n_atts):
+            _partition(order[a], side, start, end, counts, buffer)
+
+        child_start = start
+        for c in range(3):
+            child = n_nodes + c
+            children[node, c] = child
+            node_depth[child] = node_depth[node] + 1
+            if counts[c] > 0:
+                node_start[child] = child_start
+                node_end[child] = child_start + counts[c]
+                node_distribution[child] = split_distributions[c]
+                node_entropy[child] = _entropy(
+                    split_distributions[c], split_distributions[c].sum()
                 )
-        else:
-            self.leaf_distribution = distribution / np.sum(distribution)
-
-        return self
-
-    def predict_proba(self, X, n_classes):
-        if self.best_split > -1:
-            if X[self.best_split] <= self.best_threshold:
-                return self.children[0].predict_proba(X, n_classes)
-            elif X[self.best_split] > self.best_threshold:
-                return self.children[1].predict_proba(X, n_classes)
-            else:
-                return self.children[2].predict_proba(X, n_classes)
-        else:
-            return self.leaf_distribution
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def information_gain(X, y, attribute, threshold, parent_entropy, n_classes):
-        dist_left = np.zeros(n_classes)
-        dist_right = np.zeros(n_classes)
-        dist_missing = np.zeros(n_classes)
-        for i, case in enumerate(X):
-            if case[attribute] <= threshold:
-                dist_left[y[i]] += 1
-            elif case[attribute] > threshold:
-                dist_right[y[i]] += 1
+                child_start += counts[c]
             else:
-                dist_missing[y[i]] += 1
+                # an empty branch predicts the distribution of its parent
+                leaf_distribution[child] = distribution / np.sum(distribution)
+
+        # push the branches in reverse so the left branch is built first
+        for c in range(2, -1, -1):
+            if counts[c] > 0:
+                stack[stack_size] = n_nodes + c
+                stack_size += 1
+        n_nodes += 3
+
+    return (
+        feature[:n_nodes],
+        threshold[:n_nodes],
+        gain[:n_nodes],
+        children[:n_nodes],
+        leaf_distribution[:n_nodes],
+    )
+
+
+@njit(cache=True)
+def _attribute_gains(
+    X,
+    y,
+    order,
+    attribute,
+    thresholds,
+    start,
+    end,
+    distribution,
+    parent_entropy,
+    gains,
+    positions,
+    valid_ends,
+    dist_left,
+    dist_right,
+    dist_missing,
+):
+    # missing values are sorted last and go to the missing branch for all thresholds
+    valid_end = end
+    dist_missing[:] = 0
+    while valid_end > start and np.isnan(X[order[valid_end - 1], attribute]):
+        valid_end -= 1
+        dist_missing[y[order[valid_end]]] += 1
+    valid_ends[attribute] = valid_end
+
+    num_cases = end - start
+    sum_missing = 0
+    for v in dist_missing:
+        sum_missing += v
+    entropy_missing = _entropy(dist_missing, sum_missing)
+
+    dist_left[:] = 0
+    pos = start
+    for t in range(thresholds.shape[0]):
+        threshold = thresholds[t]
+        if np.isnan(threshold):
+            # attributes with missing values in the training set cannot be split on
+            gains[t] = 0
+            positions[t] = start
+            continue
+        if t > 0 and threshold < thresholds[t - 1]:
+            dist_left[:] = 0
+            pos = start
+        while pos < valid_end and X[order[pos], attribute] <= threshold:
+            dist_left[y[order[pos]]] += 1
+            pos += 1
+        positions[t] = pos
 
-        sum_missing = 0
-        for v in dist_missing:
-            sum_missing += v
         sum_left = 0
-        for v in dist_left:
-            sum_left += v
         sum_right = 0
-        for v in dist_right:
-            sum_right += v
+        for c in range(distribution.shape[0]):
+            dist_right[c] = distribution[c] - dist_left[c] - dist_missing[c]
+            sum_left += dist_left[c]
+            sum_right += dist_right[c]
 
         entropy_left = _entropy(dist_left, sum_left)
         entropy_right = _entropy(dist_right, sum_right)
-        entropy_missing = _entropy(dist_missing, sum_missing)
-
-        num_cases = X.shape[0]
-        info_gain = (
+        gains[t] = (
             parent_entropy
             - sum_left / num_cases * entropy_left
             - sum_right / num_cases * entropy_right
             - sum_missing / num_cases * entropy_missing
         )
 
-        return (
-            info_gain,
-            [dist_left, dist_right, dist_missing],
-            [entropy_left, entropy_right, entropy_missing],
-        )
 
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def margin_gain(X, attribute, threshold):
-        margins = np.abs(X[:, attribute] - threshold)
-        return np.min(margins)
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def split_data(X, best_split, best_threshold):
-        left_idx = np.zeros(len(X), dtype=np.int_)
-        left_count = 0
-        right_idx = np.zeros(len(X), dtype=np.int_)
-        right_count = 0
-        missing_idx = np.zeros(len(X), dtype=np.int_)
-        missing_count = 0
-        for i, case in enumerate(X):
-            if case[best_split] <= best_threshold:
-                left_idx[left_count] = i
-                left_count += 1
-            elif case[best_split] > best_threshold:
-                right_idx[right_count] = i
-                right_count += 1
+@njit(cache=True)
+def _margin_gain(X, order, attribute, threshold, start, end, position, valid_end):
+    # the closest cases to the threshold are either side of its sorted position
+    if valid_end < end:
+        return np.nan
+    margin = np.inf
+    if position > start:
+        margin = threshold - X[order[position - 1], attribute]
+    if position < end:
+        margin = min(margin, X[order[position], attribute] - threshold)
+    return margin
+
+
+@njit(cache=True)
+def _partition(order, side, start, end, counts, buffer):
+    left = start
+    right = start + counts[0]
+    missing = right + counts[1]
+    for i in range(start, end):
+        case = order[i]
+        if side[case] == 0:
+            buffer[left] = case
+            left += 1
+        elif side[case] == 1:
+            buffer[right] = case
+            right += 1
+        else:
+            buffer[missing] = case
+            missing += 1
+    order[start:end] = buffer[start:end]
+
+
+@njit(cache=True)
+def _resize(a, capacity, fill):
+    shape = (capacity,) + a.shape[1:]
+    resized = np.full(shape, fill, dtype=a.dtype)
+    resized[: a.shape[0]] = a
+    return resized
+
+
+@njit(cache=True)
+def _predict_proba(X, feature, threshold, children, leaf_distribution):
+    dists = np.zeros((X.shape[0], leaf_distribution.shape[1]))
+    for i in range(X.shape[0]):
+        node = 0
+        while feature[node] > -1:
+            if X[i, feature[node]] <= threshold[node]:
+                node = children[node, 0]
+            elif X[i, feature[node]] > threshold[node]:
+                node = children[node, 1]
             else:
-                missing_idx[missing_count] = i
-                missing_count += 1
-
-        return (
-            left_idx[:left_count],
-            right_idx[:right_count],
-            missing_idx[:missing_count],
-        )
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def remaining_classes(distribution):
-        remaining_classes = 0
-        for d in distribution:
-            if d > 0:
-                remaining_classes += 1
-        return remaining_classes > 1
+                node = children[node, 2]
+        dists[i] = leaf_distribution[node]
+    return dists
+
+
+@njit(cache=True)
+def _remaining_classes(distribution):
+    remaining_classes = 0
+    for d in distribution:
+        if d > 0:
+            remaining_classes += 1
+    return remaining_classes > 1
 
 
 @njit(fastmath=True, cache=True)
@@ -3,7 +3,6 @@ import numpy as np
 import pytest
 
 from aeon.classification.sklearn import ContinuousIntervalTree
-from aeon.classification.sklearn._continuous_interval_tree import _TreeNode
 from aeon.exceptions import NotFittedError
 from aeon.utils._testing.collection import make_2d_test_data, make_3d_test_data
 
@@ -21,9 +20,10 @@ def test_predict_proba():
     X, y = make_2d_test_data(n_cases=5)
     cit = ContinuousIntervalTree(max_depth=1)
     cit.fit(X, y)
-    node = cit._root
-    assert isinstance(node, _TreeNode)
-    assert len(node.children[0].children) == 0
+    # a single split with three leaf children
+    assert cit._feature[0] > -1
+    assert np.all(cit._feature[cit._children[0]] == -1)
+    assert cit._children.shape == (4, 3)
     X, y = make_3d_test_data(n_channels=3)
     with pytest.raises(
         ValueError, match="ContinuousIntervalTree is not a time series classifier"
@@ -31,6 +31,19 @@ def test_predict_proba():
         cit.fit(X, y)
 
 
+def test_tree_node_splits_and_gain():
+    """Test the splits and gains are returned for every split node, depth first."""
+    X, y = make_2d_test_data(n_cases=20, n_labels=3)
+    cit = ContinuousIntervalTree(random_state=0)
+    cit.fit(X, y)
+    splits, gains = cit.tree_node_splits_and_gain()
+    split_nodes = np.flatnonzero(cit._feature > -1)
+    assert splits[0] == cit._feature[0]
+    assert sorted(splits) == sorted(cit._feature[split_nodes])
+    assert np.all(np.array(gains) > 0)
+    assert np.allclose(cit.predict_proba(X).sum(axis=1), 1)
+
+
 def test_nan_values():
     """Test that ContinuousIntervalTree can handle NaN values."""
     rng = np.random.RandomState(0)
@@ -12,6 +12,10 @@ from aeon.clustering.averaging._barycenter_averaging import VALID_BA_METRICS
 from aeon.clustering.base import BaseClusterer
 from aeon.distances import pairwise_distance
 
+# Distances satisfying the triangle inequality, for which the bounds used by the
+# elkan algorithm are valid.
+TRIANGLE_INEQUALITY_DISTANCES = ["euclidean", "erp", "twe", "msm"]
+
 
 class EmptyClusterError(Exception):
     """Error raised when an empty cluster is encountered."""
@@ -92,6 +96,18 @@ class TimeSeriesKMeans(BaseClusterer):
         wanted to specify a window for DTW you would pass
         distance_params={"window": 0.2}. See documentation of aeon.distances for more
         details.
+    algorithm : str, default='lloyds'
+        K-means algorithm to use. Any of the following are valid: ['lloyds', 'elkan'].
+        Lloyds computes the distance between every time series and every centre at
+        each iteration. Elkan [6]_ gives the same clustering but keeps an upper bound
+        on the distance of each time series to its centre and lower bounds on its
+        distances to the other centres, and skips the distances that cannot change
+        the assignment. This greatly reduces the number of distance computations,
+        which dominate the cost with elastic distances. The bounds rely on the
+        triangle inequality, so 'elkan' only supports the distances 'euclidean',
+        'erp', 'twe' and 'msm' without a 'window' or 'itakura_max_slope' in
+        distance_params, since a bounding band breaks the triangle inequality.
+        Callable distances are not supported by 'elkan'.
 
     Attributes
     ----------
@@ -132,6 +148,10 @@ class TimeSeriesKMeans(BaseClusterer):
     ..[5] Lloyd, S. P. (1982). Least squares quantization in pcm. IEEE Trans. Inf.
     Theory, 28:129–136.
 
+    .. [6] Elkan, Charles. (2003). Using the triangle inequality to accelerate
+    k-means. In Proceedings of the Twentieth International Conference on Machine
+    Learning (ICML 2003). 147-153.
+
     Examples
     --------
     >>> import numpy as np
@@ -160,6 +180,7 @@ class TimeSeriesKMeans(BaseClusterer):
         averaging_method: Union[str, Callable[[np.ndarray], np.ndarray]] = "ba",
         distance_params: dict = None,
         average_params: dict = None,
+        algorithm: str = "lloyds",
     ):
         self.init_algorithm = init_algorithm
         self.distance = distance
@@ -171,6 +192,7 @@ class TimeSeriesKMeans(BaseClusterer):
         self.distance_params = distance_params
         self.average_params = average_params
         self.averaging_method = averaging_method
+        self.algorithm = algorithm
 
         self.cluster_centers_ = None
         self.labels_ = None
@@ -182,6 +204,7 @@ class TimeSeriesKMeans(BaseClusterer):
         self._fit_method = None
         self._averaging_method = None
         self._average_params = None
+        self._fit_one_init = None
 
         super(TimeSeriesKMeans, self).__init__(n_clusters)
 
@@ -219,7 +242,7 @@ class TimeSeriesKMeans(BaseClusterer):
         self.cluster_centers_ = best_centers
         self.n_iter_ = best_iters
 
-    def _fit_one_init(self, X: np.ndarray) -> tuple:
+    def _lloyds_fit_one_init(self, X: np.ndarray) -> tuple:
         if isinstance(self._init_algorithm, Callable):
             cluster_centres = self._init_algorithm(X)
         else:
@@ -257,6 +280,125 @@ class TimeSeriesKMeans(BaseClusterer):
 
         return prev_labels, cluster_centres, prev_inertia, i + 1
 
+    def _elkan_fit_one_init(self, X: np.ndarray) -> tuple:
+        if isinstance(self._init_algorithm, Callable):
+            cluster_centres = self._init_algorithm(X)
+        else:
+            cluster_centres = self._init_algorithm
+        n_instances = X.shape[0]
+        instance_idxs = np.arange(n_instances)
+
+        # Lower bounds on the distance of each time series to each centre
+        lower_bounds = pairwise_distance(
+            X, cluster_centres, metric=self.distance, **self._distance_params
+        )
+        curr_labels = lower_bounds.argmin(axis=1)
+        # Upper bound on the distance of each time series to its centre
+        upper_bounds = lower_bounds[instance_idxs, curr_labels]
+        prev_inertia = np.inf
+        prev_labels = None
+        for i in range(self.max_iter):
+            if i > 0:
+                curr_labels = self._elkan_assign(
+                    X, cluster_centres, curr_labels, upper_bounds, lower_bounds
+                )
+            curr_inertia = upper_bounds.sum()
+
+            if np.unique(curr_labels).size < self.n_clusters:
+                raise EmptyClusterError
+
+            if self.verbose:
+                print("%.3f" % curr_inertia, end=" --> ")  # noqa: T001, T201
+
+            change_in_centres = np.abs(prev_inertia - curr_inertia)
+            prev_inertia = curr_inertia
+            prev_labels = curr_labels
+
+            if change_in_centres < self.tol:
+                break
+
+            # Compute new cluster centres
+            prev_centres = cluster_centres.copy()
+            for j in range(self.n_clusters):
+                cluster_centres[j] = self._averaging_method(
+                    X[curr_labels == j], **self._average_params
+                )
+
+            # Move the bounds by how much each centre moved
+            centre_shifts = np.array(
+                [
+                    pairwise_distance(
+                        prev_centres[j : j + 1],
+                        cluster_centres[j : j + 1],
+                        metric=self.distance,
+                        **self._distance_params,
+                    )[0, 0]
+                    for j in range(self.n_clusters)
+                ]
+            )
+            lower_bounds = np.maximum(lower_bounds - centre_shifts, 0)
+            upper_bounds = upper_bounds + centre_shifts[curr_labels]
+
+            if self.verbose is True:
+                print(f"Iteration {i}, inertia {prev_inertia}.")  # noqa: T001, T201
+
+        return prev_labels, cluster_centres, prev_inertia, i + 1
+
+    def _elkan_assign(
+        self,
+        X: np.ndarray,
+        cluster_centres: np.ndarray,
+        labels: np.ndarray,
+        upper_bounds: np.ndarray,
+        lower_bounds: np.ndarray,
+    ) -> np.ndarray:
+        """Assign each time series to its closest centre, updating bounds inplace.
+
+        On return, upper_bounds holds the exact distance of each time series to its
+        centre, so that the inertia is exact.
+        """
+        labels = labels.copy()
+        centres_pw = pairwise_distance(
+            cluster_centres, metric=self.distance, **self._distance_params
+        )
+        np.fill_diagonal(centres_pw, np.inf)
+        half_closest_centre = centres_pw.min(axis=1) / 2
+
+        # Tighten the upper bounds, computing the distances to the current centres
+        for j in range(self.n_clusters):
+            idxs = np.flatnonzero(labels == j)
+            upper_bounds[idxs] = pairwise_distance(
+                X[idxs],
+                cluster_centres[j : j + 1],
+                metric=self.distance,
+                **self._distance_params,
+            )[:, 0]
+        lower_bounds[np.arange(X.shape[0]), labels] = upper_bounds
+
+        # Time series closer to their centre than half the distance to any other
+        # centre cannot change cluster.
+        candidates = np.flatnonzero(upper_bounds > half_closest_centre[labels])
+        for j in range(self.n_clusters):
+            # Time series for which centre j may be closer than their current centre
+            idxs = candidates[
+                (labels[candidates] != j)
+                & (upper_bounds[candidates] > lower_bounds[candidates, j])
+                & (upper_bounds[candidates] > centres_pw[labels[candidates], j] / 2)
+            ]
+            if len(idxs) == 0:
+                continue
+            distances = pairwise_distance(
+                X[idxs],
+                cluster_centres[j : j + 1],
+                metric=self.distance,
+                **self._distance_params,
+            )[:, 0]
+            lower_bounds[idxs, j] = distances
+            closer = distances < upper_bounds[idxs]
+            labels[idxs[closer]] = j
+            upper_bounds[idxs[closer]] = distances[closer]
+        return labels
+
     def _score(self, X, y=None):
         return -self.inertia_
 
@@ -318,6 +460,31 @@ class TimeSeriesKMeans(BaseClusterer):
 
         self._averaging_method = _resolve_average_callable(self.averaging_method)
 
+        if self.algorithm == "lloyds":
+            self._fit_one_init = self._lloyds_fit_one_init
+        elif self.algorithm == "elkan":
+            if (
+                not isinstance(self.distance, str)
+                or self.distance not in TRIANGLE_INEQUALITY_DISTANCES
+            ):
+                raise ValueError(
+                    f"The elkan algorithm requires a distance satisfying the triangle "
+                    f"inequality, one of {TRIANGLE_INEQUALITY_DISTANCES}, but got "
+                    f"{self.distance}. Use algorithm='lloyds' instead."
+                )
+            if (
+                self._distance_params.get("window") is not None
+                or self._distance_params.get("itakura_max_slope") is not None
+            ):
+                raise ValueError(
+                    "The elkan algorithm requires a distance satisfying the triangle "
+                    "inequality, which a window or itakura_max_slope bounding "
+                    "breaks. Use algorithm='lloyds' instead."
+                )
+            self._fit_one_init = self._elkan_fit_one_init
+        else:
+            raise ValueError(f"algorithm {self.algorithm} is not supported")
+
         if self.n_clusters > X.shape[0]:
             raise ValueError(
                 f"n_clusters ({self.n_clusters}) cannot be larger than "
@@ -365,10 +532,19 @@ class TimeSeriesKMeans(BaseClusterer):
             `MyClass(**params)` or `MyClass(**params[i])` creates a valid test instance.
             `create_test_instance` uses the first (or only) dictionary in `params`
         """
-        return {
+        params1 = {
+            "n_clusters": 2,
+            "distance": "euclidean",
+            "n_init": 1,
+            "max_iter": 10,
+            "random_state": 0,
+        }
+        params2 = {
             "n_clusters": 2,
             "distance": "euclidean",
             "n_init": 1,
             "max_iter": 10,
             "random_state": 0,
+            "algorithm": "elkan",
         }
+        return [params1, params2]
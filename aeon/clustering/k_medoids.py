@@ -5,6 +5,7 @@ import warnings
 from typing import Callable, Tuple, Union
 
 import numpy as np
+from numba import njit
 from numpy.random import RandomState
 from sklearn.exceptions import ConvergenceWarning
 from sklearn.utils import check_random_state
@@ -224,32 +225,45 @@ class TimeSeriesKMedoids(BaseClusterer):
             new_center_indexes.append(self._compute_medoids(X, curr_indexes))
         return np.array(new_center_indexes)
 
-    def _compute_distance(self, X: np.ndarray, first_index: int, second_index: int):
-        # Check cache
-        if np.isfinite(self._distance_cache[first_index, second_index]):
-            return self._distance_cache[first_index, second_index]
-        if np.isfinite(self._distance_cache[second_index, first_index]):
-            return self._distance_cache[second_index, first_index]
-        dist = self._distance_callable(
-            X[first_index], X[second_index], **self._distance_params
-        )
-        # Update cache
-        self._distance_cache[first_index, second_index] = dist
-        self._distance_cache[second_index, first_index] = dist
-        return dist
-
     def _compute_pairwise(
         self, X: np.ndarray, first_indexes: np.ndarray, second_indexes: np.ndarray
     ):
-        x_size = len(first_indexes)
-        y_size = len(second_indexes)
-        distance_matrix = np.zeros((x_size, y_size))
-        for i in range(x_size):
-            curr_i_index = first_indexes[i]
-            for j in range(y_size):
-                distance_matrix[i, j] = self._compute_distance(
-                    X, curr_i_index, second_indexes[j]
-                )
+        first_indexes = np.asarray(first_indexes, dtype=int)
+        second_indexes = np.asarray(second_indexes, dtype=int)
+        distance_matrix = self._distance_cache[np.ix_(first_indexes, second_indexes)]
+        missing = ~np.isfinite(distance_matrix)
+        if missing.any():
+            # Compute the missing distances one row at a time and keep them in the
+            # cache in both directions, so that each pair is computed at most once
+            # and the distances between medoids and instances are reused across
+            # iterations and initialisations.
+            for i in np.flatnonzero(missing.any(axis=1)):
+                first_index = first_indexes[i]
+                cols = second_indexes[
+                    ~np.isfinite(self._distance_cache[first_index])[second_indexes]
+                ]
+                if len(cols) == 0:
+                    continue
+                cols = np.unique(cols)
+                if isinstance(self.distance, str):
+                    distances = pairwise_distance(
+                        X[first_index : first_index + 1],
+                        X[cols],
+                        metric=self.distance,
+                        **self._distance_params,
+                    )[0]
+                else:
+                    distances = pairwise_distance(
+                        X[first_index : first_index + 1],
+                        X[cols],
+                        self._distance_callable,
+                        **self._distance_params,
+                    )[0]
+                self._distance_cache[first_index, cols] = distances
+                self._distance_cache[cols, first_index] = distances
+            distance_matrix = self._distance_cache[
+                np.ix_(first_indexes, second_indexes)
+            ]
         return distance_matrix
 
     def _compute_medoids(self, X: np.ndarray, indexes: np.ndarray):
@@ -287,6 +301,7 @@ class TimeSeriesKMedoids(BaseClusterer):
             if best_cost_change is not None and best_cost_change[2] < 0:
                 first, second, _ = best_cost_change
                 medoids_idxs[medoids_idxs == first] = second
+                not_medoid_idxs[not_medoid_idxs == second] = first
                 distance_closest_medoid, distance_second_closest_medoid = np.sort(
                     distance_matrix[medoids_idxs], axis=0
                 )[[0, 1]]
@@ -329,52 +344,15 @@ class TimeSeriesKMedoids(BaseClusterer):
         distance_closest_medoid: np.ndarray,
         distance_second_closest_medoid: np.ndarray,
     ):
-        best_cost_change = (1, 1, 0.0)
-        sample_size = len(distance_matrix)
-        not_medoid_shape = sample_size - self.n_clusters
-
-        for i in range(not_medoid_shape):
-            id_i = not_medoid_idxs[i]
-            for j in range(self.n_clusters):
-                id_j = medoids_idxs[j]
-                cost_change = 0.0
-                for k in range(not_medoid_shape):
-                    id_k = not_medoid_idxs[k]
-                    cluster_i_bool = (
-                        distance_matrix[id_j, id_k] == distance_closest_medoid[id_k]
-                    )
-
-                    if (
-                        cluster_i_bool
-                        and distance_matrix[id_i, id_k]
-                        < distance_second_closest_medoid[id_k]
-                    ):
-                        cost_change += (
-                            distance_matrix[id_k, id_i] - distance_closest_medoid[id_k]
-                        )
-                    elif (
-                        cluster_i_bool
-                        and distance_matrix[id_i, id_k]
-                        >= distance_second_closest_medoid[id_k]
-                    ):
-                        cost_change += (
-                            distance_second_closest_medoid[id_k]
-                            - distance_closest_medoid[id_k]
-                        )
-                    elif distance_matrix[id_j, id_k] != distance_closest_medoid[
-                        id_k
-                    ] and (distance_matrix[id_k, id_i] < distance_closest_medoid[id_k]):
-                        cost_change += (
-                            distance_matrix[id_k, id_i] - distance_closest_medoid[id_k]
-                        )
-
-                if distance_matrix[id_i, id_j] < distance_second_closest_medoid[id_j]:
-                    cost_change += distance_matrix[id_j, id_i]
-                else:
-                    cost_change += distance_second_closest_medoid[id_j]
-
-                if cost_change < best_cost_change[2]:
-                    best_cost_change = (id_j, id_i, cost_change)
+        nearest_medoid = distance_matrix[medoids_idxs].argmin(axis=0)
+        best_cost_change = _fastpam1_best_swap(
+            distance_matrix,
+            medoids_idxs,
+            not_medoid_idxs,
+            nearest_medoid,
+            distance_closest_medoid,
+            distance_second_closest_medoid,
+        )
         if best_cost_change[2] < 0:
             return best_cost_change
         else:
@@ -500,36 +478,7 @@ class TimeSeriesKMedoids(BaseClusterer):
         X_index = np.arange(n_instances, dtype=int)
         distance_matrix = self._compute_pairwise(X, X_index, X_index)
 
-        medoid_idxs = np.zeros(self.n_clusters, dtype=int)
-        not_medoid_idxs = np.arange(n_instances, dtype=int)
-
-        medoid_idxs[0] = np.argmin(np.sum(distance_matrix, axis=1))
-        not_medoid_idxs = np.delete(not_medoid_idxs, medoid_idxs[0])
-
-        n_medoids_current = 1
-        Dj = distance_matrix[medoid_idxs[0]].copy()
-        new_medoid = (0, 0)
-
-        for _ in range(self.n_clusters - 1):
-            cost_change_max = 0
-            for i in range(n_instances - n_medoids_current):
-                id_i = not_medoid_idxs[i]
-                cost_change = 0
-                for j in range(n_instances - n_medoids_current):
-                    id_j = not_medoid_idxs[j]
-                    cost_change += max(0, Dj[id_j] - distance_matrix[id_i, id_j])
-                if cost_change >= cost_change_max:
-                    cost_change_max = cost_change
-                    new_medoid = (id_i, i)
-
-            medoid_idxs[n_medoids_current] = new_medoid[0]
-            n_medoids_current += 1
-            not_medoid_idxs = np.delete(not_medoid_idxs, new_medoid[1])
-
-            for id_j in range(n_instances):
-                Dj[id_j] = min(Dj[id_j], distance_matrix[id_j, new_medoid[0]])
-
-        return np.array(medoid_idxs)
+        return _pam_build(distance_matrix, self.n_clusters)
 
     @classmethod
     def get_test_params(cls, parameter_set="default"):
@@ -561,3 +510,81 @@ class TimeSeriesKMedoids(BaseClusterer):
             "random_state": 1,
             "method": "alternate",
         }
+
+
+@njit(cache=True, fastmath=True)
+def _fastpam1_best_swap(
+    distance_matrix: np.ndarray,
+    medoids_idxs: np.ndarray,
+    not_medoid_idxs: np.ndarray,
+    nearest_medoid: np.ndarray,
+    distance_closest_medoid: np.ndarray,
+    distance_second_closest_medoid: np.ndarray,
+):
+    # FastPAM1: the change in cost of swapping a candidate with each of the medoids
+    # is computed in a single pass over the instances, as only the removal of the
+    # nearest medoid of an instance depends on which medoid is swapped.
+    n_instances = distance_matrix.shape[0]
+    n_clusters = medoids_idxs.shape[0]
+    best_medoid = 1
+    best_candidate = 1
+    best_cost_change = 0.0
+    cost_changes = np.zeros(n_clusters)
+
+    for id_i in not_medoid_idxs:
+        cost_changes[:] = 0.0
+        # Change in cost shared by all the medoids, from the instances which would be
+        # closer to the candidate than to their nearest medoid.
+        shared_cost_change = 0.0
+        for id_k in range(n_instances):
+            distance_to_candidate = distance_matrix[id_k, id_i]
+            if distance_to_candidate < distance_closest_medoid[id_k]:
+                shared_cost_change += (
+                    distance_to_candidate - distance_closest_medoid[id_k]
+                )
+            else:
+                cost_changes[nearest_medoid[id_k]] += (
+                    min(distance_to_candidate, distance_second_closest_medoid[id_k])
+                    - distance_closest_medoid[id_k]
+                )
+
+        for j in range(n_clusters):
+            cost_change = cost_changes[j] + shared_cost_change
+            if cost_change < best_cost_change:
+                best_medoid = medoids_idxs[j]
+                best_candidate = id_i
+                best_cost_change = cost_change
+
+    return best_medoid, best_candidate, best_cost_change
+
+
+@njit(cache=True, fastmath=True)
+def _pam_build(distance_matrix: np.ndarray, n_clusters: int) -> np.ndarray:
+    n_instances = distance_matrix.shape[0]
+    medoid_idxs = np.zeros(n_clusters, dtype=np.int64)
+    is_medoid = np.zeros(n_instances, dtype=np.bool_)
+
+    medoid_idxs[0] = np.argmin(distance_matrix.sum(axis=1))
+    is_medoid[medoid_idxs[0]] = True
+    Dj = distance_matrix[medoid_idxs[0]].copy()
+
+    for n_medoids_current in range(1, n_clusters):
+        cost_change_max = 0.0
+        new_medoid = 0
+        for id_i in range(n_instances):
+            if is_medoid[id_i]:
+                continue
+            cost_change = 0.0
+            for id_j in range(n_instances):
+                if not is_medoid[id_j]:
+                    cost_change += max(0.0, Dj[id_j] - distance_matrix[id_i, id_j])
+            if cost_change >= cost_change_max:
+                cost_change_max = cost_change
+                new_medoid = id_i
+
+        medoid_idxs[n_medoids_current] = new_medoid
+        is_medoid[new_medoid] = True
+        for id_j in range(n_instances):
+            Dj[id_j] = min(Dj[id_j], distance_matrix[id_j, new_medoid])
+
+    return medoid_idxs
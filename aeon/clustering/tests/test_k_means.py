@@ -314,3 +314,42 @@ def test_custom_distance_params():
         data, distance="msm", distance_params={"window": 0.2}
     )
     assert not np.array_equal(default_dist, custom_params_dist)
+
+
+@pytest.mark.parametrize("distance", ["euclidean", "msm"])
+def test_elkan(distance):
+    """Test elkan gives the same clustering as lloyds."""
+    X_train, _ = load_gunpoint(split="train")
+    results = []
+    for algorithm in ["lloyds", "elkan"]:
+        kmeans = TimeSeriesKMeans(
+            n_clusters=4,
+            distance=distance,
+            averaging_method="mean",
+            n_init=2,
+            max_iter=10,
+            random_state=1,
+            algorithm=algorithm,
+        )
+        kmeans.fit(X_train)
+        results.append(kmeans)
+    assert np.array_equal(results[0].labels_, results[1].labels_)
+    assert np.isclose(results[0].inertia_, results[1].inertia_)
+    assert results[0].n_iter_ == results[1].n_iter_
+
+    with pytest.raises(ValueError, match="triangle inequality"):
+        TimeSeriesKMeans(distance="dtw", algorithm="elkan").fit(X_train)
+    with pytest.raises(ValueError, match="triangle inequality"):
+        TimeSeriesKMeans(
+            distance="msm", distance_params={"window": 0.1}, algorithm="elkan"
+        ).fit(X_train)
+    with pytest.raises(ValueError, match="triangle inequality"):
+        TimeSeriesKMeans(
+            distance="twe",
+            distance_params={"itakura_max_slope": 0.5},
+            algorithm="elkan",
+        ).fit(X_train)
+    with pytest.raises(ValueError, match="triangle inequality"):
+        TimeSeriesKMeans(
+            distance=lambda x, y: np.linalg.norm(x - y), algorithm="elkan"
+        ).fit(X_train)
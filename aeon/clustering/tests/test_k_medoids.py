@@ -3,7 +3,7 @@ import numpy as np
 from sklearn import metrics
 from sklearn.utils import check_random_state
 
-from aeon.clustering.k_medoids import TimeSeriesKMedoids
+from aeon.clustering.k_medoids import TimeSeriesKMedoids, _fastpam1_best_swap
 from aeon.datasets import load_basic_motions, load_gunpoint
 from aeon.distances import euclidean_distance
 
@@ -228,3 +228,33 @@ def test_custom_distance_params():
         data, distance="msm", distance_params={"window": 0.2}
     )
     assert not np.array_equal(default_dist, custom_params_dist)
+
+
+def test_fastpam1_best_swap():
+    """Test the FastPAM1 swap search finds the swap with the lowest cost."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(40, 5))
+    distance_matrix = np.sqrt(((X[:, None] - X[None]) ** 2).sum(axis=-1))
+    medoids_idxs = np.array([3, 17, 25])
+    not_medoid_idxs = np.delete(np.arange(40), medoids_idxs)
+
+    closest, second = np.sort(distance_matrix[medoids_idxs], axis=0)[[0, 1]]
+    swap = _fastpam1_best_swap(
+        distance_matrix,
+        medoids_idxs,
+        not_medoid_idxs,
+        distance_matrix[medoids_idxs].argmin(axis=0),
+        closest,
+        second,
+    )
+
+    inertia = closest.sum()
+    best = (None, None, 0.0)
+    for i in not_medoid_idxs:
+        for j in medoids_idxs:
+            new_medoids = np.where(medoids_idxs == j, i, medoids_idxs)
+            change = distance_matrix[new_medoids].min(axis=0).sum() - inertia
+            if change < best[2]:
+                best = (j, i, change)
+    assert swap[:2] == best[:2]
+    assert np.isclose(swap[2], best[2])
@@ -1,8 +1,10 @@
+import json
 import os
 import re
 import shutil
 import tempfile
 import urllib
+import warnings
 import zipfile
 from datetime import datetime
 from distutils.util import strtobool
@@ -10,6 +12,7 @@ from urllib.request import urlretrieve
 
 import numpy as np
 import pandas as pd
+from numba import njit
 
 from aeon.datasets._dataframe_loaders import DIRNAME, MODULE
 from aeon.datasets.dataset_collections import (
@@ -31,6 +34,13 @@ __all__ = [  # Load functions
 ]
 
 
+# number of lines read at once by _load_data, via a size hint in characters, and
+# initial number of cases allocated for equal length data
+_BLOCK_SIZE = 2**24
+_BLOCK_CASES = 64
+_POWERS_OF_TEN = np.array([10.0**i for i in range(23)])
+
+
 # Return appropriate return_type in case an alias was used
 def _alias_datatype_check(return_type):
     if return_type in ["numpy2d", "numpy2D", "np2d", "np2D"]:
@@ -109,6 +119,10 @@ def _load_data(file, meta_data, replace_missing_vals_with="NaN"):
     this assumes each time series has the same number of channels, but allows unequal
     length series between cases.
 
+    The file is read in blocks of lines. The lines of a block are checked, then all of
+    its values are parsed by a compiled tokenizer, directly into a preallocated 3D
+    array if the series are equal length.
+
     Parameters
     ----------
     file : stream, input file to read data from, assume no comments or header info
@@ -127,70 +141,228 @@ def _load_data(file, meta_data, replace_missing_vals_with="NaN"):
         "equallength", "classlabel", "targetlabel" and "class_values": [],
 
     """
-    data = []
+    labelled = meta_data["classlabel"] or meta_data["targetlabel"]
+    equal_length = meta_data["equallength"]
+    data = None if equal_length else []
     n_cases = 0
     n_channels = 0  # Assumed the same for all
-    current_channels = 0
     series_length = 0
     y_values = []
-    for line in file:
-        line = line.strip().lower()
-        line = line.replace("?", replace_missing_vals_with)
-        channels = line.split(":")
-        n_cases += 1
-        current_channels = len(channels)
-        if meta_data["classlabel"] or meta_data["targetlabel"]:
-            current_channels -= 1
-        if n_cases == 1:  # Find n_channels and length  from first if not unequal
-            n_channels = current_channels
-            if meta_data["equallength"]:
-                series_length = len(channels[0].split(","))
-        else:
-            if current_channels != n_channels:
-                raise IOError(
-                    f"Inconsistent number of dimensions in case {n_cases}. "
-                    f"Expecting {n_channels} but have read {current_channels}"
-                )
-            if meta_data["univariate"]:
-                if current_channels > 1:
+    tokenize = True
+    while True:
+        lines = file.readlines(_BLOCK_SIZE)
+        if not lines:
+            break
+        block_values = []
+        block_lengths = []
+        for line in lines:
+            line = line.strip().lower()
+            if not line:
+                continue
+            line = line.replace("?", replace_missing_vals_with)
+            n_cases += 1
+            if labelled:
+                line, _, label = line.rpartition(":")
+                y_values.append(label)
+            channels = line.split(":")
+            current_channels = len(channels)
+            if n_cases == 1:  # Find n_channels and length  from first if not unequal
+                n_channels = current_channels
+                if equal_length:
+                    series_length = channels[0].count(",") + 1
+            else:
+                if current_channels != n_channels:
                     raise IOError(
-                        f"Seen {current_channels} in case {n_cases}."
-                        f"Expecting univariate from meta data"
+                        f"Inconsistent number of dimensions in case {n_cases}. "
+                        f"Expecting {n_channels} but have read {current_channels}"
                     )
-        if meta_data["equallength"]:
-            current_length = series_length
+                if meta_data["univariate"]:
+                    if current_channels > 1:
+                        raise IOError(
+                            f"Seen {current_channels} in case {n_cases}."
+                            f"Expecting univariate from meta data"
+                        )
+            if equal_length:
+                current_length = series_length
+            else:
+                current_length = channels[0].count(",") + 1
+            for i in range(n_channels):
+                channel_length = channels[i].count(",") + 1
+                if channel_length != current_length:
+                    raise IOError(
+                        f"channel {i} in case {n_cases} has a different number of "
+                        f"observations to the other channels. "
+                        f"Saw {current_length} in the first channel but"
+                        f" {channel_length} in the channel {i}. The meta data "
+                        f"specifies equal length == {equal_length}. But even if "
+                        f"series length are unequal, all channels for a single case "
+                        f"must be the same length"
+                    )
+            block_values.append(line.replace(":", ","))
+            block_lengths.append(current_length)
+
+        if len(block_values) == 0:
+            continue
+        block = ",".join(block_values).encode("utf-8")
+        if equal_length:
+            if data is None:
+                data = np.empty((_BLOCK_CASES, n_channels, series_length))
+            start = n_cases - len(block_values)
+            if n_cases > data.shape[0]:
+                capacity = max(2 * data.shape[0], n_cases)
+                data.resize((capacity, n_channels, series_length), refcheck=False)
+            tokenize = _parse_values(
+                block, data[start:n_cases].reshape(-1), tokenize=tokenize
+            )
         else:
-            current_length = len(channels[0].split(","))
-        np_case = np.zeros(shape=(n_channels, current_length))
-        for i in range(0, n_channels):
-            single_channel = channels[i].strip()
-            data_series = single_channel.split(",")
-            data_series = [float(x) for x in data_series]
-            if len(data_series) != current_length:
-                equal_length = meta_data["equallength"]
-                raise IOError(
-                    f"channel {i} in case {n_cases} has a different number of "
-                    f"observations to the other channels. "
-                    f"Saw {current_length} in the first channel but"
-                    f" {len(data_series)} in the channel {i}. The meta data "
-                    f"specifies equal length == {equal_length}. But even if series "
-                    f"length are unequal, all channels for a single case must be the "
-                    f"same length"
-                )
-            np_case[i] = np.array(data_series)
-        data.append(np_case)
-        if meta_data["classlabel"] or meta_data["targetlabel"]:
-            y_values.append(channels[n_channels])
-    if meta_data["equallength"]:
-        data = np.array(data)
+            values = np.empty(n_channels * sum(block_lengths))
+            tokenize = _parse_values(block, values, tokenize=tokenize)
+            pos = 0
+            for length in block_lengths:
+                n_values = n_channels * length
+                data.append(values[pos : pos + n_values].reshape(n_channels, length))
+                pos += n_values
+
+    if equal_length:
+        if data is None:
+            data = np.array([])
+        else:
+            data.resize((n_cases, n_channels, series_length), refcheck=False)
     return data, np.asarray(y_values), meta_data
 
 
+def _parse_values(block, out, tokenize=True):
+    """Parse comma separated floats in a bytes string into out.
+
+    Values the compiled tokenizer cannot parse exactly, such as "nan" or numbers with
+    more than 15 significant digits, are parsed with float. If there are many of them,
+    e.g., for values written with full double precision, the whole block is parsed
+    with numpy instead. Invalid values raise the ValueError of float.
+
+    Returns
+    -------
+    tokenize : bool
+        Whether the tokenizer parsed most values and should be used for the next block.
+    """
+    n_values = out.shape[0]
+    if not tokenize:
+        parsed = _parse_values_numpy(block)
+        if parsed is not None and parsed.shape[0] == n_values:
+            out[:] = parsed
+            return False
+
+    buffer = np.frombuffer(block, dtype=np.uint8)
+    starts = np.zeros(n_values + 1, dtype=np.int64)
+    fallback = np.zeros(n_values, dtype=np.bool_)
+    n_found = _tokenize_floats(buffer, out, starts, fallback)
+    if n_found != n_values:
+        raise IOError(
+            f"Expected {n_values} values in the data block but found {n_found}."
+        )
+    starts[n_values] = len(block) + 1
+
+    fallback = np.flatnonzero(fallback)
+    if len(fallback) > n_values // 10:
+        parsed = _parse_values_numpy(block)
+        if parsed is not None and parsed.shape[0] == n_values:
+            out[:] = parsed
+            return False
+    for i in fallback:
+        out[i] = float(block[starts[i] : starts[i + 1] - 1].decode("utf-8"))
+    return True
+
+
+def _parse_values_numpy(block):
+    with warnings.catch_warnings():
+        # numpy warns if it cannot parse a string to its end
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return np.fromstring(block, sep=",")
+        except (DeprecationWarning, ValueError):
+            return None
+
+
+@njit(cache=True)
+def _tokenize_floats(buffer, out, starts, fallback):
+    # exact for decimal mantissas up to 2**53 with powers of ten up to 22, as both are
+    # exactly representable and a single multiplication or division is correctly
+    # rounded, other values are flagged for parsing with float
+    n = 0
+    i = 0
+    length = buffer.shape[0]
+    while i <= length:
+        if n == out.shape[0]:
+            return n + 1
+        starts[n] = i
+        while i < length and buffer[i] == 32:  # whitespace
+            i += 1
+        negative = False
+        if i < length and (buffer[i] == 45 or buffer[i] == 43):  # "-" or "+"
+            negative = buffer[i] == 45
+            i += 1
+        mantissa = 0
+        n_digits = 0
+        exponent = 0
+        valid = False
+        while i < length and 48 <= buffer[i] <= 57:
+            if mantissa > 0 or buffer[i] != 48:
+                n_digits += 1
+            mantissa = mantissa * 10 + (buffer[i] - 48) if n_digits <= 18 else mantissa
+            exponent += 1 if n_digits > 18 else 0
+            valid = True
+            i += 1
+        if i < length and buffer[i] == 46:  # "."
+            i += 1
+            while i < length and 48 <= buffer[i] <= 57:
+                if mantissa > 0 or buffer[i] != 48:
+                    n_digits += 1
+                if n_digits <= 18:
+                    mantissa = mantissa * 10 + (buffer[i] - 48)
+                    exponent -= 1
+                valid = True
+                i += 1
+        if valid and i < length and (buffer[i] == 101 or buffer[i] == 69):  # "e"
+            i += 1
+            exp_negative = False
+            if i < length and (buffer[i] == 45 or buffer[i] == 43):
+                exp_negative = buffer[i] == 45
+                i += 1
+            exp_value = 0
+            valid = False
+            while i < length and 48 <= buffer[i] <= 57:
+                if exp_value < 10000:
+                    exp_value = exp_value * 10 + (buffer[i] - 48)
+                valid = True
+                i += 1
+            exponent += -exp_value if exp_negative else exp_value
+        while i < length and buffer[i] == 32:
+            i += 1
+
+        if valid and n_digits <= 15 and -22 <= exponent <= 22:
+            value = float(mantissa)
+            if exponent < 0:
+                value /= _POWERS_OF_TEN[-exponent]
+            else:
+                value *= _POWERS_OF_TEN[exponent]
+            out[n] = -value if negative else value
+        else:
+            fallback[n] = True
+        # skip to the next separator, anything else is left to float
+        while i < length and buffer[i] != 44:  # ","
+            fallback[n] = True
+            i += 1
+        i += 1
+        n += 1
+    return n
+
+
 def load_from_tsfile(
     full_file_path_and_name,
     replace_missing_vals_with="NaN",
     return_meta_data=False,
     return_type="auto",
+    cache=False,
+    mmap_mode=None,
 ):
     """Load time series .ts file into X and (optionally) y.
 
@@ -207,6 +379,22 @@ def load_from_tsfile(
         If "auto", returns numpy3D for equal length and list of numpy2D for unequal.
         If "numpy2D", will squash a univariate equal length into a numpy2D (n_cases,
         n_timepoints). Other options are available but not supported medium term.
+    cache : boolean, default=False
+        If True, the parsed data is stored in a directory of ``.npy`` files next to
+        the ``.ts`` file, named after the file with a ``_cache`` suffix, and later
+        calls load from there instead of parsing the file again. The cache is
+        rebuilt if the size or modification time of the ``.ts`` file changes. If
+        the cache cannot be written, a warning is raised and the data is returned
+        as usual.
+    mmap_mode : None or str{"r", "r+", "c"}, default=None
+        If not None, the time series are loaded from the cache as memory mapped
+        arrays with this mode, see ``np.load``, so that they are only read from disk
+        when accessed. Equal length series are returned as a memory mapped 3D array,
+        unequal length series as a list of views of a memory mapped array. The cache
+        is built first if it does not exist, which requires the series to fit in
+        memory once. Collections larger than memory can be written to the cache
+        layout with ``write_to_tsfile(..., file_format="npy")``, in which case the
+        ``.ts`` file itself does not have to exist.
 
     Returns
     -------
@@ -227,16 +415,47 @@ def load_from_tsfile(
     # Check file ends in .ts, if not, insert
     if not full_file_path_and_name.endswith(".ts"):
         full_file_path_and_name = full_file_path_and_name + ".ts"
-    # Open file
-    with open(full_file_path_and_name, "r", encoding="utf-8") as file:
-        # Read in headers
-        meta_data = _load_header_info(file)
-        # load into list of numpy
-        data, y, meta_data = _load_data(file, meta_data)
+    if mmap_mode not in (None, "r", "r+", "c"):
+        raise ValueError(
+            f"mmap_mode must be None, 'r', 'r+' or 'c', but found {mmap_mode}"
+        )
+    use_cache = cache or mmap_mode is not None
+    cached = None
+    if use_cache:
+        cache_path = _tsfile_cache_path(full_file_path_and_name)
+        # a cache written without a .ts file is always up to date
+        source = None
+        if os.path.exists(full_file_path_and_name):
+            source = _tsfile_source_info(full_file_path_and_name)
+        cached = _load_tsfile_cache(cache_path, source, mmap_mode=mmap_mode)
+    if cached is not None:
+        data, y, meta_data = cached
+    else:
+        # Open file
+        with open(full_file_path_and_name, "r", encoding="utf-8") as file:
+            # Read in headers
+            meta_data = _load_header_info(file)
+            # load into list of numpy
+            data, y, meta_data = _load_data(file, meta_data)
+        if use_cache:
+            try:
+                _save_tsfile_cache(cache_path, data, y, meta_data, source)
+            except OSError as e:
+                if mmap_mode is not None:
+                    raise
+                warnings.warn(
+                    f"Could not write the dataset cache to {cache_path}: {e}",
+                    stacklevel=2,
+                )
+            if mmap_mode is not None:
+                data, y, meta_data = _load_tsfile_cache(
+                    cache_path, source, mmap_mode=mmap_mode
+                )
 
     # if equal load to 3D numpy
     if meta_data["equallength"]:
-        data = np.array(data)
+        if not isinstance(data, np.ndarray):
+            data = np.array(data)
         if return_type == "numpy2D" and meta_data["univariate"]:
             data = data.squeeze()
     # If regression problem, convert y to float
@@ -247,6 +466,114 @@ def load_from_tsfile(
     return data, y
 
 
+def _tsfile_cache_path(full_file_path_and_name):
+    return os.path.splitext(full_file_path_and_name)[0] + "_cache"
+
+
+def _tsfile_source_info(full_file_path_and_name):
+    stat = os.stat(full_file_path_and_name)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _save_tsfile_cache(cache_path, data, y, meta_data, source=None):
+    """Save data loaded from a .ts file as a directory of .npy files.
+
+    Equal length data is stored as a 3D array in ``X.npy``. Unequal length data is
+    stored as the flattened cases concatenated in ``X.npy``, with the
+    ``(n_channels, n_timepoints)`` shape of each case in ``shapes.npy``. The labels
+    are stored in ``y.npy`` and the meta data in ``meta.json``, which is written
+    last so that an interrupted save is not mistaken for a valid cache.
+
+    Parameters
+    ----------
+    cache_path : str
+        The directory to save to, created if it does not exist.
+    data : np.ndarray or list of np.ndarray
+        The time series as returned by ``_load_data``.
+    y : np.ndarray
+        The class labels or target values.
+    meta_data : dict
+        The meta data as returned by ``_load_data``.
+    source : dict or None, default=None
+        Information about the source file used to check that the cache is up to
+        date, see ``_tsfile_source_info``.
+    """
+    os.makedirs(cache_path, exist_ok=True)
+    meta_file = os.path.join(cache_path, "meta.json")
+    if os.path.exists(meta_file):
+        os.remove(meta_file)
+    X_file = os.path.join(cache_path, "X.npy")
+    if isinstance(data, np.ndarray) and data.dtype == np.float64:
+        np.save(X_file, data)
+    else:
+        # cases are copied one at a time so that collections larger than memory,
+        # such as lists of memory mapped arrays, can be saved as float64
+        shapes = np.array([np.shape(x) for x in data], dtype=np.int64).reshape(-1, 2)
+        if meta_data["equallength"]:
+            shape = (len(data),) + (tuple(shapes[0]) if len(data) > 0 else (0, 0))
+        else:
+            shape = (int(np.sum(shapes[:, 0] * shapes[:, 1])),)
+            np.save(os.path.join(cache_path, "shapes.npy"), shapes)
+        X = np.lib.format.open_memmap(X_file, mode="w+", dtype=np.float64, shape=shape)
+        pos = 0
+        for x in data:
+            if meta_data["equallength"]:
+                X[pos] = x
+                pos += 1
+            else:
+                x = np.asarray(x, dtype=np.float64).ravel()
+                X[pos : pos + x.shape[0]] = x
+                pos += x.shape[0]
+        X.flush()
+        del X
+    np.save(os.path.join(cache_path, "y.npy"), np.asarray([] if y is None else y))
+    with open(meta_file, "w", encoding="utf-8") as file:
+        json.dump({"meta_data": meta_data, "source": source}, file)
+
+
+def _load_tsfile_cache(cache_path, source=None, mmap_mode=None):
+    """Load data saved by ``_save_tsfile_cache``.
+
+    Parameters
+    ----------
+    cache_path : str
+        The directory the data was saved to.
+    source : dict or None, default=None
+        Information about the source file. If not None, the cache is only loaded if
+        it was saved with the same information or without a source file.
+    mmap_mode : None or str, default=None
+        If not None, the time series are memory mapped with this mode, see
+        ``np.load``. Unequal length series are returned as views of a single memory
+        mapped array.
+
+    Returns
+    -------
+    data, y, meta_data or None
+        The saved data, or None if there is no complete or up to date cache.
+    """
+    meta_file = os.path.join(cache_path, "meta.json")
+    if not os.path.exists(meta_file):
+        return None
+    with open(meta_file, "r", encoding="utf-8") as file:
+        saved = json.load(file)
+    # data saved without a source file is always up to date
+    if source is not None and saved["source"] not in (None, source):
+        return None
+
+    meta_data = saved["meta_data"]
+    X = np.load(os.path.join(cache_path, "X.npy"), mmap_mode=mmap_mode)
+    y = np.load(os.path.join(cache_path, "y.npy"))
+    if not meta_data["equallength"]:
+        shapes = np.load(os.path.join(cache_path, "shapes.npy"))
+        ends = np.cumsum(shapes[:, 0] * shapes[:, 1])
+        starts = ends - shapes[:, 0] * shapes[:, 1]
+        X = [
+            X[start:end].reshape(shape)
+            for start, end, shape in zip(starts, ends, shapes.tolist())
+        ]
+    return X, y, meta_data
+
+
 def _load_saved_dataset(
     name,
     split=None,
@@ -255,6 +582,8 @@ def _load_saved_dataset(
     local_module=MODULE,
     local_dirname=DIRNAME,
     return_meta=False,
+    cache=False,
+    mmap_mode=None,
 ):
     """Load baked in time series classification datasets (helper function).
 
@@ -278,6 +607,11 @@ def _load_saved_dataset(
         will not necessarily be supported longterm.
     local_module: default = os.path.dirname(__file__),
     local_dirname: default = "data"
+    cache: bool, optional (default=False)
+        Whether to cache the parsed files as ``.npy`` files, see `load_from_tsfile`.
+    mmap_mode: None or str, optional (default=None)
+        Whether to memory map the cached files, see `load_from_tsfile`. If split is
+        None, equal length train and test series are concatenated in memory.
 
     Raises
     ------
@@ -300,17 +634,19 @@ def _load_saved_dataset(
     if split in ("TRAIN", "TEST"):
         fname = name + "_" + split + ".ts"
         abspath = os.path.join(local_module, local_dirname, name, fname)
-        X, y, meta_data = load_from_tsfile(abspath, return_meta_data=True)
+        X, y, meta_data = load_from_tsfile(abspath, return_meta_data=True, cache=cache)
     # if split is None, load both train and test set
     elif split is None:
         fname = name + "_TRAIN.ts"
         abspath = os.path.join(local_module, local_dirname, name, fname)
-        X_train, y_train, meta_data = load_from_tsfile(abspath, return_meta_data=True)
+        X_train, y_train, meta_data = load_from_tsfile(
+            abspath, return_meta_data=True, cache=cache, mmap_mode=mmap_mode
+        )
 
         fname = name + "_TEST.ts"
         abspath = os.path.join(local_module, local_dirname, name, fname)
         X_test, y_test, meta_data_test = load_from_tsfile(
-            abspath, return_meta_data=True
+            abspath, return_meta_data=True, cache=cache, mmap_mode=mmap_mode
         )
         if meta_data["equallength"]:
             X = np.concatenate([X_train, X_test])
@@ -383,7 +719,14 @@ def _download_and_extract(url, extract_path=None):
 
 
 def _load_tsc_dataset(
-    name, split, return_X_y=True, return_type=None, extract_path=None, return_meta=False
+    name,
+    split,
+    return_X_y=True,
+    return_type=None,
+    extract_path=None,
+    return_meta=False,
+    cache=False,
+    mmap_mode=None,
 ):
     """Load time series classification datasets (helper function).
 
@@ -406,6 +749,10 @@ def _load_tsc_dataset(
     extract_path : optional (default = None)
         Path of the location for the data file. If none, data is written to
         os.path.dirname(__file__)/data/
+    cache: bool, optional (default=False)
+        Whether to cache the parsed files as ``.npy`` files, see `load_from_tsfile`.
+    mmap_mode: None or str, optional (default=None)
+        Whether to memory map the cached files, see `load_from_tsfile`.
 
     Raises
     ------
@@ -462,6 +809,8 @@ def _load_tsc_dataset(
         local_module=local_module,
         local_dirname=local_dirname,
         return_meta=return_meta,
+        cache=cache,
+        mmap_mode=mmap_mode,
     )
 
 
@@ -1128,7 +1477,14 @@ def load_forecasting(name, extract_path=None, return_metadata=True):
     return data
 
 
-def load_regression(name, split=None, extract_path=None, return_metadata=True):
+def load_regression(
+    name,
+    split=None,
+    extract_path=None,
+    return_metadata=True,
+    cache=False,
+    mmap_mode=None,
+):
     """Download/load forecasting problem from https://forecastingdata.org/.
 
     Parameters
@@ -1143,6 +1499,13 @@ def load_regression(name, split=None, extract_path=None, return_metadata=True):
         format <name>_TRAIN.ts or <name>_TEST.ts.
     return_metadata : boolean, default = True
         If True, returns a tuple (X, y, metadata)
+    cache : boolean, default = False
+        If True, the parsed data is stored as ``.npy`` files next to the ``.ts``
+        files and loaded from there on later calls, see `load_from_tsfile`.
+    mmap_mode : None or str{"r", "r+", "c"}, default = None
+        If not None, the series are memory mapped from the ``.npy`` files instead of
+        loaded into memory, see `load_from_tsfile`. Load the train and test split
+        separately to keep equal length series memory mapped.
 
     Raises
     ------
@@ -1220,10 +1583,19 @@ def load_regression(name, split=None, extract_path=None, return_metadata=True):
         local_module=local_module,
         local_dirname=local_dirname,
         return_meta=return_metadata,
+        cache=cache,
+        mmap_mode=mmap_mode,
     )
 
 
-def load_classification(name, split=None, extract_path=None, return_metadata=True):
+def load_classification(
+    name,
+    split=None,
+    extract_path=None,
+    return_metadata=True,
+    cache=False,
+    mmap_mode=None,
+):
     """Load a classification dataset.
 
     Loads a TSC dataset from extract_path, or from timeseriesclassification.com,
@@ -1256,6 +1628,13 @@ def load_classification(name, split=None, extract_path=None, return_metadata=Tru
         e.g. C:/Temp/ or relative, e.g. Temp/ or ./Temp/.
     return_metadata : boolean, default = True
         If True, returns a tuple (X, y, metadata)
+    cache : boolean, default = False
+        If True, the parsed data is stored as ``.npy`` files next to the ``.ts``
+        files and loaded from there on later calls, see `load_from_tsfile`.
+    mmap_mode : None or str{"r", "r+", "c"}, default = None
+        If not None, the series are memory mapped from the ``.npy`` files instead of
+        loaded into memory, see `load_from_tsfile`. Load the train and test split
+        separately to keep equal length series memory mapped.
 
     Returns
     -------
@@ -1278,6 +1657,8 @@ def load_classification(name, split=None, extract_path=None, return_metadata=Tru
         return_X_y=True,
         extract_path=extract_path,
         return_meta=return_metadata,
+        cache=cache,
+        mmap_mode=mmap_mode,
     )
 
 
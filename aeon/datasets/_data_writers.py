@@ -4,11 +4,23 @@ import textwrap
 import numpy as np
 import pandas as pd
 
+from aeon.datasets._data_loaders import (
+    _save_tsfile_cache,
+    _tsfile_cache_path,
+    _tsfile_source_info,
+)
+
 __all__ = ["write_to_tsfile", "write_results_to_uea_format"]
 
 
 def write_to_tsfile(
-    X, path, y=None, problem_name="sample_data.ts", header=None, regression=False
+    X,
+    path,
+    y=None,
+    problem_name="sample_data.ts",
+    header=None,
+    regression=False,
+    file_format="ts",
 ):
     """Write an aeon collection of time series to text file in .ts format.
 
@@ -34,7 +46,18 @@ def write_to_tsfile(
     regression: boolean, default = False
         Indicate if this is a regression problem, so it is correcty specified in
         the header since there is no definite way of inferring this from y
+    file_format : str{"ts", "npy", "both"}, default = "ts"
+        The format to write. "npy" writes the collection as ``.npy`` files to the
+        directory <path>/<problem_name>_cache instead of a .ts file, which can be
+        loaded or memory mapped with ``load_from_tsfile(<path>/<problem_name>,
+        mmap_mode="r")``. Series are written one at a time, so X can be a memory
+        mapped array or list of arrays larger than memory. "both" writes both
+        formats. The "npy" format does not support pd.DataFrame input.
     """
+    if file_format not in ("ts", "npy", "both"):
+        raise ValueError(
+            f"file_format must be 'ts', 'npy' or 'both', but found {file_format}"
+        )
     if not (
         isinstance(X, np.ndarray) or isinstance(X, list) or isinstance(X, pd.DataFrame)
     ):
@@ -48,16 +71,28 @@ def write_to_tsfile(
     if split[-1] != "ts":
         problem_name = problem_name + ".ts"
 
-    if isinstance(X, np.ndarray) or isinstance(X, list):
-        _write_data_to_tsfile(X, path, problem_name, y=y, regression=regression)
-    else:
-        _write_dataframe_to_tsfile(
+    if file_format != "npy":
+        if isinstance(X, np.ndarray) or isinstance(X, list):
+            _write_data_to_tsfile(X, path, problem_name, y=y, regression=regression)
+        else:
+            _write_dataframe_to_tsfile(
+                X,
+                path,
+                problem_name=problem_name,
+                y=y,
+                comment=header,
+                regression=regression,
+            )
+    if file_format != "ts":
+        if isinstance(X, pd.DataFrame):
+            raise TypeError("The npy file format does not support pd.DataFrame input")
+        _write_data_to_npy(
             X,
             path,
-            problem_name=problem_name,
+            problem_name,
             y=y,
-            comment=header,
             regression=regression,
+            with_tsfile=file_format == "both",
         )
 
 
@@ -154,6 +189,62 @@ def _write_data_to_tsfile(
     file.close()
 
 
+def _write_data_to_npy(
+    X, path, problem_name, y=None, regression=False, with_tsfile=False
+):
+    """Output a dataset to the .npy layout used to cache .ts files.
+
+    The meta data is the same as when loading the .ts file written by
+    ``_write_data_to_tsfile``, so loading either format gives the same result.
+
+    Parameters
+    ----------
+    X: Union[list, np.ndarray]
+        time series collection, either a 3d ndarray  (n_cases, n_channels,
+        n_timepoints) or a list of [n_cases] 2d numpy arrays (possibly variable
+        length)
+    path: str
+        The directory containing the .ts file the layout belongs to.
+    problem_name: str
+        The name of the .ts file, including the .ts extension.
+    y: list, ndarray or None, default=None
+        The class values or regression targets for each case, optional.
+    regression: boolean, default = False
+        Whether y contains regression targets.
+    with_tsfile: boolean, default = False
+        Whether the .ts file has just been written with the same data. If True, the
+        layout is rebuilt when loading once the .ts file changes, otherwise the
+        layout is used whether the .ts file exists or not.
+    """
+    if y is not None and len(X) != len(y):
+        raise IndexError(
+            "The number of cases in X does not match the number of values in y"
+        )
+    equal_length = isinstance(X, np.ndarray) or all(
+        len(x[0]) == len(X[0][0]) for x in X
+    )
+    meta_data = {
+        "problemname": problem_name.lower(),
+        "timestamps": False,
+        "missing": False,
+        "univariate": len(X[0]) == 1,
+        "equallength": equal_length,
+        "classlabel": y is not None and not regression,
+        "targetlabel": y is not None and regression,
+        "class_values": [],
+    }
+    if y is not None:
+        if regression:
+            y = np.asarray(y, dtype=float)
+        else:
+            meta_data["class_values"] = [str(c).lower() for c in np.unique(y)]
+            y = np.array([str(c).lower() for c in y])
+
+    file = os.path.join(str(path), problem_name)
+    source = _tsfile_source_info(file) if with_tsfile else None
+    _save_tsfile_cache(_tsfile_cache_path(file), X, y, meta_data, source=source)
+
+
 def write_results_to_uea_format(
     estimator_name,
     dataset_name,
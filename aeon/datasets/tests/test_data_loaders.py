@@ -258,6 +258,76 @@ def test_load_from_tsfile():
     assert len(X) == 270 and y.shape == (270,)
 
 
+def test__load_data_values(tmp_path):
+    """Test parsing values that need the fallback of the compiled tokenizer."""
+    path = os.path.join(tmp_path, "Values.ts")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("@problemName Values\n@univariate true\n@equalLength true\n")
+        file.write("@seriesLength 4\n@classLabel true a b\n@data\n")
+        file.write("1.5, -2E3,?,0.1234567890123456789:a\n")
+        file.write("NaN,inf,1e-300,-0.000001:b\n")
+    X, y = load_from_tsfile(path)
+    expected = np.array(
+        [
+            [[1.5, -2e3, np.nan, 0.1234567890123456789]],
+            [[np.nan, np.inf, 1e-300, -0.000001]],
+        ]
+    )
+    np.testing.assert_array_equal(X, expected)
+    np.testing.assert_array_equal(y, ["a", "b"])
+
+    with open(path, "a", encoding="utf-8") as file:
+        file.write("1,2,3,x:a\n")
+    with pytest.raises(ValueError):
+        load_from_tsfile(path)
+
+
+@pytest.mark.parametrize("name", ["BasicMotions", "JapaneseVowels", "Covid3Month"])
+def test_load_from_tsfile_cache(name, tmp_path):
+    """Test that data loaded from the cache is the same as from the .ts file."""
+    path = os.path.join(tmp_path, f"{name}_TRAIN.ts")
+    shutil.copy(os.path.join(MODULE, DIRNAME, name, f"{name}_TRAIN.ts"), path)
+    X, y, meta_data = load_from_tsfile(path, return_meta_data=True)
+
+    cache_path = os.path.join(tmp_path, f"{name}_TRAIN_cache")
+    for _ in range(2):
+        X2, y2, meta_data2 = load_from_tsfile(path, return_meta_data=True, cache=True)
+        assert os.path.exists(os.path.join(cache_path, "meta.json"))
+        assert meta_data2 == meta_data
+        np.testing.assert_array_equal(y2, y)
+        assert y2.dtype == y.dtype
+        if meta_data["equallength"]:
+            np.testing.assert_array_equal(X2, X)
+        else:
+            assert len(X2) == len(X)
+            for x2, x in zip(X2, X):
+                np.testing.assert_array_equal(x2, x)
+
+    # the cache is rebuilt if the file changes
+    with open(path, "r", encoding="utf-8") as file:
+        lines = file.readlines()
+    with open(path, "w", encoding="utf-8") as file:
+        file.writelines(lines[:-1])
+    X2, y2 = load_from_tsfile(path, cache=True)
+    assert len(X2) == len(X) - 1 and len(y2) == len(y) - 1
+
+
+def test_load_from_tsfile_mmap_mode(tmp_path):
+    """Test loading the cache as memory mapped arrays."""
+    path = os.path.join(tmp_path, "BasicMotions_TRAIN.ts")
+    shutil.copy(
+        os.path.join(MODULE, DIRNAME, "BasicMotions", "BasicMotions_TRAIN.ts"), path
+    )
+    X, y = load_from_tsfile(path)
+    for _ in range(2):
+        X2, y2 = load_from_tsfile(path, mmap_mode="r")
+        assert isinstance(X2, np.memmap) and X2.mode == "r"
+        np.testing.assert_array_equal(X2, X)
+        np.testing.assert_array_equal(y2, y)
+    with pytest.raises(ValueError, match="mmap_mode"):
+        load_from_tsfile(path, mmap_mode="w")
+
+
 _CHECKS = {
     "uschange": {
         "columns": ["Income", "Production", "Savings", "Unemployment"],
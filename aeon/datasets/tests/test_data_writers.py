@@ -101,3 +101,67 @@ def test_write_dataframe_to_ts(tsfile_writer):
         pd.testing.assert_frame_equal(newX, X)
         y2 = pd.Series(y)
         pd.testing.assert_series_equal(y, y2)
+
+
+@pytest.mark.parametrize("regression", [True, False])
+@pytest.mark.parametrize("equal_length", [True, False])
+@pytest.mark.parametrize("dtype", [np.float64, np.int64])
+def test_write_to_tsfile_npy(regression, equal_length, dtype):
+    """Test that the npy format loads the same as the .ts format."""
+    if equal_length:
+        X, y = make_3d_test_data(regression_target=regression)
+        X = (X * 10).astype(dtype)
+    else:
+        X, y = make_unequal_length_test_data(regression_target=regression)
+        X = [(x * 10).astype(dtype) for x in X]
+    with tempfile.TemporaryDirectory() as tmp:
+        ts_path = os.path.join(tmp, "ts")
+        npy_path = os.path.join(tmp, "npy")
+        write_to_tsfile(X, ts_path, y=y, problem_name="Testy", regression=regression)
+        write_to_tsfile(
+            X,
+            npy_path,
+            y=y,
+            problem_name="Testy",
+            regression=regression,
+            file_format="npy",
+        )
+        assert not os.path.exists(os.path.join(npy_path, "Testy.ts"))
+
+        X_ts, y_ts, meta_ts = load_from_tsfile(
+            os.path.join(ts_path, "Testy"), return_meta_data=True
+        )
+        X_npy, y_npy, meta_npy = load_from_tsfile(
+            os.path.join(npy_path, "Testy"), return_meta_data=True, mmap_mode="r"
+        )
+        assert meta_npy == meta_ts
+        # the .ts format writes the targets as text, the npy format exactly
+        np.testing.assert_array_equal(y_npy, y if regression else y_ts)
+        if equal_length:
+            assert isinstance(X_npy, np.memmap)
+            assert X_npy.dtype == X_ts.dtype == np.float64
+            np.testing.assert_array_equal(X_npy, X_ts)
+        else:
+            assert isinstance(X_npy, list) and len(X_npy) == len(X_ts)
+            for x_npy, x_ts in zip(X_npy, X_ts):
+                assert isinstance(x_npy.base, np.memmap)
+                assert x_npy.dtype == x_ts.dtype == np.float64
+                np.testing.assert_array_equal(x_npy, x_ts)
+
+
+def test_write_to_tsfile_both():
+    """Test writing both formats and loading memory mapped from the .ts file."""
+    X, y = make_3d_test_data()
+    with tempfile.TemporaryDirectory() as tmp:
+        write_to_tsfile(X, tmp, y=y, problem_name="Testy", file_format="both")
+        load_path = os.path.join(tmp, "Testy.ts")
+        assert os.path.exists(load_path)
+        newX, newy = load_from_tsfile(load_path, mmap_mode="r")
+        assert isinstance(newX, np.memmap)
+        np.testing.assert_array_equal(newX, X)
+        np.testing.assert_array_equal(newy, y.astype(str))
+
+        with pytest.raises(ValueError, match="file_format"):
+            write_to_tsfile(X, tmp, y=y, problem_name="Testy", file_format="csv")
+        with pytest.raises(ValueError, match="mmap_mode"):
+            load_from_tsfile(load_path, mmap_mode="w+")
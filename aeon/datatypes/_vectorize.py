@@ -4,11 +4,13 @@ Contains VectorizedDF class.
 """
 from itertools import product
 
+import numpy as np
 import pandas as pd
 
 from aeon.datatypes._check import check_is_scitype, mtype
 from aeon.datatypes._convert import convert_to
 from aeon.utils.multiindex import flatten_multiindex
+from aeon.utils.parallel import parallelize
 
 
 class VectorizedDF:
@@ -379,7 +381,9 @@ class VectorizedDF:
         if row_ix is None and col_ix is None:
             X_mi_reconstructed = self.X_multiindex
         elif col_ix is None:
-            X_mi_reconstructed = pd.concat(df_list, keys=row_ix, axis=0)
+            X_mi_reconstructed = _concat_rows(df_list, keys=row_ix)
+            if X_mi_reconstructed is None:
+                X_mi_reconstructed = pd.concat(df_list, keys=row_ix, axis=0)
         elif row_ix is None:
             force_flat = _force_flat(df_list)
             if col_multiindex in ["flat", "multiindex"] or force_flat:
@@ -465,6 +469,8 @@ class VectorizedDF:
         rowname_default="estimators",
         colname_default="estimators",
         varname_of_self=None,
+        backend=None,
+        backend_params=None,
         **kwargs,
     ):
         """Vectorize application of estimator method, return results DataFrame or list.
@@ -524,6 +530,16 @@ class VectorizedDF:
             used as index name of single column if no column vectorization is performed
         varname_of_self : str, optional, default=None
             if not None, self will be passed as kwarg under name "varname_of_self"
+        backend : str or None, optional, default=None
+            backend to execute the method calls with, one of
+            None (sequential loop), "loky", "threading", "multiprocessing", "dask",
+            see `aeon.utils.parallel.parallelize`.
+            Results are in the same order for all backends. For backends running in
+            other processes, estimator and arguments are pickled, and the estimators
+            after the method call are written back to `estimator` if it is a
+            `pd.DataFrame`, so that state changes persist as for the sequential loop.
+        backend_params : dict, optional, default=None
+            additional arguments passed to the backend, e.g., {"n_jobs": 4}
         kwargs : will be passed to invoked methods of estimator(s) in `estimator`
 
         Returns
@@ -549,11 +565,7 @@ class VectorizedDF:
         if col_idx is None:
             col_idx = [colname_default]
 
-        if return_type == "pd.DataFrame":
-            est_frame_new = pd.DataFrame(index=row_idx, columns=col_idx)
-        elif return_type == "list":
-            est_frame_new = []
-        else:
+        if return_type not in ["pd.DataFrame", "list"]:
             raise ValueError('return_type must be one of "pd.DataFrame" or "list"')
 
         if varname_of_self is not None and isinstance(varname_of_self, str):
@@ -565,27 +577,114 @@ class VectorizedDF:
 
             return {k: fun(v) for k, v in d.items()}
 
-        for i in range(len(self)):
-            row_ind, col_ind = self.get_iloc_indexer(i)
+        # estimators in the sequence of self.__getitem__, i.e., row-major
+        if isinstance(estimator, pd.DataFrame):
+            ests = estimator.to_numpy().ravel()
+        else:
+            ests = [estimator] * len(self)
 
+        args_list = []
+        for i in range(len(self)):
             args_i = vec_dict(args, i=i, vectorize_cols=True)
             args_i_rowvec = vec_dict(args_rowvec, i=i, vectorize_cols=False)
             args_i.update(args_i_rowvec)
+            args_list += [args_i]
+
+        est_results = parallelize(
+            fun=_vectorize_est_single,
+            iterable=zip(ests, args_list),
+            meta={"method": method},
+            backend=backend,
+            backend_params=backend_params,
+        )
 
-            if not isinstance(estimator, pd.DataFrame):
-                est_i = estimator
-            else:
-                est_i = estimator.iloc[row_ind].iloc[col_ind]
+        results = np.empty(len(self), dtype=object)
+        for i, (est_i, est_i_result) in enumerate(est_results):
+            results[i] = est_i_result
+
+            # write back estimators changed in other processes
+            if isinstance(estimator, pd.DataFrame) and est_i is not ests[i]:
+                row_ind, col_ind = self.get_iloc_indexer(i)
+                estimator.iloc[row_ind, col_ind] = est_i
+
+        if return_type == "list":
+            return list(results)
+
+        # build the frame once from the flat array of results
+        return pd.DataFrame(
+            results.reshape(len(row_idx), len(col_idx)),
+            index=row_idx,
+            columns=col_idx,
+        )
+
+
+def _concat_rows(df_list, keys):
+    """Row-concatenate data frames with keys, in bulk if possible.
 
-            est_i_method = getattr(est_i, method)
-            est_i_result = est_i_method(**args_i)
+    Bulk equivalent of `pd.concat(df_list, keys=keys, axis=0)` for data frames with
+    the same columns and the same numpy dtype in all columns. The values are
+    concatenated into a single array, and the index is constructed once from the
+    keys and the indices of the frames.
 
-            if return_type == "pd.DataFrame":
-                est_frame_new.iloc[row_ind].iloc[col_ind] = est_i_result
-            else:  # if return_type == "list"
-                est_frame_new += [est_i_result]
+    Parameters
+    ----------
+    df_list : list of pd.DataFrame
+        data frames to concatenate
+    keys : pd.Index or pd.MultiIndex, of same length as df_list
+        outer index levels of the result, one key per data frame
 
-        return est_frame_new
+    Returns
+    -------
+    pd.DataFrame, row-concatenation of df_list with keys as outer index levels,
+        or None if the data frames are not suitable for bulk concatenation
+    """
+    if len(df_list) == 0:
+        return None
+
+    columns = df_list[0].columns
+    dtypes = df_list[0].dtypes.unique()
+    if not columns.is_unique or len(dtypes) != 1:
+        return None
+    dtype = dtypes[0]
+    if not isinstance(dtype, np.dtype) or dtype.kind not in "biuf":
+        return None
+
+    # frames with other numeric dtypes are accepted if to_numpy upcasts them to the
+    # dtype of the first frame, as pd.concat upcasts the columns to it as well
+    index_type = type(df_list[0].index)
+    values = []
+    for df in df_list:
+        if type(df.index) is not index_type or not df.columns.equals(columns):
+            return None
+        df_values = df.to_numpy()
+        if df_values.dtype != dtype:
+            return None
+        values.append(df_values)
+    values = np.concatenate(values)
+
+    lengths = [len(df) for df in df_list]
+
+    outer = keys.repeat(lengths)
+    inner = df_list[0].index.append([df.index for df in df_list[1:]])
+    names = list(keys.names) + list(inner.names)
+    index = pd.MultiIndex.from_arrays(
+        [outer.get_level_values(i) for i in range(outer.nlevels)]
+        + [inner.get_level_values(i) for i in range(inner.nlevels)],
+        names=names,
+    )
+
+    return pd.DataFrame(values, index=index, columns=columns, copy=False)
+
+
+def _vectorize_est_single(vec_tuple, meta):
+    """Call method of a single estimator, for use in VectorizedDF.vectorize_est.
+
+    Returns the estimator with the result, as the estimator is a copy if the method
+    is called in another process.
+    """
+    est, args = vec_tuple
+    est_result = getattr(est, meta["method"])(**args)
+    return est, est_result
 
 
 def _enforce_index_freq(item: pd.Series) -> pd.Series:
@@ -471,3 +471,53 @@ def test_vectorize_est(
     assert result.shape == (n_rows, n_cols)
     is_fcst_frame = result.applymap(lambda x: isinstance(x, NaiveForecaster))
     assert is_fcst_frame.all().all()
+
+
+@pytest.mark.parametrize("backend", ["loky", "threading", "multiprocessing"])
+def test_vectorize_est_backend(backend):
+    """Tests vectorize_est with parallel backends against the sequential loop."""
+    from aeon.forecasting.naive import NaiveForecaster
+    from aeon.utils._testing.hierarchical import _make_hierarchical
+
+    y = _make_hierarchical(hierarchy_levels=(2, 3), min_timepoints=10)
+    y_vect = VectorizedDF(X=y, iterate_as="Series", is_scitype="Hierarchical")
+
+    results = []
+    for b in [None, backend]:
+        est_clones = y_vect.vectorize_est(NaiveForecaster(), method="clone")
+        fitted = y_vect.vectorize_est(
+            est_clones, method="fit", y=y_vect, fh=[1, 2], backend=b
+        )
+        y_preds = y_vect.vectorize_est(
+            fitted, method="predict", return_type="list", backend=b
+        )
+        results.append(y_vect.reconstruct(y_preds))
+
+        # fitted estimators from other processes are written back to the frame
+        assert fitted.applymap(lambda x: x.is_fitted).all().all()
+        assert (est_clones.values == fitted.values).all()
+
+    pd.testing.assert_frame_equal(results[0], results[1])
+
+
+@pytest.mark.parametrize("dtypes", [("float64", "float64"), ("float64", "int64")])
+def test_concat_rows(dtypes):
+    """Tests bulk row concatenation against pd.concat."""
+    from aeon.datatypes._vectorize import _concat_rows
+
+    keys = pd.MultiIndex.from_product([["a", "b"], [1, 2]], names=["h0", "h1"])
+    index = pd.period_range("2000-01", periods=3, freq="M", name="time")
+    df_list = [
+        pd.DataFrame({"x": np.arange(3), "y": np.ones(3)}, index=index).astype(
+            {"x": dtypes[i % 2]}
+        )
+        for i in range(4)
+    ]
+
+    result = _concat_rows(df_list, keys=keys)
+    assert result is not None
+    pd.testing.assert_frame_equal(result, pd.concat(df_list, keys=keys))
+
+    # bool columns are upcast to object by pd.concat, not by the bulk path
+    df_list[1] = df_list[1].astype({"x": bool})
+    assert _concat_rows(df_list, keys=keys) is None
@@ -4,6 +4,7 @@ __author__ = ["chrisholder", "TonyBagnall", "baraline"]
 
 __all__ = [
     "create_bounding_matrix",
+    "create_bounding_band",
     "squared_distance",
     "squared_pairwise_distance",
     "euclidean_distance",
@@ -71,7 +72,7 @@ from aeon.distances._adtw import (
     adtw_distance,
     adtw_pairwise_distance,
 )
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import create_bounding_band, create_bounding_matrix
 from aeon.distances._ddtw import (
     ddtw_alignment_path,
     ddtw_cost_matrix,
@@ -4,10 +4,10 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import compute_min_return_path
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import create_bounding_band
 from aeon.distances._squared import _univariate_squared_distance
 from aeon.distances._utils import reshape_pairwise_to_multiple
 
@@ -79,15 +79,15 @@ def adtw_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _adtw_distance(_x, _y, bounding_matrix, warp_penalty)
+        return _adtw_distance(_x, _y, bounding_band, warp_penalty)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _adtw_distance(x, y, bounding_matrix, warp_penalty)
+        return _adtw_distance(x, y, bounding_band, warp_penalty)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -152,30 +152,49 @@ def adtw_cost_matrix(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _adtw_cost_matrix(_x, _y, bounding_matrix, warp_penalty)
+        return _adtw_cost_matrix(_x, _y, bounding_band, warp_penalty)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _adtw_cost_matrix(x, y, bounding_matrix, warp_penalty)
+        return _adtw_cost_matrix(x, y, bounding_band, warp_penalty)
     raise ValueError("x and y must be 1D or 2D")
 
 
 @njit(cache=True, fastmath=True)
 def _adtw_distance(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, warp_penalty: float
+    x: np.ndarray, y: np.ndarray, bounding_band: np.ndarray, warp_penalty: float
 ) -> float:
-    return _adtw_cost_matrix(x, y, bounding_matrix, warp_penalty)[
-        x.shape[1] - 1, y.shape[1] - 1
-    ]
+    y_size = y.shape[1]
+    prev_row = np.full(y_size + 1, np.inf)
+    curr_row = np.full(y_size + 1, np.inf)
+    prev_row[0] = 0.0
+    # range of each row buffer that may hold values other than inf
+    prev_lower, prev_upper = 0, 1
+    curr_lower, curr_upper = 0, 0
+
+    for i in range(x.shape[1]):
+        curr_row[curr_lower:curr_upper] = np.inf
+        for j in range(bounding_band[0, i], bounding_band[1, i]):
+            curr_row[j + 1] = _univariate_squared_distance(x[:, i], y[:, j]) + min(
+                prev_row[j + 1] + warp_penalty,
+                curr_row[j] + warp_penalty,
+                prev_row[j],
+            )
+        curr_lower, curr_upper = bounding_band[0, i] + 1, bounding_band[1, i] + 1
+        prev_row, curr_row = curr_row, prev_row
+        prev_lower, curr_lower = curr_lower, prev_lower
+        prev_upper, curr_upper = curr_upper, prev_upper
+
+    return prev_row[y_size]
 
 
 @njit(cache=True, fastmath=True)
 def _adtw_cost_matrix(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, warp_penalty: float
+    x: np.ndarray, y: np.ndarray, bounding_band: np.ndarray, warp_penalty: float
 ) -> np.ndarray:
     x_size = x.shape[1]
     y_size = y.shape[1]
@@ -183,15 +202,14 @@ def _adtw_cost_matrix(
     cost_matrix[0, 0] = 0.0
 
     for i in range(x_size):
-        for j in range(y_size):
-            if bounding_matrix[i, j]:
-                cost_matrix[i + 1, j + 1] = _univariate_squared_distance(
-                    x[:, i], y[:, j]
-                ) + min(
-                    cost_matrix[i, j + 1] + warp_penalty,
-                    cost_matrix[i + 1, j] + warp_penalty,
-                    cost_matrix[i, j],
-                )
+        for j in range(bounding_band[0, i], bounding_band[1, i]):
+            cost_matrix[i + 1, j + 1] = _univariate_squared_distance(
+                x[:, i], y[:, j]
+            ) + min(
+                cost_matrix[i, j + 1] + warp_penalty,
+                cost_matrix[i + 1, j] + warp_penalty,
+                cost_matrix[i, j],
+            )
 
     return cost_matrix[1:, 1:]
 
@@ -277,25 +295,25 @@ def adtw_pairwise_distance(
     )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _adtw_pairwise_distance(
     X: np.ndarray, window: float, itakura_max_slope: float, warp_penalty: float
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         X.shape[2], X.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(i + 1, n_instances):
-            distances[i, j] = _adtw_distance(X[i], X[j], bounding_matrix, warp_penalty)
+            distances[i, j] = _adtw_distance(X[i], X[j], bounding_band, warp_penalty)
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _adtw_from_multiple_to_multiple_distance(
     x: np.ndarray,
     y: np.ndarray,
@@ -306,13 +324,13 @@ def _adtw_from_multiple_to_multiple_distance(
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         x.shape[2], y.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(m_instances):
-            distances[i, j] = _adtw_distance(x[i], y[j], bounding_matrix, warp_penalty)
+            distances[i, j] = _adtw_distance(x[i], y[j], bounding_band, warp_penalty)
     return distances
 
 
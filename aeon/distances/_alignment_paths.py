@@ -60,7 +60,7 @@ def compute_lcss_return_path(
     x: np.ndarray,
     y: np.ndarray,
     epsilon: float,
-    bounding_matrix: np.ndarray,
+    bounding_band: np.ndarray,
     cost_matrix: np.ndarray,
 ) -> List[Tuple]:
     """Compute the return path through a cost matrix for the LCSS algorithm.
@@ -73,8 +73,8 @@ def compute_lcss_return_path(
         Second time series.
     epsilon : float
         Threshold for the LCSS algorithm.
-    bounding_matrix : np.ndarray (n_timepoints_x, n_timepoints_y)
-        Bounding matrix for the LCSS algorithm.
+    bounding_band : np.ndarray (2, n_timepoints_x)
+        Bounding band for the LCSS algorithm, see ``create_bounding_band``.
     cost_matrix : np.ndarray (n_timepoints_x, n_timepoints_y)
         Cost matrix for the LCSS algorithm.
 
@@ -90,7 +90,7 @@ def compute_lcss_return_path(
     path = []
 
     while i > 0 and j > 0:
-        if bounding_matrix[i - 1, j - 1]:
+        if bounding_band[0, i - 1] <= j - 1 < bounding_band[1, i - 1]:
             if _univariate_euclidean_distance(x[:, i - 1], y[:, j - 1]) <= epsilon:
                 path.append((i - 1, j - 1))
                 i, j = (i - 1, j - 1)
@@ -103,12 +103,10 @@ def compute_lcss_return_path(
 
 @njit(cache=True, fastmath=True)
 def _add_inf_to_out_of_bounds_cost_matrix(
-    cost_matrix: np.ndarray, bounding_matrix: np.ndarray
+    cost_matrix: np.ndarray, bounding_band: np.ndarray
 ) -> np.ndarray:
-    x_size, y_size = cost_matrix.shape
-    for i in range(x_size):
-        for j in range(y_size):
-            if not np.isfinite(bounding_matrix[i, j]):
-                cost_matrix[i, j] = np.inf
+    for i in range(cost_matrix.shape[0]):
+        cost_matrix[i, : bounding_band[0, i]] = np.inf
+        cost_matrix[i, bounding_band[1, i] :] = np.inf
 
     return cost_matrix
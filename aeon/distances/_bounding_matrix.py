@@ -43,6 +43,52 @@ def create_bounding_matrix(
            [False, False,  True,  True,  True,  True,  True,  True],
            [False, False, False,  True,  True,  True,  True,  True]])
     """
+    band = create_bounding_band(x_size, y_size, window, itakura_max_slope)
+    bounding_matrix = np.full((x_size, y_size), False)
+    for i in range(x_size):
+        bounding_matrix[i, band[0, i] : band[1, i]] = True
+    return bounding_matrix
+
+
+@njit(cache=True)
+def create_bounding_band(
+    x_size: int, y_size: int, window: float = None, itakura_max_slope: float = None
+):
+    """Create the bounding band of an elastic distance.
+
+    The band is a compact form of the bounding matrix created by
+    ``create_bounding_matrix``. The in bound cells of each row of a Sakoe-Chiba band
+    or Itakura parallelogram are a single contiguous run, so row ``i`` of the
+    bounding matrix is described by the columns ``band[0, i]`` up to, but not
+    including, ``band[1, i]``. Rows with no in bound cells have ``band[0, i] ==
+    band[1, i]``. Elastic distances iterate over the band rather than checking every
+    cell of a bounding matrix, so creating and using a band costs ``O(x_size)`` and
+    the number of in bound cells respectively.
+
+    Parameters
+    ----------
+    x_size : int
+        Size of the first time series.
+    y_size : int
+        Size of the second time series.
+    window : float, default=None
+        Window size as a percentage of the smallest time series.
+        If None, the band will be full.
+    itakura_max_slope : float, default=None
+        Maximum slope as a proportion of the number of time points used to create
+        Itakura parallelogram on the band. Must be between 0. and 1.
+
+    Returns
+    -------
+    np.ndarray of shape (2, x_size)
+        The first (inclusive) and last (exclusive) in bound column of each row.
+
+    Examples
+    --------
+    >>> create_bounding_band(8, 8, window=0.5)
+    array([[0, 0, 0, 0, 0, 1, 2, 3],
+           [5, 6, 7, 8, 8, 8, 8, 8]])
+    """
     if itakura_max_slope is not None:
         if itakura_max_slope < 0 or itakura_max_slope > 1:
             raise ValueError("itakura_max_slope must be between 0 and 1")
@@ -51,7 +97,10 @@ def create_bounding_matrix(
         if window < 0 or window > 1:
             raise ValueError("window must be between 0 and 1")
         return _sakoe_chiba_bounding(x_size, y_size, window)
-    return np.full((x_size, y_size), True)
+    band = np.empty((2, x_size), dtype=np.int64)
+    band[0] = 0
+    band[1] = y_size
+    return band
 
 
 @njit(cache=True)
@@ -87,10 +136,18 @@ def _itakura_parallelogram(x_size: int, y_size: int, max_slope_percent: float):
         upper_bound_[i] = min(round(upper_bound[0, i], 2), round(upper_bound[1, i], 2))
     upper_bound_ = np.floor(upper_bound_ + 1)
 
-    bounding_matrix = np.full((x_size, y_size), False)
-    for i in range(y_size):
-        bounding_matrix[int(lower_bound_[i]) : int(upper_bound_[i]), i] = True
-    return bounding_matrix
+    # column j is in bound for rows [lower_bound_[j], upper_bound_[j]), which gives
+    # a contiguous run of columns in each row
+    band = np.zeros((2, x_size), dtype=np.int64)
+    band[0] = y_size
+    for j in range(y_size):
+        for i in range(int(lower_bound_[j]), min(int(upper_bound_[j]), x_size)):
+            band[0, i] = min(band[0, i], j)
+            band[1, i] = max(band[1, i], j + 1)
+    for i in range(x_size):
+        if band[1, i] == 0:
+            band[0, i] = 0
+    return band
 
 
 @njit(cache=True)
@@ -99,15 +156,14 @@ def _sakoe_chiba_bounding(
 ) -> np.ndarray:
     one_percent = min(x_size, y_size) / 100
     radius = math.floor(((radius_percent * one_percent) * 100))
-    bounding_matrix = np.full((x_size, y_size), False)
+    band = np.zeros((2, x_size), dtype=np.int64)
 
     smallest_size = min(x_size, y_size)
     largest_size = max(x_size, y_size)
 
     width = largest_size - smallest_size + radius
     for i in range(smallest_size):
-        lower = max(0, i - radius)
-        upper = min(largest_size, i + width) + 1
-        bounding_matrix[i, lower:upper] = True
+        band[0, i] = max(0, i - radius)
+        band[1, i] = min(min(largest_size, i + width) + 1, y_size)
 
-    return bounding_matrix
+    return band
@@ -4,10 +4,10 @@ __author__ = ["chrisholder", "tonybagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import compute_min_return_path
-from aeon.distances._dtw import _dtw_cost_matrix, _dtw_distance, create_bounding_matrix
+from aeon.distances._dtw import _dtw_cost_matrix, _dtw_distance, create_bounding_band
 from aeon.distances._utils import reshape_pairwise_to_multiple
 
 
@@ -72,17 +72,17 @@ def ddtw_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = average_of_slope(x.reshape((1, x.shape[0])))
         _y = average_of_slope(y.reshape((1, y.shape[0])))
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _dtw_distance(_x, _y, bounding_matrix)
+        return _dtw_distance(_x, _y, bounding_band)
     if x.ndim == 2 and y.ndim == 2:
         _x = average_of_slope(x)
         _y = average_of_slope(y)
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _dtw_distance(_x, _y, bounding_matrix)
+        return _dtw_distance(_x, _y, bounding_band)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -140,17 +140,17 @@ def ddtw_cost_matrix(
     if x.ndim == 1 and y.ndim == 1:
         _x = average_of_slope(x.reshape((1, x.shape[0])))
         _y = average_of_slope(y.reshape((1, y.shape[0])))
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _dtw_cost_matrix(_x, _y, bounding_matrix)
+        return _dtw_cost_matrix(_x, _y, bounding_band)
     if x.ndim == 2 and y.ndim == 2:
         _x = average_of_slope(x)
         _y = average_of_slope(y)
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _dtw_cost_matrix(_x, _y, bounding_matrix)
+        return _dtw_cost_matrix(_x, _y, bounding_band)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -228,13 +228,13 @@ def ddtw_pairwise_distance(
     return _ddtw_from_multiple_to_multiple_distance(_x, _y, window, itakura_max_slope)
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _ddtw_pairwise_distance(
     X: np.ndarray, window: float, itakura_max_slope: float
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         X.shape[2] - 2, X.shape[2] - 2, window, itakura_max_slope
     )
 
@@ -242,24 +242,24 @@ def _ddtw_pairwise_distance(
     for i in range(n_instances):
         X_average_of_slope[i] = average_of_slope(X[i])
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(i + 1, n_instances):
             distances[i, j] = _dtw_distance(
-                X_average_of_slope[i], X_average_of_slope[j], bounding_matrix
+                X_average_of_slope[i], X_average_of_slope[j], bounding_band
             )
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _ddtw_from_multiple_to_multiple_distance(
     x: np.ndarray, y: np.ndarray, window: float, itakura_max_slope: float
 ) -> np.ndarray:
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         x.shape[2], y.shape[2], window, itakura_max_slope
     )
 
@@ -272,9 +272,9 @@ def _ddtw_from_multiple_to_multiple_distance(
     for i in range(y.shape[0]):
         derive_y[i] = average_of_slope(y[i])
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(m_instances):
-            distances[i, j] = _dtw_distance(derive_x[i], derive_y[j], bounding_matrix)
+            distances[i, j] = _dtw_distance(derive_x[i], derive_y[j], bounding_band)
     return distances
 
 
@@ -3,6 +3,8 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import Any, Callable, List, Tuple, Union
 
 import numpy as np
+from numba import get_num_threads, set_num_threads
+from numba.core.config import NUMBA_NUM_THREADS
 
 from aeon.distances._adtw import (
     adtw_alignment_path,
@@ -75,6 +77,7 @@ from aeon.distances._wdtw import (
     wdtw_pairwise_distance,
 )
 from aeon.distances.mpdist import mpdist
+from aeon.utils.validation import check_n_jobs
 
 DistanceFunction = Callable[[np.ndarray, np.ndarray, Any], float]
 AlignmentPathFunction = Callable[
@@ -228,6 +231,7 @@ def pairwise_distance(
     x: np.ndarray,
     y: np.ndarray = None,
     metric: Union[str, DistanceFunction] = None,
+    n_jobs: int = 1,
     **kwargs: Any,
 ) -> np.ndarray:
     """Compute the pairwise distance matrix between two time series.
@@ -244,6 +248,13 @@ def pairwise_distance(
         The distance metric to use.
         A list of valid pairwise distance metrics can be found in the documentation for
         :func:`aeon.distances.get_pairwise_distance_function`.
+    n_jobs : int, default=1
+        The number of threads used to compute the pairwise matrix of the elastic
+        distances (``dtw``, ``ddtw``, ``wdtw``, ``wddtw``, ``lcss``, ``erp``,
+        ``edr``, ``twe``, ``msm``, ``adtw`` and ``shape_dtw``). Rows of the
+        distance matrix are split across threads. ``-1`` means using all
+        processors. Other metrics and callables are always computed on a single
+        thread.
     kwargs : Any
         Extra arguments for metric. Refer to each metric documentation for a list of
         possible arguments.
@@ -285,7 +296,27 @@ def pairwise_distance(
     array([[300.],
            [147.],
            [ 48.]])
+
+    >>> # Split the rows of the distance matrix across all available threads
+    >>> pairwise_distance(X, metric='dtw', n_jobs=-1)
+    array([[  0.,  26., 108.],
+           [ 26.,   0.,  26.],
+           [108.,  26.,   0.]])
     """
+    prev_threads = get_num_threads()
+    set_num_threads(min(check_n_jobs(n_jobs), NUMBA_NUM_THREADS))
+    try:
+        return _pairwise_distance(x, y, metric, **kwargs)
+    finally:
+        set_num_threads(prev_threads)
+
+
+def _pairwise_distance(
+    x: np.ndarray,
+    y: np.ndarray = None,
+    metric: Union[str, DistanceFunction] = None,
+    **kwargs: Any,
+) -> np.ndarray:
     if metric == "squared":
         return squared_pairwise_distance(x, y)
     elif metric == "euclidean":
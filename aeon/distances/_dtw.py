@@ -4,10 +4,10 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import compute_min_return_path
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import create_bounding_band
 from aeon.distances._squared import _univariate_squared_distance
 from aeon.distances._utils import reshape_pairwise_to_multiple
 
@@ -110,15 +110,15 @@ def dtw_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _dtw_distance(_x, _y, bounding_matrix)
+        return _dtw_distance(_x, _y, bounding_band)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _dtw_distance(x, y, bounding_matrix)
+        return _dtw_distance(x, y, bounding_band)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -179,26 +179,26 @@ def dtw_cost_matrix(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _dtw_cost_matrix(_x, _y, bounding_matrix)
+        return _dtw_cost_matrix(_x, _y, bounding_band)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _dtw_cost_matrix(x, y, bounding_matrix)
+        return _dtw_cost_matrix(x, y, bounding_band)
     raise ValueError("x and y must be 1D or 2D")
 
 
 @njit(cache=True, fastmath=True)
-def _dtw_distance(x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray) -> float:
-    return _dtw_cost_matrix(x, y, bounding_matrix)[x.shape[1] - 1, y.shape[1] - 1]
+def _dtw_distance(x: np.ndarray, y: np.ndarray, bounding_band: np.ndarray) -> float:
+    return _dtw_early_abandon_distance(x, y, bounding_band, np.inf)
 
 
 @njit(cache=True, fastmath=True)
 def _dtw_cost_matrix(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray
+    x: np.ndarray, y: np.ndarray, bounding_band: np.ndarray
 ) -> np.ndarray:
     x_size = x.shape[1]
     y_size = y.shape[1]
@@ -206,19 +206,56 @@ def _dtw_cost_matrix(
     cost_matrix[0, 0] = 0.0
 
     for i in range(x_size):
-        for j in range(y_size):
-            if bounding_matrix[i, j]:
-                cost_matrix[i + 1, j + 1] = _univariate_squared_distance(
-                    x[:, i], y[:, j]
-                ) + min(
-                    cost_matrix[i, j + 1],
-                    cost_matrix[i + 1, j],
-                    cost_matrix[i, j],
-                )
+        for j in range(bounding_band[0, i], bounding_band[1, i]):
+            cost_matrix[i + 1, j + 1] = _univariate_squared_distance(
+                x[:, i], y[:, j]
+            ) + min(
+                cost_matrix[i, j + 1],
+                cost_matrix[i + 1, j],
+                cost_matrix[i, j],
+            )
 
     return cost_matrix[1:, 1:]
 
 
+@njit(cache=True, fastmath=True)
+def _dtw_early_abandon_distance(
+    x: np.ndarray, y: np.ndarray, bounding_band: np.ndarray, cutoff: float
+) -> float:
+    """Compute DTW keeping two rows, abandoning once a row exceeds ``cutoff``.
+
+    Only the in bound cells of each row are visited. Every warping path visits each
+    row of the cost matrix, so once the smallest cost in a row is greater than
+    ``cutoff`` the distance must be too. In that case ``np.inf`` is returned instead
+    of the distance.
+    """
+    y_size = y.shape[1]
+    prev_row = np.full(y_size + 1, np.inf)
+    curr_row = np.full(y_size + 1, np.inf)
+    prev_row[0] = 0.0
+    # range of each row buffer that may hold values other than inf
+    prev_lower, prev_upper = 0, 1
+    curr_lower, curr_upper = 0, 0
+
+    for i in range(x.shape[1]):
+        curr_row[curr_lower:curr_upper] = np.inf
+        row_min = np.inf
+        for j in range(bounding_band[0, i], bounding_band[1, i]):
+            curr_row[j + 1] = _univariate_squared_distance(x[:, i], y[:, j]) + min(
+                prev_row[j + 1], curr_row[j], prev_row[j]
+            )
+            if curr_row[j + 1] < row_min:
+                row_min = curr_row[j + 1]
+        if row_min > cutoff:
+            return np.inf
+        curr_lower, curr_upper = bounding_band[0, i] + 1, bounding_band[1, i] + 1
+        prev_row, curr_row = curr_row, prev_row
+        prev_lower, curr_lower = curr_lower, prev_lower
+        prev_upper, curr_upper = curr_upper, prev_upper
+
+    return prev_row[y_size]
+
+
 @njit(cache=True, fastmath=True)
 def dtw_pairwise_distance(
     X: np.ndarray,
@@ -309,38 +346,38 @@ def dtw_pairwise_distance(
     return _dtw_from_multiple_to_multiple_distance(_x, _y, window, itakura_max_slope)
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _dtw_pairwise_distance(
     X: np.ndarray, window: float, itakura_max_slope: float
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         X.shape[2], X.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(i + 1, n_instances):
-            distances[i, j] = _dtw_distance(X[i], X[j], bounding_matrix)
+            distances[i, j] = _dtw_distance(X[i], X[j], bounding_band)
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _dtw_from_multiple_to_multiple_distance(
     x: np.ndarray, y: np.ndarray, window: float, itakura_max_slope: float
 ) -> np.ndarray:
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         x.shape[2], y.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(m_instances):
-            distances[i, j] = _dtw_distance(x[i], y[j], bounding_matrix)
+            distances[i, j] = _dtw_distance(x[i], y[j], bounding_band)
     return distances
 
 
@@ -4,13 +4,13 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import (
     _add_inf_to_out_of_bounds_cost_matrix,
     compute_min_return_path,
 )
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import create_bounding_band
 from aeon.distances._euclidean import _univariate_euclidean_distance
 from aeon.distances._utils import reshape_pairwise_to_multiple
 
@@ -98,15 +98,15 @@ def edr_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _edr_distance(_x, _y, bounding_matrix, epsilon)
+        return _edr_distance(_x, _y, bounding_band, epsilon)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _edr_distance(x, y, bounding_matrix, epsilon)
+        return _edr_distance(x, y, bounding_band, epsilon)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -167,31 +167,56 @@ def edr_cost_matrix(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _edr_cost_matrix(_x, _y, bounding_matrix, epsilon)
+        return _edr_cost_matrix(_x, _y, bounding_band, epsilon)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _edr_cost_matrix(x, y, bounding_matrix, epsilon)
+        return _edr_cost_matrix(x, y, bounding_band, epsilon)
     raise ValueError("x and y must be 1D or 2D")
 
 
 @njit(cache=True, fastmath=True)
 def _edr_distance(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, epsilon: float = None
+    x: np.ndarray, y: np.ndarray, bounding_band: np.ndarray, epsilon: float = None
 ) -> float:
-    distance = _edr_cost_matrix(x, y, bounding_matrix, epsilon)[
-        x.shape[1] - 1, y.shape[1] - 1
-    ]
-    return float(distance / max(x.shape[1], y.shape[1]))
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    if epsilon is None:
+        epsilon = max(np.std(x), np.std(y)) / 4
+
+    prev_row = np.zeros(y_size + 1)
+    curr_row = np.zeros(y_size + 1)
+    # range of each row buffer that may hold values other than zero
+    prev_lower, prev_upper = 0, 0
+    curr_lower, curr_upper = 0, 0
+
+    for i in range(x_size):
+        curr_row[curr_lower:curr_upper] = 0.0
+        for j in range(bounding_band[0, i], bounding_band[1, i]):
+            if _univariate_euclidean_distance(x[:, i], y[:, j]) < epsilon:
+                cost = 0
+            else:
+                cost = 1
+            curr_row[j + 1] = min(
+                prev_row[j] + cost,
+                prev_row[j + 1] + 1,
+                curr_row[j] + 1,
+            )
+        curr_lower, curr_upper = bounding_band[0, i] + 1, bounding_band[1, i] + 1
+        prev_row, curr_row = curr_row, prev_row
+        prev_lower, curr_lower = curr_lower, prev_lower
+        prev_upper, curr_upper = curr_upper, prev_upper
+
+    return float(prev_row[y_size] / max(x_size, y_size))
 
 
 @njit(cache=True, fastmath=True)
 def _edr_cost_matrix(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, epsilon: float = None
+    x: np.ndarray, y: np.ndarray, bounding_band: np.ndarray, epsilon: float = None
 ) -> np.ndarray:
     x_size = x.shape[1]
     y_size = y.shape[1]
@@ -201,17 +226,16 @@ def _edr_cost_matrix(
     cost_matrix = np.zeros((x_size + 1, y_size + 1))
 
     for i in range(1, x_size + 1):
-        for j in range(1, y_size + 1):
-            if bounding_matrix[i - 1, j - 1]:
-                if _univariate_euclidean_distance(x[:, i - 1], y[:, j - 1]) < epsilon:
-                    cost = 0
-                else:
-                    cost = 1
-                cost_matrix[i, j] = min(
-                    cost_matrix[i - 1, j - 1] + cost,
-                    cost_matrix[i - 1, j] + 1,
-                    cost_matrix[i, j - 1] + 1,
-                )
+        for j in range(bounding_band[0, i - 1] + 1, bounding_band[1, i - 1] + 1):
+            if _univariate_euclidean_distance(x[:, i - 1], y[:, j - 1]) < epsilon:
+                cost = 0
+            else:
+                cost = 1
+            cost_matrix[i, j] = min(
+                cost_matrix[i - 1, j - 1] + cost,
+                cost_matrix[i - 1, j] + 1,
+                cost_matrix[i, j - 1] + 1,
+            )
     return cost_matrix[1:, 1:]
 
 
@@ -295,25 +319,25 @@ def edr_pairwise_distance(
     )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _edr_pairwise_distance(
     X: np.ndarray, window: float, epsilon: float = None, itakura_max_slope: float = None
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         X.shape[2], X.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(i + 1, n_instances):
-            distances[i, j] = _edr_distance(X[i], X[j], bounding_matrix, epsilon)
+            distances[i, j] = _edr_distance(X[i], X[j], bounding_band, epsilon)
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _edr_from_multiple_to_multiple_distance(
     x: np.ndarray,
     y: np.ndarray,
@@ -324,13 +348,13 @@ def _edr_from_multiple_to_multiple_distance(
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         x.shape[2], y.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(m_instances):
-            distances[i, j] = _edr_distance(x[i], y[j], bounding_matrix, epsilon)
+            distances[i, j] = _edr_distance(x[i], y[j], bounding_band, epsilon)
     return distances
 
 
@@ -386,10 +410,10 @@ def edr_alignment_path(
     """
     x_size = x.shape[-1]
     y_size = y.shape[-1]
-    bounding_matrix = create_bounding_matrix(x_size, y_size, window, itakura_max_slope)
+    bounding_band = create_bounding_band(x_size, y_size, window, itakura_max_slope)
     cost_matrix = edr_cost_matrix(x, y, window, epsilon, itakura_max_slope)
     # Need to do this because the cost matrix contains 0s and not inf in out of bounds
-    cost_matrix = _add_inf_to_out_of_bounds_cost_matrix(cost_matrix, bounding_matrix)
+    cost_matrix = _add_inf_to_out_of_bounds_cost_matrix(cost_matrix, bounding_band)
     return compute_min_return_path(cost_matrix), float(
         cost_matrix[x_size - 1, y_size - 1] / max(x_size, y_size)
     )
@@ -4,13 +4,13 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple, Union
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import (
     _add_inf_to_out_of_bounds_cost_matrix,
     compute_min_return_path,
 )
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import create_bounding_band
 from aeon.distances._euclidean import _univariate_euclidean_distance
 from aeon.distances._utils import reshape_pairwise_to_multiple
 
@@ -98,15 +98,15 @@ def erp_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _erp_distance(_x, _y, bounding_matrix, g, g_arr)
+        return _erp_distance(_x, _y, bounding_band, g, g_arr)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _erp_distance(x, y, bounding_matrix, g, g_arr)
+        return _erp_distance(x, y, bounding_band, g, g_arr)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -171,15 +171,15 @@ def erp_cost_matrix(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _erp_cost_matrix(_x, _y, bounding_matrix, g, g_arr)
+        return _erp_cost_matrix(_x, _y, bounding_band, g, g_arr)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _erp_cost_matrix(x, y, bounding_matrix, g, g_arr)
+        return _erp_cost_matrix(x, y, bounding_band, g, g_arr)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -187,20 +187,43 @@ def erp_cost_matrix(
 def _erp_distance(
     x: np.ndarray,
     y: np.ndarray,
-    bounding_matrix: np.ndarray,
+    bounding_band: np.ndarray,
     g: float,
     g_arr: np.ndarray,
 ) -> float:
-    return _erp_cost_matrix(x, y, bounding_matrix, g, g_arr)[
-        x.shape[1] - 1, y.shape[1] - 1
-    ]
+    y_size = y.shape[1]
+    gx_distance, x_sum = _precompute_g(x, g, g_arr)
+    gy_distance, y_sum = _precompute_g(y, g, g_arr)
+
+    prev_row = np.zeros(y_size + 1)
+    curr_row = np.zeros(y_size + 1)
+    prev_row[1:] = y_sum
+    # range of each row buffer, past the first column, that may be non zero
+    prev_lower, prev_upper = 1, y_size + 1
+    curr_lower, curr_upper = 0, 0
+
+    for i in range(x.shape[1]):
+        curr_row[curr_lower:curr_upper] = 0.0
+        curr_row[0] = x_sum
+        for j in range(bounding_band[0, i], bounding_band[1, i]):
+            curr_row[j + 1] = min(
+                prev_row[j] + _univariate_euclidean_distance(x[:, i], y[:, j]),
+                prev_row[j + 1] + gx_distance[i],
+                curr_row[j] + gy_distance[j],
+            )
+        curr_lower, curr_upper = bounding_band[0, i] + 1, bounding_band[1, i] + 1
+        prev_row, curr_row = curr_row, prev_row
+        prev_lower, curr_lower = curr_lower, prev_lower
+        prev_upper, curr_upper = curr_upper, prev_upper
+
+    return prev_row[y_size]
 
 
 @njit(cache=True, fastmath=True)
 def _erp_cost_matrix(
     x: np.ndarray,
     y: np.ndarray,
-    bounding_matrix: np.ndarray,
+    bounding_band: np.ndarray,
     g: float,
     g_arr: np.ndarray,
 ) -> np.ndarray:
@@ -216,14 +239,13 @@ def _erp_cost_matrix(
     cost_matrix[0, 1:] = y_sum
 
     for i in range(1, x_size + 1):
-        for j in range(1, y_size + 1):
-            if bounding_matrix[i - 1, j - 1]:
-                cost_matrix[i, j] = min(
-                    cost_matrix[i - 1, j - 1]
-                    + _univariate_euclidean_distance(x[:, i - 1], y[:, j - 1]),
-                    cost_matrix[i - 1, j] + gx_distance[i - 1],
-                    cost_matrix[i, j - 1] + gy_distance[j - 1],
-                )
+        for j in range(bounding_band[0, i - 1] + 1, bounding_band[1, i - 1] + 1):
+            cost_matrix[i, j] = min(
+                cost_matrix[i - 1, j - 1]
+                + _univariate_euclidean_distance(x[:, i - 1], y[:, j - 1]),
+                cost_matrix[i - 1, j] + gx_distance[i - 1],
+                cost_matrix[i, j - 1] + gy_distance[j - 1],
+            )
 
     return cost_matrix[1:, 1:]
 
@@ -335,7 +357,7 @@ def erp_pairwise_distance(
     )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _erp_pairwise_distance(
     X: np.ndarray,
     window: float,
@@ -345,19 +367,19 @@ def _erp_pairwise_distance(
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         X.shape[2], X.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(i + 1, n_instances):
-            distances[i, j] = _erp_distance(X[i], X[j], bounding_matrix, g, g_arr)
+            distances[i, j] = _erp_distance(X[i], X[j], bounding_band, g, g_arr)
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _erp_from_multiple_to_multiple_distance(
     x: np.ndarray,
     y: np.ndarray,
@@ -369,13 +391,13 @@ def _erp_from_multiple_to_multiple_distance(
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         x.shape[2], y.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(m_instances):
-            distances[i, j] = _erp_distance(x[i], y[j], bounding_matrix, g, g_arr)
+            distances[i, j] = _erp_distance(x[i], y[j], bounding_band, g, g_arr)
     return distances
 
 
@@ -435,11 +457,11 @@ def erp_alignment_path(
     >>> erp_alignment_path(x, y)
     ([(0, 0), (1, 1), (2, 2), (3, 3)], 2.0)
     """
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         x.shape[-1], y.shape[-1], window, itakura_max_slope
     )
     cost_matrix = _add_inf_to_out_of_bounds_cost_matrix(
-        erp_cost_matrix(x, y, window, g, g_arr), bounding_matrix
+        erp_cost_matrix(x, y, window, g, g_arr), bounding_band
     )
     return (
         compute_min_return_path(cost_matrix),
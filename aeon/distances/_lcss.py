@@ -4,10 +4,10 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import compute_lcss_return_path
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import create_bounding_band
 from aeon.distances._euclidean import _univariate_euclidean_distance
 from aeon.distances._utils import reshape_pairwise_to_multiple
 
@@ -103,15 +103,15 @@ def lcss_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _lcss_distance(_x, _y, bounding_matrix, epsilon)
+        return _lcss_distance(_x, _y, bounding_band, epsilon)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _lcss_distance(x, y, bounding_matrix, epsilon)
+        return _lcss_distance(x, y, bounding_band, epsilon)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -175,29 +175,47 @@ def lcss_cost_matrix(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _lcss_cost_matrix(_x, _y, bounding_matrix, epsilon)
+        return _lcss_cost_matrix(_x, _y, bounding_band, epsilon)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _lcss_cost_matrix(x, y, bounding_matrix, epsilon)
+        return _lcss_cost_matrix(x, y, bounding_band, epsilon)
     raise ValueError("x and y must be 1D or 2D")
 
 
 @njit(cache=True, fastmath=True)
 def _lcss_distance(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, epsilon: float
+    x: np.ndarray, y: np.ndarray, bounding_band: np.ndarray, epsilon: float
 ) -> float:
-    distance = _lcss_cost_matrix(x, y, bounding_matrix, epsilon)[x.shape[1], y.shape[1]]
-    return 1 - (float(distance / min(x.shape[1], y.shape[1])))
+    y_size = y.shape[1]
+    prev_row = np.zeros(y_size + 1)
+    curr_row = np.zeros(y_size + 1)
+    # range of the current row buffer that may hold values other than zero
+    prev_lower, prev_upper = 0, 0
+    curr_lower, curr_upper = 0, 0
+
+    for i in range(x.shape[1]):
+        curr_row[curr_lower:curr_upper] = 0.0
+        for j in range(bounding_band[0, i], bounding_band[1, i]):
+            if _univariate_euclidean_distance(x[:, i], y[:, j]) <= epsilon:
+                curr_row[j + 1] = 1 + prev_row[j]
+            else:
+                curr_row[j + 1] = max(curr_row[j], prev_row[j + 1])
+        curr_lower, curr_upper = bounding_band[0, i] + 1, bounding_band[1, i] + 1
+        prev_row, curr_row = curr_row, prev_row
+        prev_lower, curr_lower = curr_lower, prev_lower
+        prev_upper, curr_upper = curr_upper, prev_upper
+
+    return 1 - (float(prev_row[y_size] / min(x.shape[1], y.shape[1])))
 
 
 @njit(cache=True, fastmath=True)
 def _lcss_cost_matrix(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, epsilon
+    x: np.ndarray, y: np.ndarray, bounding_band: np.ndarray, epsilon
 ) -> np.ndarray:
     x_size = x.shape[1]
     y_size = y.shape[1]
@@ -205,14 +223,11 @@ def _lcss_cost_matrix(
     cost_matrix = np.zeros((x_size + 1, y_size + 1))
 
     for i in range(1, x_size + 1):
-        for j in range(1, y_size + 1):
-            if bounding_matrix[i - 1, j - 1]:
-                if _univariate_euclidean_distance(x[:, i - 1], y[:, j - 1]) <= epsilon:
-                    cost_matrix[i, j] = 1 + cost_matrix[i - 1, j - 1]
-                else:
-                    cost_matrix[i, j] = max(
-                        cost_matrix[i, j - 1], cost_matrix[i - 1, j]
-                    )
+        for j in range(bounding_band[0, i - 1] + 1, bounding_band[1, i - 1] + 1):
+            if _univariate_euclidean_distance(x[:, i - 1], y[:, j - 1]) <= epsilon:
+                cost_matrix[i, j] = 1 + cost_matrix[i - 1, j - 1]
+            else:
+                cost_matrix[i, j] = max(cost_matrix[i, j - 1], cost_matrix[i - 1, j])
     return cost_matrix
 
 
@@ -295,25 +310,25 @@ def lcss_pairwise_distance(
     )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _lcss_pairwise_distance(
     X: np.ndarray, window: float, epsilon: float, itakura_max_slope: float
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         X.shape[2], X.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(i + 1, n_instances):
-            distances[i, j] = _lcss_distance(X[i], X[j], bounding_matrix, epsilon)
+            distances[i, j] = _lcss_distance(X[i], X[j], bounding_band, epsilon)
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _lcss_from_multiple_to_multiple_distance(
     x: np.ndarray,
     y: np.ndarray,
@@ -324,13 +339,13 @@ def _lcss_from_multiple_to_multiple_distance(
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         x.shape[2], y.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(m_instances):
-            distances[i, j] = _lcss_distance(x[i], y[j], bounding_matrix, epsilon)
+            distances[i, j] = _lcss_distance(x[i], y[j], bounding_band, epsilon)
     return distances
 
 
@@ -386,21 +401,21 @@ def lcss_alignment_path(
     """
     x_size = x.shape[-1]
     y_size = y.shape[-1]
-    bounding_matrix = create_bounding_matrix(x_size, y_size, window, itakura_max_slope)
+    bounding_band = create_bounding_band(x_size, y_size, window, itakura_max_slope)
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        cost_matrix = _lcss_cost_matrix(_x, _y, bounding_matrix, epsilon)
+        cost_matrix = _lcss_cost_matrix(_x, _y, bounding_band, epsilon)
         distance = 1 - (float(cost_matrix[x_size, y_size] / min(x_size, y_size)))
         return (
-            compute_lcss_return_path(_x, _y, epsilon, bounding_matrix, cost_matrix),
+            compute_lcss_return_path(_x, _y, epsilon, bounding_band, cost_matrix),
             distance,
         )
     if x.ndim == 2 and y.ndim == 2:
-        cost_matrix = _lcss_cost_matrix(x, y, bounding_matrix, epsilon)
+        cost_matrix = _lcss_cost_matrix(x, y, bounding_band, epsilon)
         distance = 1 - (float(cost_matrix[x_size, y_size] / min(x_size, y_size)))
         return (
-            compute_lcss_return_path(x, y, epsilon, bounding_matrix, cost_matrix),
+            compute_lcss_return_path(x, y, epsilon, bounding_band, cost_matrix),
             distance,
         )
     raise ValueError("x and y must be 1D or 2D arrays")
@@ -0,0 +1,333 @@
+"""Lower bounded, early abandoning nearest neighbour search for elastic distances.
+
+The search follows the UCR suite [1]_: candidates are visited in order of a cheap
+lower bound and a cascade of increasingly tight lower bounds (LB_Kim, LB_Keogh [2]_
+and LB_Improved [3]_) is used to discard candidates that cannot be among the current
+k nearest neighbours. Candidates that survive are compared with an early abandoning
+distance kernel that stops once the cost matrix exceeds the current k-th best
+distance.
+
+References
+----------
+.. [1] Rakthanmanon T., Campana B., Mueen A., Batista G., Westover B., Zhu Q.,
+    Zakaria J., Keogh E.: Searching and mining trillions of time series subsequences
+    under dynamic time warping. KDD 2012.
+.. [2] Keogh E., Ratanamahatana C.: Exact indexing of dynamic time warping.
+    Knowledge and Information Systems 7(3), 2005.
+.. [3] Lemire D.: Faster retrieval with a two-pass dynamic-time-warping lower bound.
+    Pattern Recognition 42(9), 2009.
+"""
+
+import numpy as np
+from numba import njit
+
+from aeon.distances._bounding_matrix import create_bounding_band
+from aeon.distances._dtw import _dtw_early_abandon_distance
+from aeon.distances._msm import _msm_early_abandon_distance
+from aeon.distances._wdtw import _wdtw_early_abandon_distance
+
+LOWER_BOUND_METRICS = ["dtw", "wdtw", "msm"]
+
+_DTW = 0
+_WDTW = 1
+_MSM = 2
+
+
+@njit(cache=True, fastmath=True)
+def _range_envelope(x: np.ndarray, lower_idx: np.ndarray, upper_idx: np.ndarray):
+    """Find the min and max of ``x[lower_idx[i]:upper_idx[i]]`` for every ``i``.
+
+    Both index arrays must be non-decreasing, which allows a single pass with the
+    monotone deque (streaming min-max) algorithm. Empty ranges give an envelope of
+    ``(inf, -inf)``, which makes any lower bound over it infinite.
+    """
+    n = lower_idx.shape[0]
+    lower = np.empty(n)
+    upper = np.empty(n)
+    max_queue = np.empty(x.shape[0], dtype=np.int64)
+    min_queue = np.empty(x.shape[0], dtype=np.int64)
+    max_head = max_tail = min_head = min_tail = 0
+    nxt = 0
+    for i in range(n):
+        while nxt < upper_idx[i]:
+            while max_tail > max_head and x[max_queue[max_tail - 1]] <= x[nxt]:
+                max_tail -= 1
+            max_queue[max_tail] = nxt
+            max_tail += 1
+            while min_tail > min_head and x[min_queue[min_tail - 1]] >= x[nxt]:
+                min_tail -= 1
+            min_queue[min_tail] = nxt
+            min_tail += 1
+            nxt += 1
+        while max_head < max_tail and max_queue[max_head] < lower_idx[i]:
+            max_head += 1
+        while min_head < min_tail and min_queue[min_head] < lower_idx[i]:
+            min_head += 1
+        if lower_idx[i] >= upper_idx[i]:
+            lower[i] = np.inf
+            upper[i] = -np.inf
+        else:
+            lower[i] = x[min_queue[min_head]]
+            upper[i] = x[max_queue[max_head]]
+    return lower, upper
+
+
+@njit(cache=True, fastmath=True)
+def _create_envelopes(X: np.ndarray, lower_idx: np.ndarray, upper_idx: np.ndarray):
+    """Create the lower and upper envelopes of every channel of every series."""
+    n_cases, n_channels, n_timepoints = X.shape
+    lower = np.empty((n_cases, n_channels, lower_idx.shape[0]))
+    upper = np.empty((n_cases, n_channels, lower_idx.shape[0]))
+    for i in range(n_cases):
+        for k in range(n_channels):
+            channel_lower, channel_upper = _range_envelope(
+                X[i, k], lower_idx, upper_idx
+            )
+            lower[i, k] = channel_lower
+            upper[i, k] = channel_upper
+    return lower, upper
+
+
+@njit(cache=True, fastmath=True)
+def _lb_kim(x: np.ndarray, y: np.ndarray, metric: int, c: float, independent: bool):
+    """Lower bound from the cost of the first and last cells of any warping path."""
+    n_channels = x.shape[0]
+    last_x = x.shape[1] - 1
+    last_y = y.shape[1] - 1
+    if metric == _MSM:
+        first = 0.0
+        last = 0.0
+        bound = 0.0
+        for k in range(n_channels):
+            first += abs(x[k, 0] - y[k, 0])
+            diff = abs(x[k, last_x] - y[k, last_y])
+            last += diff
+            if independent:
+                bound += min(diff, c)
+        if not independent:
+            bound = min(last, c)
+        if last_x == 0 and last_y == 0:
+            return first
+        return first + bound
+    first = 0.0
+    last = 0.0
+    for k in range(n_channels):
+        first += (x[k, 0] - y[k, 0]) ** 2
+        last += (x[k, last_x] - y[k, last_y]) ** 2
+    if last_x == 0 and last_y == 0:
+        return first
+    return first + last
+
+
+@njit(cache=True, fastmath=True)
+def _lb_keogh(x: np.ndarray, lower: np.ndarray, upper: np.ndarray, cutoff: float):
+    """Squared distance from ``x`` to the envelope ``(lower, upper)``.
+
+    Stops summing once ``cutoff`` is exceeded.
+    """
+    bound = 0.0
+    for k in range(x.shape[0]):
+        for i in range(x.shape[1]):
+            if x[k, i] > upper[k, i]:
+                bound += (x[k, i] - upper[k, i]) ** 2
+            elif x[k, i] < lower[k, i]:
+                bound += (x[k, i] - lower[k, i]) ** 2
+        if bound > cutoff:
+            return bound
+    return bound
+
+
+@njit(cache=True, fastmath=True)
+def _lb_improved(
+    x: np.ndarray,
+    y: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    col_lower_idx: np.ndarray,
+    col_upper_idx: np.ndarray,
+):
+    """Second pass of LB_Improved.
+
+    ``x`` is projected onto the envelope of ``y`` and the distance from ``y`` to the
+    envelope of the projection, taken over the columns of the bounding matrix, is
+    returned. Adding it to LB_Keogh of ``x`` gives LB_Improved.
+    """
+    bound = 0.0
+    for k in range(x.shape[0]):
+        projection = np.minimum(np.maximum(x[k], lower[k]), upper[k])
+        proj_lower, proj_upper = _range_envelope(
+            projection, col_lower_idx, col_upper_idx
+        )
+        for j in range(y.shape[1]):
+            if y[k, j] > proj_upper[j]:
+                bound += (y[k, j] - proj_upper[j]) ** 2
+            elif y[k, j] < proj_lower[j]:
+                bound += (y[k, j] - proj_lower[j]) ** 2
+    return bound
+
+
+@njit(cache=True, fastmath=True)
+def _lower_bound_kneighbors(
+    x: np.ndarray,
+    X: np.ndarray,
+    X_lower: np.ndarray,
+    X_upper: np.ndarray,
+    col_lower_idx: np.ndarray,
+    col_upper_idx: np.ndarray,
+    bounding_band: np.ndarray,
+    use_envelopes: bool,
+    metric: int,
+    scale: float,
+    g: float,
+    independent: bool,
+    c: float,
+    n_neighbors: int,
+):
+    """Find the ``n_neighbors`` nearest cases in ``X`` to the series ``x``.
+
+    Returns the indices and distances of the neighbours, and the number of full
+    (early abandoning) distance computations performed.
+    """
+    n_cases = X.shape[0]
+    kim = np.empty(n_cases)
+    for i in range(n_cases):
+        kim[i] = _lb_kim(x, X[i], metric, c, independent) * scale
+    order = np.argsort(kim)
+
+    best_dist = np.full(n_neighbors, np.inf)
+    best_idx = np.full(n_neighbors, -1, dtype=np.int64)
+    worst = 0
+    n_computed = 0
+    for i in order:
+        cutoff = best_dist[worst]
+        if kim[i] >= cutoff:
+            # candidates are sorted by LB_Kim, so none of the rest can be closer
+            break
+        if use_envelopes:
+            keogh = _lb_keogh(x, X_lower[i], X_upper[i], cutoff / scale) * scale
+            if keogh >= cutoff:
+                continue
+            improved = keogh + scale * _lb_improved(
+                x, X[i], X_lower[i], X_upper[i], col_lower_idx, col_upper_idx
+            )
+            if improved >= cutoff:
+                continue
+        n_computed += 1
+        if metric == _DTW:
+            dist = _dtw_early_abandon_distance(x, X[i], bounding_band, cutoff)
+        elif metric == _WDTW:
+            dist = _wdtw_early_abandon_distance(x, X[i], bounding_band, g, cutoff)
+        else:
+            dist = _msm_early_abandon_distance(x, X[i], independent, c, cutoff)
+        if dist < cutoff:
+            best_dist[worst] = dist
+            best_idx[worst] = i
+            worst = np.argmax(best_dist)
+    return best_idx, best_dist, n_computed
+
+
+class _LowerBoundSearch:
+    """Lower bounded k nearest neighbour search over a fixed collection.
+
+    Parameters
+    ----------
+    metric : str
+        One of ``LOWER_BOUND_METRICS``.
+    distance_params : dict
+        Parameters of the distance, as passed to the distance function.
+    """
+
+    def __init__(self, metric, distance_params):
+        self.metric = metric
+        self.distance_params = distance_params
+
+    @staticmethod
+    def supports(metric, distance_params, X):
+        """Check whether the search can be used for the given distance and data."""
+        if not isinstance(metric, str) or metric not in LOWER_BOUND_METRICS:
+            return False
+        if not isinstance(X, np.ndarray) or X.ndim != 3:
+            return False
+        if metric == "msm":
+            # out of band cells of a bounded MSM cost matrix do not bound the cost
+            return (
+                distance_params.get("window") is None
+                and distance_params.get("itakura_max_slope") is None
+            )
+        return True
+
+    def fit(self, X):
+        """Build the envelopes of the collection ``X``."""
+        params = self.distance_params
+        self.X_ = np.ascontiguousarray(X, dtype=np.float64)
+        n_timepoints = X.shape[2]
+        self.bounding_band_ = create_bounding_band(
+            n_timepoints,
+            n_timepoints,
+            params.get("window"),
+            params.get("itakura_max_slope"),
+        )
+        self.g_ = float(params.get("g", 0.05))
+        self.c_ = float(params.get("c", 1.0))
+        self.independent_ = bool(params.get("independent", True))
+        self.metric_ = {"dtw": _DTW, "wdtw": _WDTW, "msm": _MSM}[self.metric]
+
+        self.scale_ = 1.0
+        if self.metric_ == _WDTW:
+            # every cell of the WDTW cost matrix is weighted by at least this much
+            self.scale_ = 1 / (1 + np.exp(self.g_ * n_timepoints / 2))
+            if self.g_ < 0:
+                self.scale_ = 1 / (1 + np.exp(-self.g_ * (n_timepoints / 2 - 1)))
+
+        cols_lower, cols_upper, ok = _transpose_band(self.bounding_band_)
+        self.use_envelopes_ = self.metric_ != _MSM and ok
+        self.col_lower_idx_ = cols_lower
+        self.col_upper_idx_ = cols_upper
+        if self.use_envelopes_:
+            self.X_lower_, self.X_upper_ = _create_envelopes(
+                self.X_, self.bounding_band_[0], self.bounding_band_[1]
+            )
+        else:
+            self.X_lower_ = np.empty((0, 0, 0))
+            self.X_upper_ = np.empty((0, 0, 0))
+        return self
+
+    def kneighbors(self, x, n_neighbors):
+        """Return the indices and distances of the nearest neighbours of ``x``."""
+        x = np.ascontiguousarray(x, dtype=np.float64)
+        idx, dist, _ = _lower_bound_kneighbors(
+            x,
+            self.X_,
+            self.X_lower_,
+            self.X_upper_,
+            self.col_lower_idx_,
+            self.col_upper_idx_,
+            self.bounding_band_,
+            self.use_envelopes_,
+            self.metric_,
+            self.scale_,
+            self.g_,
+            self.independent_,
+            self.c_,
+            n_neighbors,
+        )
+        return idx, dist
+
+
+def _transpose_band(bounding_band):
+    """Find the first and one past the last in band row of each column.
+
+    The envelopes need the limits of both the rows and columns of the band to be
+    non-decreasing, which holds for the Sakoe-Chiba band and Itakura parallelogram
+    of two equal length series.
+    """
+    lower, upper = bounding_band
+    columns = np.arange(bounding_band.shape[1])
+    ok = bool(
+        np.all(lower < upper)
+        and np.all(np.diff(lower) >= 0)
+        and np.all(np.diff(upper) >= 0)
+    )
+    col_lower = np.searchsorted(upper, columns, side="right")
+    col_upper = np.searchsorted(lower, columns, side="right")
+    return col_lower.astype(np.int64), col_upper.astype(np.int64), ok
@@ -4,13 +4,13 @@ __author__ = ["chrisholder", "jlines", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import (
     _add_inf_to_out_of_bounds_cost_matrix,
     compute_min_return_path,
 )
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import create_bounding_band
 from aeon.distances._squared import _univariate_squared_distance
 from aeon.distances._utils import reshape_pairwise_to_multiple
 
@@ -115,15 +115,15 @@ def msm_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _msm_distance(_x, _y, bounding_matrix, independent, c)
+        return _msm_distance(_x, _y, bounding_band, independent, c)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _msm_distance(x, y, bounding_matrix, independent, c)
+        return _msm_distance(x, y, bounding_band, independent, c)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -206,19 +206,19 @@ def msm_cost_matrix(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
         if independent:
-            return _msm_independent_cost_matrix(_x, _y, bounding_matrix, c)
-        return _msm_dependent_cost_matrix(_x, _y, bounding_matrix, c)
+            return _msm_independent_cost_matrix(_x, _y, bounding_band, c)
+        return _msm_dependent_cost_matrix(_x, _y, bounding_band, c)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
         if independent:
-            return _msm_independent_cost_matrix(x, y, bounding_matrix, c)
-        return _msm_dependent_cost_matrix(x, y, bounding_matrix, c)
+            return _msm_independent_cost_matrix(x, y, bounding_band, c)
+        return _msm_dependent_cost_matrix(x, y, bounding_band, c)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -226,29 +226,23 @@ def msm_cost_matrix(
 def _msm_distance(
     x: np.ndarray,
     y: np.ndarray,
-    bounding_matrix: np.ndarray,
+    bounding_band: np.ndarray,
     independent: bool,
     c: float,
 ) -> float:
-    if independent:
-        return _msm_independent_cost_matrix(x, y, bounding_matrix, c)[
-            x.shape[1] - 1, y.shape[1] - 1
-        ]
-    return _msm_dependent_cost_matrix(x, y, bounding_matrix, c)[
-        x.shape[1] - 1, y.shape[1] - 1
-    ]
+    return _msm_banded_distance(x, y, bounding_band, independent, c, np.inf)
 
 
 @njit(cache=True, fastmath=True)
 def _msm_independent_cost_matrix(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, c: float
+    x: np.ndarray, y: np.ndarray, bounding_band: np.ndarray, c: float
 ) -> np.ndarray:
     x_size = x.shape[1]
     y_size = y.shape[1]
     cost_matrix = np.zeros((x_size, y_size))
     distance = 0
     for i in range(x.shape[0]):
-        curr_cost_matrix = _independent_cost_matrix(x[i], y[i], bounding_matrix, c)
+        curr_cost_matrix = _independent_cost_matrix(x[i], y[i], bounding_band, c)
         cost_matrix = np.add(cost_matrix, curr_cost_matrix)
         distance += curr_cost_matrix[-1, -1]
     return cost_matrix
@@ -256,7 +250,7 @@ def _msm_independent_cost_matrix(
 
 @njit(cache=True, fastmath=True)
 def _independent_cost_matrix(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, c: float
+    x: np.ndarray, y: np.ndarray, bounding_band: np.ndarray, c: float
 ) -> np.ndarray:
     x_size = x.shape[0]
     y_size = y.shape[0]
@@ -264,30 +258,28 @@ def _independent_cost_matrix(
     cost_matrix[0, 0] = np.abs(x[0] - y[0])
 
     for i in range(1, x_size):
-        if bounding_matrix[i, 0]:
+        if bounding_band[0, i] == 0 and bounding_band[1, i] > 0:
             cost = _cost_independent(x[i], x[i - 1], y[0], c)
             cost_matrix[i][0] = cost_matrix[i - 1][0] + cost
 
-    for i in range(1, y_size):
-        if bounding_matrix[0, i]:
-            cost = _cost_independent(y[i], y[i - 1], x[0], c)
-            cost_matrix[0][i] = cost_matrix[0][i - 1] + cost
+    for i in range(max(bounding_band[0, 0], 1), bounding_band[1, 0]):
+        cost = _cost_independent(y[i], y[i - 1], x[0], c)
+        cost_matrix[0][i] = cost_matrix[0][i - 1] + cost
 
     for i in range(1, x_size):
-        for j in range(1, y_size):
-            if bounding_matrix[i, j]:
-                d1 = cost_matrix[i - 1][j - 1] + np.abs(x[i] - y[j])
-                d2 = cost_matrix[i - 1][j] + _cost_independent(x[i], x[i - 1], y[j], c)
-                d3 = cost_matrix[i][j - 1] + _cost_independent(y[j], x[i], y[j - 1], c)
+        for j in range(max(bounding_band[0, i], 1), bounding_band[1, i]):
+            d1 = cost_matrix[i - 1][j - 1] + np.abs(x[i] - y[j])
+            d2 = cost_matrix[i - 1][j] + _cost_independent(x[i], x[i - 1], y[j], c)
+            d3 = cost_matrix[i][j - 1] + _cost_independent(y[j], x[i], y[j - 1], c)
 
-                cost_matrix[i, j] = min(d1, d2, d3)
+            cost_matrix[i, j] = min(d1, d2, d3)
 
     return cost_matrix
 
 
 @njit(cache=True, fastmath=True)
 def _msm_dependent_cost_matrix(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, c: float
+    x: np.ndarray, y: np.ndarray, bounding_band: np.ndarray, c: float
 ) -> np.ndarray:
     x_size = x.shape[1]
     y_size = y.shape[1]
@@ -295,29 +287,166 @@ def _msm_dependent_cost_matrix(
     cost_matrix[0, 0] = np.sum(np.abs(x[:, 0] - y[:, 0]))
 
     for i in range(1, x_size):
-        if bounding_matrix[i, 0]:
+        if bounding_band[0, i] == 0 and bounding_band[1, i] > 0:
             cost = _cost_dependent(x[:, i], x[:, i - 1], y[:, 0], c)
             cost_matrix[i][0] = cost_matrix[i - 1][0] + cost
-    for i in range(1, y_size):
-        if bounding_matrix[0, i]:
-            cost = _cost_dependent(y[:, i], y[:, i - 1], x[:, 0], c)
-            cost_matrix[0][i] = cost_matrix[0][i - 1] + cost
+    for i in range(max(bounding_band[0, 0], 1), bounding_band[1, 0]):
+        cost = _cost_dependent(y[:, i], y[:, i - 1], x[:, 0], c)
+        cost_matrix[0][i] = cost_matrix[0][i - 1] + cost
 
     for i in range(1, x_size):
-        for j in range(1, y_size):
-            if bounding_matrix[i, j]:
-                d1 = cost_matrix[i - 1][j - 1] + np.sum(np.abs(x[:, i] - y[:, j]))
-                d2 = cost_matrix[i - 1][j] + _cost_dependent(
-                    x[:, i], x[:, i - 1], y[:, j], c
-                )
-                d3 = cost_matrix[i][j - 1] + _cost_dependent(
-                    y[:, j], x[:, i], y[:, j - 1], c
-                )
-
-                cost_matrix[i, j] = min(d1, d2, d3)
+        for j in range(max(bounding_band[0, i], 1), bounding_band[1, i]):
+            d1 = cost_matrix[i - 1][j - 1] + np.sum(np.abs(x[:, i] - y[:, j]))
+            d2 = cost_matrix[i - 1][j] + _cost_dependent(
+                x[:, i], x[:, i - 1], y[:, j], c
+            )
+            d3 = cost_matrix[i][j - 1] + _cost_dependent(
+                y[:, j], x[:, i], y[:, j - 1], c
+            )
+
+            cost_matrix[i, j] = min(d1, d2, d3)
     return cost_matrix
 
 
+@njit(cache=True, fastmath=True)
+def _msm_early_abandon_distance(
+    x: np.ndarray, y: np.ndarray, independent: bool, c: float, cutoff: float
+) -> float:
+    """Compute unconstrained MSM, abandoning once it must exceed ``cutoff``.
+
+    Out of band cells of a bounded MSM cost matrix are zero rather than infinite, so
+    a partial row does not bound the final cost and this kernel only supports the
+    full (no window) bounding matrix. Returns ``np.inf`` if the distance is known to
+    be greater than ``cutoff``.
+    """
+    bounding_band = create_bounding_band(x.shape[1], y.shape[1])
+    return _msm_banded_distance(x, y, bounding_band, independent, c, cutoff)
+
+
+@njit(cache=True, fastmath=True)
+def _msm_banded_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    bounding_band: np.ndarray,
+    independent: bool,
+    c: float,
+    cutoff: float,
+) -> float:
+    """Compute MSM keeping two rows and only visiting the in bound cells.
+
+    Returns ``np.inf`` once the smallest cost in a row exceeds ``cutoff``, which is
+    only a valid bound when every row is fully in band.
+    """
+    if independent:
+        distance = 0.0
+        for i in range(x.shape[0]):
+            distance += _univariate_msm_distance(
+                x[i], y[i], bounding_band, c, cutoff - distance
+            )
+            if distance > cutoff:
+                return np.inf
+        return distance
+    return _dependent_msm_distance(x, y, bounding_band, c, cutoff)
+
+
+@njit(cache=True, fastmath=True)
+def _univariate_msm_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    bounding_band: np.ndarray,
+    c: float,
+    cutoff: float,
+) -> float:
+    x_size = x.shape[0]
+    y_size = y.shape[0]
+    prev_row = np.zeros(y_size)
+    curr_row = np.zeros(y_size)
+
+    prev_row[0] = np.abs(x[0] - y[0])
+    for j in range(max(bounding_band[0, 0], 1), bounding_band[1, 0]):
+        prev_row[j] = prev_row[j - 1] + _cost_independent(y[j], y[j - 1], x[0], c)
+    # range of each row buffer that may hold values other than zero
+    prev_lower, prev_upper = 0, max(bounding_band[1, 0], 1)
+    curr_lower, curr_upper = 0, 0
+    if np.min(prev_row[prev_lower:prev_upper]) > cutoff:
+        return np.inf
+
+    for i in range(1, x_size):
+        curr_row[curr_lower:curr_upper] = 0.0
+        row_min = np.inf
+        start = bounding_band[0, i]
+        if start == 0 and bounding_band[1, i] > 0:
+            curr_row[0] = prev_row[0] + _cost_independent(x[i], x[i - 1], y[0], c)
+            row_min = curr_row[0]
+            start = 1
+        for j in range(start, bounding_band[1, i]):
+            d1 = prev_row[j - 1] + np.abs(x[i] - y[j])
+            d2 = prev_row[j] + _cost_independent(x[i], x[i - 1], y[j], c)
+            d3 = curr_row[j - 1] + _cost_independent(y[j], x[i], y[j - 1], c)
+            curr_row[j] = min(d1, d2, d3)
+            if curr_row[j] < row_min:
+                row_min = curr_row[j]
+        if row_min > cutoff:
+            return np.inf
+        curr_lower, curr_upper = bounding_band[0, i], bounding_band[1, i]
+        prev_row, curr_row = curr_row, prev_row
+        prev_lower, curr_lower = curr_lower, prev_lower
+        prev_upper, curr_upper = curr_upper, prev_upper
+
+    return prev_row[y_size - 1]
+
+
+@njit(cache=True, fastmath=True)
+def _dependent_msm_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    bounding_band: np.ndarray,
+    c: float,
+    cutoff: float,
+) -> float:
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    prev_row = np.zeros(y_size)
+    curr_row = np.zeros(y_size)
+
+    prev_row[0] = np.sum(np.abs(x[:, 0] - y[:, 0]))
+    for j in range(max(bounding_band[0, 0], 1), bounding_band[1, 0]):
+        prev_row[j] = prev_row[j - 1] + _cost_dependent(
+            y[:, j], y[:, j - 1], x[:, 0], c
+        )
+    # range of each row buffer that may hold values other than zero
+    prev_lower, prev_upper = 0, max(bounding_band[1, 0], 1)
+    curr_lower, curr_upper = 0, 0
+    if np.min(prev_row[prev_lower:prev_upper]) > cutoff:
+        return np.inf
+
+    for i in range(1, x_size):
+        curr_row[curr_lower:curr_upper] = 0.0
+        row_min = np.inf
+        start = bounding_band[0, i]
+        if start == 0 and bounding_band[1, i] > 0:
+            curr_row[0] = prev_row[0] + _cost_dependent(
+                x[:, i], x[:, i - 1], y[:, 0], c
+            )
+            row_min = curr_row[0]
+            start = 1
+        for j in range(start, bounding_band[1, i]):
+            d1 = prev_row[j - 1] + np.sum(np.abs(x[:, i] - y[:, j]))
+            d2 = prev_row[j] + _cost_dependent(x[:, i], x[:, i - 1], y[:, j], c)
+            d3 = curr_row[j - 1] + _cost_dependent(y[:, j], x[:, i], y[:, j - 1], c)
+            curr_row[j] = min(d1, d2, d3)
+            if curr_row[j] < row_min:
+                row_min = curr_row[j]
+        if row_min > cutoff:
+            return np.inf
+        curr_lower, curr_upper = bounding_band[0, i], bounding_band[1, i]
+        prev_row, curr_row = curr_row, prev_row
+        prev_lower, curr_lower = curr_lower, prev_lower
+        prev_upper, curr_upper = curr_upper, prev_upper
+
+    return prev_row[y_size - 1]
+
+
 @njit(cache=True, fastmath=True)
 def _cost_dependent(x: np.ndarray, y: np.ndarray, z: np.ndarray, c: float) -> float:
     diameter = _univariate_squared_distance(y, z)
@@ -444,7 +573,7 @@ def msm_pairwise_distance(
     )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _msm_pairwise_distance(
     X: np.ndarray,
     window: float,
@@ -454,19 +583,19 @@ def _msm_pairwise_distance(
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         X.shape[2], X.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(i + 1, n_instances):
-            distances[i, j] = _msm_distance(X[i], X[j], bounding_matrix, independent, c)
+            distances[i, j] = _msm_distance(X[i], X[j], bounding_band, independent, c)
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _msm_from_multiple_to_multiple_distance(
     x: np.ndarray,
     y: np.ndarray,
@@ -478,13 +607,13 @@ def _msm_from_multiple_to_multiple_distance(
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         x.shape[2], y.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(m_instances):
-            distances[i, j] = _msm_distance(x[i], y[j], bounding_matrix, independent, c)
+            distances[i, j] = _msm_distance(x[i], y[j], bounding_band, independent, c)
     return distances
 
 
@@ -542,9 +671,9 @@ def msm_alignment_path(
     """
     x_size = x.shape[-1]
     y_size = y.shape[-1]
-    bounding_matrix = create_bounding_matrix(x_size, y_size, window, itakura_max_slope)
+    bounding_band = create_bounding_band(x_size, y_size, window, itakura_max_slope)
     cost_matrix = msm_cost_matrix(x, y, window, independent, c, itakura_max_slope)
 
     # Need to do this because the cost matrix contains 0s and not inf in out of bounds
-    cost_matrix = _add_inf_to_out_of_bounds_cost_matrix(cost_matrix, bounding_matrix)
+    cost_matrix = _add_inf_to_out_of_bounds_cost_matrix(cost_matrix, bounding_band)
     return compute_min_return_path(cost_matrix), cost_matrix[x_size - 1, y_size - 1]
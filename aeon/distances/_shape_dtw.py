@@ -4,10 +4,10 @@ __author__ = ["hadifawaz1999"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import compute_min_return_path
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import create_bounding_band
 from aeon.distances._dtw import _dtw_cost_matrix
 from aeon.distances._squared import _univariate_squared_distance
 from aeon.distances._utils import reshape_pairwise_to_multiple
@@ -181,7 +181,7 @@ def shape_dtw_distance(
         x_pad = _pad_ts_edges(x=_x, reach=reach)
         y_pad = _pad_ts_edges(x=_y, reach=reach)
 
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
 
@@ -190,13 +190,13 @@ def shape_dtw_distance(
             y=y_pad,
             descriptor=descriptor,
             reach=reach,
-            bounding_matrix=bounding_matrix,
+            bounding_band=bounding_band,
         )
     if x.ndim == 2 and y.ndim == 2:
         x_pad = _pad_ts_edges(x=x, reach=reach)
         y_pad = _pad_ts_edges(x=y, reach=reach)
 
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
 
@@ -205,7 +205,7 @@ def shape_dtw_distance(
             y=y_pad,
             descriptor=descriptor,
             reach=reach,
-            bounding_matrix=bounding_matrix,
+            bounding_band=bounding_band,
         )
 
     raise ValueError("x and y must be 1D or 2D")
@@ -215,16 +215,14 @@ def shape_dtw_distance(
 def _shape_dtw_distance(
     x: np.ndarray,
     y: np.ndarray,
-    bounding_matrix: np.ndarray,
+    bounding_band: np.ndarray,
     descriptor: str = "identity",
     reach: int = 30,
 ) -> float:
     new_x = _transform_subsequences(x=x, descriptor=descriptor, reach=reach)
     new_y = _transform_subsequences(x=y, descriptor=descriptor, reach=reach)
 
-    shape_dtw_cost_mat = _dtw_cost_matrix(
-        x=new_x, y=new_y, bounding_matrix=bounding_matrix
-    )
+    shape_dtw_cost_mat = _dtw_cost_matrix(x=new_x, y=new_y, bounding_band=bounding_band)
 
     return _get_shape_dtw_distance_from_cost_mat(
         x=x, y=y, reach=reach, shape_dtw_cost_mat=shape_dtw_cost_mat
@@ -313,7 +311,7 @@ def shape_dtw_cost_matrix(
         x_pad = _pad_ts_edges(x=_x, reach=reach)
         y_pad = _pad_ts_edges(x=_y, reach=reach)
 
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
 
@@ -322,13 +320,13 @@ def shape_dtw_cost_matrix(
             y=y_pad,
             descriptor=descriptor,
             reach=reach,
-            bounding_matrix=bounding_matrix,
+            bounding_band=bounding_band,
         )
     if x.ndim == 2 and y.ndim == 2:
         x_pad = _pad_ts_edges(x=x, reach=reach)
         y_pad = _pad_ts_edges(x=y, reach=reach)
 
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
 
@@ -337,7 +335,7 @@ def shape_dtw_cost_matrix(
             y=y_pad,
             descriptor=descriptor,
             reach=reach,
-            bounding_matrix=bounding_matrix,
+            bounding_band=bounding_band,
         )
 
     raise ValueError("x and y must be 1D or 2D")
@@ -347,16 +345,14 @@ def shape_dtw_cost_matrix(
 def _shape_dtw_cost_matrix(
     x: np.ndarray,
     y: np.ndarray,
-    bounding_matrix: np.ndarray,
+    bounding_band: np.ndarray,
     descriptor: str = "identity",
     reach: int = 30,
 ) -> float:
     new_x = _transform_subsequences(x=x, descriptor=descriptor, reach=reach)
     new_y = _transform_subsequences(x=y, descriptor=descriptor, reach=reach)
 
-    shapedtw_cost_mat = _dtw_cost_matrix(
-        x=new_x, y=new_y, bounding_matrix=bounding_matrix
-    )
+    shapedtw_cost_mat = _dtw_cost_matrix(x=new_x, y=new_y, bounding_band=bounding_band)
 
     return shapedtw_cost_mat
 
@@ -526,7 +522,7 @@ def shape_dtw_pairwise_distance(
         )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _shape_dtw_pairwise_distance(
     X: np.ndarray,
     y: np.ndarray = None,
@@ -539,18 +535,18 @@ def _shape_dtw_pairwise_distance(
         y = np.copy(X)
 
     distances = np.zeros(shape=(len(X), len(y)))
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         X.shape[2] - 2 * reach, y.shape[2] - 2 * reach, window, itakura_max_slope
     )
 
-    for i in range(len(X)):
+    for i in prange(len(X)):
         for j in range(len(y)):
             distances[i, j] = _shape_dtw_distance(
                 x=X[i],
                 y=y[j],
                 descriptor=descriptor,
                 reach=reach,
-                bounding_matrix=bounding_matrix,
+                bounding_band=bounding_band,
             )
 
     return distances
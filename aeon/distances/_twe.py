@@ -4,13 +4,13 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import (
     _add_inf_to_out_of_bounds_cost_matrix,
     compute_min_return_path,
 )
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import create_bounding_band
 from aeon.distances._euclidean import _univariate_euclidean_distance
 from aeon.distances._utils import reshape_pairwise_to_multiple
 
@@ -97,15 +97,15 @@ def twe_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _twe_distance(_pad_arrs(_x), _pad_arrs(_y), bounding_matrix, nu, lmbda)
+        return _twe_distance(_pad_arrs(_x), _pad_arrs(_y), bounding_band, nu, lmbda)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _twe_distance(_pad_arrs(x), _pad_arrs(y), bounding_matrix, nu, lmbda)
+        return _twe_distance(_pad_arrs(x), _pad_arrs(y), bounding_band, nu, lmbda)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -169,32 +169,71 @@ def twe_cost_matrix(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _twe_cost_matrix(
-            _pad_arrs(_x), _pad_arrs(_y), bounding_matrix, nu, lmbda
-        )
+        return _twe_cost_matrix(_pad_arrs(_x), _pad_arrs(_y), bounding_band, nu, lmbda)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _twe_cost_matrix(_pad_arrs(x), _pad_arrs(y), bounding_matrix, nu, lmbda)
+        return _twe_cost_matrix(_pad_arrs(x), _pad_arrs(y), bounding_band, nu, lmbda)
     raise ValueError("x and y must be 1D or 2D")
 
 
 @njit(cache=True, fastmath=True)
 def _twe_distance(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, nu: float, lmbda: float
+    x: np.ndarray, y: np.ndarray, bounding_band: np.ndarray, nu: float, lmbda: float
 ) -> float:
-    return _twe_cost_matrix(x, y, bounding_matrix, nu, lmbda)[
-        x.shape[1] - 2, y.shape[1] - 2
-    ]
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    prev_row = np.full(y_size, np.inf)
+    curr_row = np.zeros(y_size)
+    prev_row[0] = 0.0
+    # range of each row buffer, past the first column, that may be non zero
+    prev_lower, prev_upper = 1, y_size
+    curr_lower, curr_upper = 0, 0
+
+    del_add = nu + lmbda
+
+    for i in range(1, x_size):
+        curr_row[curr_lower:curr_upper] = 0.0
+        curr_row[0] = np.inf
+        for j in range(bounding_band[0, i - 1] + 1, bounding_band[1, i - 1] + 1):
+            # Deletion in x
+            del_x_squared_dist = _univariate_euclidean_distance(x[:, i - 1], x[:, i])
+            del_x = prev_row[j] + del_x_squared_dist + del_add
+            # Deletion in y
+            del_y_squared_dist = _univariate_euclidean_distance(y[:, j - 1], y[:, j])
+            del_y = curr_row[j - 1] + del_y_squared_dist + del_add
+
+            # Match
+            match_same_squared_d = _univariate_euclidean_distance(x[:, i], y[:, j])
+            match_prev_squared_d = _univariate_euclidean_distance(
+                x[:, i - 1], y[:, j - 1]
+            )
+            match = (
+                prev_row[j - 1]
+                + match_same_squared_d
+                + match_prev_squared_d
+                + nu * (abs(i - j) + abs((i - 1) - (j - 1)))
+            )
+
+            curr_row[j] = min(del_x, del_y, match)
+        curr_lower, curr_upper = (
+            bounding_band[0, i - 1] + 1,
+            bounding_band[1, i - 1] + 1,
+        )
+        prev_row, curr_row = curr_row, prev_row
+        prev_lower, curr_lower = curr_lower, prev_lower
+        prev_upper, curr_upper = curr_upper, prev_upper
+
+    return prev_row[y_size - 1]
 
 
 @njit(cache=True, fastmath=True)
 def _twe_cost_matrix(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, nu: float, lmbda: float
+    x: np.ndarray, y: np.ndarray, bounding_band: np.ndarray, nu: float, lmbda: float
 ) -> np.ndarray:
     x_size = x.shape[1]
     y_size = y.shape[1]
@@ -205,32 +244,27 @@ def _twe_cost_matrix(
     del_add = nu + lmbda
 
     for i in range(1, x_size):
-        for j in range(1, y_size):
-            if bounding_matrix[i - 1, j - 1]:
-                # Deletion in x
-                del_x_squared_dist = _univariate_euclidean_distance(
-                    x[:, i - 1], x[:, i]
-                )
-                del_x = cost_matrix[i - 1, j] + del_x_squared_dist + del_add
-                # Deletion in y
-                del_y_squared_dist = _univariate_euclidean_distance(
-                    y[:, j - 1], y[:, j]
-                )
-                del_y = cost_matrix[i, j - 1] + del_y_squared_dist + del_add
-
-                # Match
-                match_same_squared_d = _univariate_euclidean_distance(x[:, i], y[:, j])
-                match_prev_squared_d = _univariate_euclidean_distance(
-                    x[:, i - 1], y[:, j - 1]
-                )
-                match = (
-                    cost_matrix[i - 1, j - 1]
-                    + match_same_squared_d
-                    + match_prev_squared_d
-                    + nu * (abs(i - j) + abs((i - 1) - (j - 1)))
-                )
-
-                cost_matrix[i, j] = min(del_x, del_y, match)
+        for j in range(bounding_band[0, i - 1] + 1, bounding_band[1, i - 1] + 1):
+            # Deletion in x
+            del_x_squared_dist = _univariate_euclidean_distance(x[:, i - 1], x[:, i])
+            del_x = cost_matrix[i - 1, j] + del_x_squared_dist + del_add
+            # Deletion in y
+            del_y_squared_dist = _univariate_euclidean_distance(y[:, j - 1], y[:, j])
+            del_y = cost_matrix[i, j - 1] + del_y_squared_dist + del_add
+
+            # Match
+            match_same_squared_d = _univariate_euclidean_distance(x[:, i], y[:, j])
+            match_prev_squared_d = _univariate_euclidean_distance(
+                x[:, i - 1], y[:, j - 1]
+            )
+            match = (
+                cost_matrix[i - 1, j - 1]
+                + match_same_squared_d
+                + match_prev_squared_d
+                + nu * (abs(i - j) + abs((i - 1) - (j - 1)))
+            )
+
+            cost_matrix[i, j] = min(del_x, del_y, match)
 
     return cost_matrix[1:, 1:]
 
@@ -326,7 +360,7 @@ def twe_pairwise_distance(
     )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _twe_pairwise_distance(
     X: np.ndarray,
     window: float,
@@ -336,7 +370,7 @@ def _twe_pairwise_distance(
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         X.shape[2], X.shape[2], window, itakura_max_slope
     )
 
@@ -345,17 +379,17 @@ def _twe_pairwise_distance(
     for i in range(X.shape[0]):
         padded_X[i] = _pad_arrs(X[i])
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(i + 1, n_instances):
             distances[i, j] = _twe_distance(
-                padded_X[i], padded_X[j], bounding_matrix, nu, lmbda
+                padded_X[i], padded_X[j], bounding_band, nu, lmbda
             )
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _twe_from_multiple_to_multiple_distance(
     x: np.ndarray,
     y: np.ndarray,
@@ -367,7 +401,7 @@ def _twe_from_multiple_to_multiple_distance(
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         x.shape[2], y.shape[2], window, itakura_max_slope
     )
 
@@ -380,10 +414,10 @@ def _twe_from_multiple_to_multiple_distance(
     for i in range(y.shape[0]):
         padded_y[i] = _pad_arrs(y[i])
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(m_instances):
             distances[i, j] = _twe_distance(
-                padded_x[i], padded_y[j], bounding_matrix, nu, lmbda
+                padded_x[i], padded_y[j], bounding_band, nu, lmbda
             )
     return distances
 
@@ -440,12 +474,12 @@ def twe_alignment_path(
     >>> twe_alignment_path(x, y)
     ([(0, 0), (1, 1), (2, 2), (3, 3)], 2.0)
     """
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         x.shape[-1], y.shape[-1], window, itakura_max_slope
     )
     cost_matrix = twe_cost_matrix(x, y, window, nu, lmbda, itakura_max_slope)
     # Need to do this because the cost matrix contains 0s and not inf in out of bounds
-    cost_matrix = _add_inf_to_out_of_bounds_cost_matrix(cost_matrix, bounding_matrix)
+    cost_matrix = _add_inf_to_out_of_bounds_cost_matrix(cost_matrix, bounding_band)
     return (
         compute_min_return_path(cost_matrix),
         cost_matrix[x.shape[-1] - 1, y.shape[-1] - 1],
@@ -4,10 +4,10 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import compute_min_return_path
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import create_bounding_band
 from aeon.distances._squared import _univariate_squared_distance
 from aeon.distances._utils import reshape_pairwise_to_multiple
 
@@ -92,15 +92,15 @@ def wdtw_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _wdtw_distance(_x, _y, bounding_matrix, g)
+        return _wdtw_distance(_x, _y, bounding_band, g)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _wdtw_distance(x, y, bounding_matrix, g)
+        return _wdtw_distance(x, y, bounding_band, g)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -183,28 +183,28 @@ def wdtw_cost_matrix(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _wdtw_cost_matrix(_x, _y, bounding_matrix, g)
+        return _wdtw_cost_matrix(_x, _y, bounding_band, g)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        bounding_band = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _wdtw_cost_matrix(x, y, bounding_matrix, g)
+        return _wdtw_cost_matrix(x, y, bounding_band, g)
     raise ValueError("x and y must be 1D or 2D")
 
 
 @njit(cache=True, fastmath=True)
 def _wdtw_distance(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, g: float
+    x: np.ndarray, y: np.ndarray, bounding_band: np.ndarray, g: float
 ) -> float:
-    return _wdtw_cost_matrix(x, y, bounding_matrix, g)[x.shape[1] - 1, y.shape[1] - 1]
+    return _wdtw_early_abandon_distance(x, y, bounding_band, g, np.inf)
 
 
 @njit(cache=True, fastmath=True)
 def _wdtw_cost_matrix(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, g: float
+    x: np.ndarray, y: np.ndarray, bounding_band: np.ndarray, g: float
 ) -> np.ndarray:
     x_size = x.shape[1]
     y_size = y.shape[1]
@@ -217,19 +217,62 @@ def _wdtw_cost_matrix(
     )
 
     for i in range(x_size):
-        for j in range(y_size):
-            if bounding_matrix[i, j]:
-                cost_matrix[i + 1, j + 1] = _univariate_squared_distance(
-                    x[:, i], y[:, j]
-                ) * weight_vector[abs(i - j)] + min(
-                    cost_matrix[i, j + 1],
-                    cost_matrix[i + 1, j],
-                    cost_matrix[i, j],
-                )
+        for j in range(bounding_band[0, i], bounding_band[1, i]):
+            cost_matrix[i + 1, j + 1] = _univariate_squared_distance(
+                x[:, i], y[:, j]
+            ) * weight_vector[abs(i - j)] + min(
+                cost_matrix[i, j + 1],
+                cost_matrix[i + 1, j],
+                cost_matrix[i, j],
+            )
 
     return cost_matrix[1:, 1:]
 
 
+@njit(cache=True, fastmath=True)
+def _wdtw_early_abandon_distance(
+    x: np.ndarray, y: np.ndarray, bounding_band: np.ndarray, g: float, cutoff: float
+) -> float:
+    """Compute WDTW keeping two rows, abandoning once a row exceeds ``cutoff``.
+
+    Only the in bound cells of each row are visited. Returns ``np.inf`` if the
+    distance is known to be greater than ``cutoff``.
+    """
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    prev_row = np.full(y_size + 1, np.inf)
+    curr_row = np.full(y_size + 1, np.inf)
+    prev_row[0] = 0.0
+    # range of each row buffer that may hold values other than inf
+    prev_lower, prev_upper = 0, 1
+    curr_lower, curr_upper = 0, 0
+
+    max_size = max(x_size, y_size)
+    weight_vector = np.array(
+        [1 / (1 + np.exp(-g * (i - max_size / 2))) for i in range(0, max_size)]
+    )
+
+    for i in range(x_size):
+        curr_row[curr_lower:curr_upper] = np.inf
+        row_min = np.inf
+        for j in range(bounding_band[0, i], bounding_band[1, i]):
+            curr_row[j + 1] = _univariate_squared_distance(
+                x[:, i], y[:, j]
+            ) * weight_vector[abs(i - j)] + min(
+                prev_row[j + 1], curr_row[j], prev_row[j]
+            )
+            if curr_row[j + 1] < row_min:
+                row_min = curr_row[j + 1]
+        if row_min > cutoff:
+            return np.inf
+        curr_lower, curr_upper = bounding_band[0, i] + 1, bounding_band[1, i] + 1
+        prev_row, curr_row = curr_row, prev_row
+        prev_lower, curr_lower = curr_lower, prev_lower
+        prev_upper, curr_upper = curr_upper, prev_upper
+
+    return prev_row[y_size]
+
+
 @njit(cache=True, fastmath=True)
 def wdtw_pairwise_distance(
     X: np.ndarray,
@@ -309,25 +352,25 @@ def wdtw_pairwise_distance(
     )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _wdtw_pairwise_distance(
     X: np.ndarray, window: float, g: float, itakura_max_slope: float
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         X.shape[2], X.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(i + 1, n_instances):
-            distances[i, j] = _wdtw_distance(X[i], X[j], bounding_matrix, g)
+            distances[i, j] = _wdtw_distance(X[i], X[j], bounding_band, g)
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _wdtw_from_multiple_to_multiple_distance(
     x: np.ndarray,
     y: np.ndarray,
@@ -338,13 +381,13 @@ def _wdtw_from_multiple_to_multiple_distance(
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
+    bounding_band = create_bounding_band(
         x.shape[2], y.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(m_instances):
-            distances[i, j] = _wdtw_distance(x[i], y[j], bounding_matrix, g)
+            distances[i, j] = _wdtw_distance(x[i], y[j], bounding_band, g)
     return distances
 
 
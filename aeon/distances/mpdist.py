@@ -1,6 +1,8 @@
 """Matrix Profile Distances."""
 import numpy as np
 
+from aeon.utils.numba.matrix_profile import matrix_profile_ab_join
+
 
 def sliding_dot_products(q, t, q_len, t_len):
     """
@@ -106,58 +108,8 @@ def stomp_ab(ts1, ts2, m):
         ip: numpy.array
             Array with the index of the nearest neighbor of ts1 in ts2.
     """
-    len1 = len(ts1)
-    len2 = len(ts2)
-
-    ts1 = ts1.flatten()
-    ts2 = ts2.flatten()
-
-    # Number of subsequences
-    n_ts1_subs = len1 - m + 1
-    n_ts2_subs = len2 - m + 1
-
-    # Compute the mean and standard deviation
-    ts1_mean = [np.mean(ts1[i : i + m]) for i in range(0, n_ts1_subs)]
-    ts1_std = [np.std(ts1[i : i + m]) for i in range(0, n_ts1_subs)]
-
-    ts2_mean = [np.mean(ts2[i : i + m]) for i in range(0, n_ts2_subs)]
-    ts2_std = [np.std(ts2[i : i + m]) for i in range(0, n_ts2_subs)]
-
-    # Compute the dot products between the first ts2 subsequence and every
-    # ts1 subsequence
-    dot_prod = sliding_dot_products(ts2[0:m], ts1, m, len1)
-    first_dot_prod = np.copy(dot_prod)
-
-    # Initialization
-    mp = np.full(n_ts1_subs, float("inf"))  # matrix profile
-    ip = np.zeros(n_ts1_subs)  # index profile
-
-    # Compute the distance profile for the first ts1 subsequence
-    dot_prod = sliding_dot_products(ts1[0:m], ts2, m, len2)
-    dp = calculate_distance_profile(
-        dot_prod, ts1_mean[0], ts1_std[0], ts2_mean, ts2_std, m, n_ts2_subs
-    )
-
-    # Updates the matrix profile
-    mp[0] = np.amin(dp)
-    ip[0] = np.argmin(dp)
-
-    for i in range(1, n_ts1_subs):
-        for j in range(n_ts2_subs - 1, 0, -1):
-            dot_prod[j] = (
-                dot_prod[j - 1]
-                - ts2[j - 1] * ts1[i - 1]
-                + ts2[j - 1 + m] * ts1[i - 1 + m]
-            )  # compute the next dot products
-            # using the previous ones
-        dot_prod[0] = first_dot_prod[i]
-        dp = calculate_distance_profile(
-            dot_prod, ts1_mean[i], ts1_std[i], ts2_mean, ts2_std, m, n_ts2_subs
-        )
-        mp[i] = np.amin(dp)
-        ip[i] = np.argmin(dp)
-
-    return mp, ip
+    mp, ip, _, _ = matrix_profile_ab_join(ts1, ts2, m)
+    return mp, ip.astype(float)
 
 
 def mpdist(ts1, ts2, m=0):
@@ -188,8 +140,8 @@ def mpdist(ts1, ts2, m=0):
             m = len2 / 4
 
     threshold = 0.05
-    mp_ab, ip_ab = stomp_ab(ts1, ts2, m)  # compute the AB matrix profile
-    mp_ba, ip_ba = stomp_ab(ts2, ts1, m)  # compute the BA matrix profile
+    # The AB and BA matrix profiles come from the same distances
+    mp_ab, _, mp_ba, _ = matrix_profile_ab_join(ts1, ts2, int(m))
 
     join_mp = np.concatenate([mp_ab, mp_ba])
 
@@ -1,8 +1,9 @@
 __author__ = ["chrisholder"]
 
 import numpy as np
+import pytest
 
-from aeon.distances import create_bounding_matrix
+from aeon.distances import create_bounding_band, create_bounding_matrix
 
 
 def test_full_bounding():
@@ -28,3 +29,34 @@ def test_window_bounding():
 def test_itakura_parallelogram():
     matrix = create_bounding_matrix(10, 10, itakura_max_slope=0.2)
     assert isinstance(matrix, np.ndarray)
+
+
+@pytest.mark.parametrize(
+    "x_size, y_size, params, expected",
+    [
+        (4, 5, {}, [[0, 0, 0, 0], [5, 5, 5, 5]]),
+        (6, 6, {"window": 0.5}, [[0, 0, 0, 0, 1, 2], [4, 5, 6, 6, 6, 6]]),
+        (4, 7, {"window": 0.5}, [[0, 0, 0, 1], [6, 7, 7, 7]]),
+        # rows beyond the length of the shorter series are out of bounds
+        (7, 4, {"window": 0.5}, [[0, 0, 0, 1, 0, 0, 0], [4, 4, 4, 4, 0, 0, 0]]),
+        (
+            6,
+            6,
+            {"itakura_max_slope": 0.5},
+            [[0, 1, 1, 1, 2, 5], [1, 4, 5, 5, 5, 6]],
+        ),
+        (5, 8, {"itakura_max_slope": 0.5}, [[0, 1, 2, 4, 7], [1, 4, 6, 7, 8]]),
+    ],
+)
+def test_bounding_band(x_size, y_size, params, expected):
+    """Test the band against explicit Sakoe-Chiba and Itakura bands."""
+    band = create_bounding_band(x_size, y_size, **params)
+    assert band.shape == (2, x_size)
+    np.testing.assert_array_equal(band, expected)
+
+
+def test_bounding_band_window_size():
+    """Test the number of cells in a Sakoe-Chiba band."""
+    # |i - j| <= 2 on a 10 x 10 grid
+    band = create_bounding_band(10, 10, window=0.2)
+    assert np.sum(band[1] - band[0]) == 44
@@ -0,0 +1,62 @@
+"""Tests for the lower bounded nearest neighbour search."""
+import numpy as np
+import pytest
+
+from aeon.distances import dtw_distance, msm_distance, wdtw_distance
+from aeon.distances._lower_bound import (
+    _lb_improved,
+    _lb_keogh,
+    _lb_kim,
+    _LowerBoundSearch,
+)
+
+DISTANCES = [
+    ("dtw", dtw_distance, {}),
+    ("dtw", dtw_distance, {"window": 0.1}),
+    ("dtw", dtw_distance, {"itakura_max_slope": 0.3}),
+    ("wdtw", wdtw_distance, {"g": 0.1, "window": 0.2}),
+    ("wdtw", wdtw_distance, {"g": -0.1}),
+    ("msm", msm_distance, {}),
+    ("msm", msm_distance, {"independent": False}),
+]
+
+
+@pytest.mark.parametrize("metric, distance, params", DISTANCES)
+@pytest.mark.parametrize("n_channels", [1, 3])
+def test_lower_bound_search(metric, distance, params, n_channels):
+    """Test the search finds the nearest neighbours and the bounds hold."""
+    rng = np.random.default_rng(0)
+    X = np.cumsum(rng.normal(size=(30, n_channels, 25)), axis=2)
+    x = np.cumsum(rng.normal(size=(n_channels, 25)), axis=1)
+    full = np.array([distance(x, X[i], **params) for i in range(len(X))])
+
+    search = _LowerBoundSearch(metric, params).fit(X)
+    for n_neighbors in [1, 4]:
+        _, dist = search.kneighbors(x, n_neighbors)
+        np.testing.assert_allclose(np.sort(dist), np.sort(full)[:n_neighbors])
+
+    for i in range(len(X)):
+        kim = _lb_kim(x, X[i], search.metric_, search.c_, search.independent_)
+        assert kim * search.scale_ <= full[i] + 1e-8
+        if search.use_envelopes_:
+            keogh = _lb_keogh(x, search.X_lower_[i], search.X_upper_[i], np.inf)
+            improved = keogh + _lb_improved(
+                x,
+                X[i],
+                search.X_lower_[i],
+                search.X_upper_[i],
+                search.col_lower_idx_,
+                search.col_upper_idx_,
+            )
+            assert keogh <= improved
+            assert improved * search.scale_ <= full[i] + 1e-8
+
+
+def test_lower_bound_search_supports():
+    """Test the settings the search can not be used for."""
+    X = np.random.default_rng(0).normal(size=(5, 1, 10))
+    assert _LowerBoundSearch.supports("dtw", {}, X)
+    assert not _LowerBoundSearch.supports("erp", {}, X)
+    assert not _LowerBoundSearch.supports(dtw_distance, {}, X)
+    assert not _LowerBoundSearch.supports("dtw", {}, list(X))
+    assert not _LowerBoundSearch.supports("msm", {"window": 0.2}, X)
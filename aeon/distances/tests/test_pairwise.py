@@ -274,3 +274,19 @@ def test_new_single_to_multiple_distances(dist):
         dist["distance"],
         dist["pairwise_distance"],
     )
+
+
+@pytest.mark.parametrize("dist", DISTANCES)
+def test_pairwise_distance_n_jobs(dist):
+    """Test pairwise distance is the same for single and multiple threads."""
+    x = create_test_distance_numpy(6, 2, 8)
+    y = create_test_distance_numpy(4, 2, 8, random_state=2)
+
+    assert_almost_equal(
+        compute_pairwise_distance(x, metric=dist["name"], n_jobs=2),
+        compute_pairwise_distance(x, metric=dist["name"], n_jobs=1),
+    )
+    assert_almost_equal(
+        compute_pairwise_distance(x, y, metric=dist["name"], n_jobs=-1),
+        compute_pairwise_distance(x, y, metric=dist["name"]),
+    )
@@ -1740,6 +1740,11 @@ class BaseForecaster(BaseEstimator):
         kwargs["rowname_default"] = "forecasters"
         kwargs["colname_default"] = "forecasters"
 
+        # parallel backend for the loop, from config
+        config = self.get_config()
+        kwargs["backend"] = config["backend:parallel"]
+        kwargs["backend_params"] = config["backend:parallel:params"]
+
         # fit-like methods: write y to self._yvec; then run method; clone first if fit
         if methodname in FIT_METHODS:
             self._yvec = y
@@ -111,12 +111,12 @@ def _evaluate_window(
     strategy,
     scoring,
     return_data,
-    score_name,
+    score_names,
     error_score,
     cutoff_dtype,
 ):
     # set default result values in case estimator fitting fails
-    score = error_score
+    scores = [error_score] * len(scoring)
     fit_time = np.nan
     pred_time = np.nan
     cutoff = pd.Period(pd.NaT) if cutoff_dtype.startswith("period") else pd.NA
@@ -141,28 +141,31 @@ def _evaluate_window(
         fit_time = time.perf_counter() - start_fit
 
         pred_type = {
-            "pred_quantiles": "forecaster.predict_quantiles",
-            "pred_intervals": "forecaster.predict_interval",
-            "pred_proba": "forecaster.predict_proba",
-            None: "forecaster.predict",
+            "pred_quantiles": "predict_quantiles",
+            "pred_interval": "predict_interval",
+            "pred_proba": "predict_proba",
+            None: "predict",
         }
-        # predict
+        # predict, once for each distinct prediction type and metric arguments
         start_pred = time.perf_counter()
-
-        if hasattr(scoring, "metric_args"):
-            metric_args = scoring.metric_args
-
-        try:
-            scitype = scoring.get_tag("y_input_type_pred")
-        except ValueError:
-            # If no scitype exists then metric is not proba and no args needed
-            scitype = None
-            metric_args = {}
-
-        y_pred = eval(pred_type[scitype])(fh, X_test, **metric_args)
+        y_preds = {}
+        pred_keys = []
+        for s in scoring:
+            scitype = s.get_tag("y_input_type_pred", raise_error=False)
+            metric_args = getattr(s, "metric_args", {}) if scitype else {}
+            key = (scitype, repr(metric_args))
+            if key not in y_preds:
+                predict = getattr(forecaster, pred_type[scitype])
+                y_preds[key] = predict(fh, X_test, **metric_args)
+            pred_keys.append(key)
         pred_time = time.perf_counter() - start_pred
-        # score
-        score = scoring(y_test, y_pred, y_train=y_train)
+
+        # score, the prediction for the first metric is returned if return_data
+        y_pred = y_preds[pred_keys[0]]
+        scores = [
+            s(y_test, y_preds[key], y_train=y_train)
+            for s, key in zip(scoring, pred_keys)
+        ]
         # get cutoff
         cutoff = forecaster.cutoff
 
@@ -186,18 +189,18 @@ def _evaluate_window(
     else:
         cutoff_ind = cutoff[0]
 
-    result = pd.DataFrame(
+    result = dict(zip(score_names, scores))
+    result.update(
         {
-            score_name: [score],
-            "fit_time": [fit_time],
-            "pred_time": [pred_time],
-            "len_train_window": [len(y_train)],
-            "cutoff": [cutoff_ind],
-            "y_train": [y_train if return_data else pd.NA],
-            "y_test": [y_test if return_data else pd.NA],
-            "y_pred": [y_pred if return_data else pd.NA],
+            "fit_time": fit_time,
+            "pred_time": pred_time,
+            "len_train_window": len(y_train),
+            "cutoff": cutoff_ind,
+            "y_train": y_train if return_data else pd.NA,
+            "y_test": y_test if return_data else pd.NA,
+            "y_pred": y_pred if return_data else pd.NA,
         }
-    ).astype({"cutoff": cutoff_dtype})
+    )
 
     # Return forecaster if "update"
     if strategy == "update":
@@ -206,6 +209,11 @@ def _evaluate_window(
         return result
 
 
+def _results_frame(results, cutoff_dtype):
+    """Build the evaluation results frame from the window results in one go."""
+    return pd.DataFrame(results).astype({"cutoff": cutoff_dtype})
+
+
 def evaluate(
     forecaster,
     cv,
@@ -240,6 +248,9 @@ def evaluate(
         default=None. Used to get a score function that takes y_pred and y_test
         arguments and accept y_train as keyword argument.
         If None, then uses scoring = MeanAbsolutePercentageError().
+        If a list, all metrics are computed from a single fit and predict in each
+        window, with one prediction per distinct prediction type the metrics need,
+        e.g., one `predict` for all point forecast metrics.
     return_data : bool, default=False
         Returns three additional columns in the DataFrame, by default False.
         The cells of the columns contain each a pd.Series for y_train,
@@ -280,7 +291,8 @@ def evaluate(
         - y_train: (pd.Series) only present if see `return_data=True`
           train fold of the i-th split in `cv`, used to fit/update the forecaster.
         - y_pred: (pd.Series) present if see `return_data=True`
-          forecasts from fitted forecaster for the i-th test fold indices of `cv`.
+          forecasts from fitted forecaster for the i-th test fold indices of `cv`,
+          of the prediction type used by the first metric in `scoring`.
         - y_test: (pd.Series) present if see `return_data=True`
           testing fold of the i-th split in `cv`, used to compute the metric.
 
@@ -336,7 +348,7 @@ def evaluate(
     if isinstance(scoring, List):
         scoring = [check_scoring(s) for s in scoring]
     else:
-        scoring = check_scoring(scoring)
+        scoring = [check_scoring(scoring)]
 
     ALLOWED_SCITYPES = ["Series", "Panel", "Hierarchical"]
 
@@ -367,21 +379,17 @@ def evaluate(
             )
         X = convert_to(X, to_type=PANDAS_MTYPES)
 
-    score_name = (
-        f"test_{scoring.name}"
-        if not isinstance(scoring, List)
-        else f"test_{scoring[0].name}"
-    )
+    score_names = [f"test_{s.name}" for s in scoring]
     cutoff_dtype = str(y.index.dtype)
     _evaluate_window_kwargs = {
         "fh": cv.fh,
         "freq": freq,
         "forecaster": forecaster,
-        "scoring": scoring if not isinstance(scoring, List) else scoring[0],
+        "scoring": scoring,
         "strategy": strategy,
-        "return_data": True,
+        "return_data": return_data,
         "error_score": error_score,
-        "score_name": score_name,
+        "score_names": score_names,
         "cutoff_dtype": cutoff_dtype,
     }
 
@@ -409,7 +417,7 @@ def evaluate(
                     **_evaluate_window_kwargs,
                 )
             results.append(result)
-        results = pd.concat(results)
+        results = _results_frame(results, cutoff_dtype)
 
     elif backend == "dask":
         # Use Dask delayed instead of joblib,
@@ -419,20 +427,19 @@ def evaluate(
 
         results = []
         for i, (train, test) in enumerate(cv.split(y)):
-            results.append(
-                dask_delayed(_evaluate_window)(
-                    y,
-                    X,
-                    train,
-                    test,
-                    i,
-                    **_evaluate_window_kwargs,
-                )
+            result = dask_delayed(_evaluate_window)(
+                y,
+                X,
+                train,
+                test,
+                i,
+                **_evaluate_window_kwargs,
             )
+            results.append(dask_delayed(_results_frame)([result], cutoff_dtype))
         results = dd.from_delayed(
             results,
             meta={
-                score_name: "float",
+                **{score_name: "float" for score_name in score_names},
                 "fit_time": "float",
                 "pred_time": "float",
                 "len_train_window": "int",
@@ -460,17 +467,7 @@ def evaluate(
             )
             for i, (train, test) in enumerate(cv.split(y))
         )
-        results = pd.concat(results)
-
-    if isinstance(scoring, List):
-        for s in scoring[1:]:
-            results[f"test_{s.name}"] = np.nan
-            for row in range(len(results)):
-                results[f"test_{s.name}"].iloc[row] = s(
-                    results["y_test"].iloc[row],
-                    results["y_pred"].iloc[row],
-                    y_train=results["y_train"].iloc[row],
-                )
+        results = _results_frame(results, cutoff_dtype)
 
     if not return_data:
         results = results.drop(columns=["y_train", "y_test", "y_pred"])
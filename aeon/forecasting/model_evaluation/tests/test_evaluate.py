@@ -277,3 +277,22 @@ def test_evaluate_hierarchical(backend):
 
     scoring_name = f"test_{scoring.name}"
     assert np.all(out_exog[scoring_name] != out_no_exog[scoring_name])
+
+
+def test_scoring_list_single_pass():
+    """Test that a list of metrics gives the scores of separate evaluations."""
+    from aeon.forecasting.naive import NaiveVariance
+    from aeon.performance_metrics.forecasting import MeanSquaredError
+    from aeon.performance_metrics.forecasting.probabilistic import PinballLoss
+
+    y = load_airline()
+    forecaster = NaiveVariance(NaiveForecaster())
+    cv = ExpandingWindowSplitter(initial_window=24, step_length=24, fh=[1, 2, 3])
+    scoring = [MeanSquaredError(), PinballLoss(), MeanAbsoluteScaledError()]
+
+    out = evaluate(forecaster=forecaster, y=y, cv=cv, scoring=scoring)
+    for s in scoring:
+        out_s = evaluate(forecaster=forecaster, y=y, cv=cv, scoring=s)
+        np.testing.assert_array_equal(
+            out[f"test_{s.name}"].to_numpy(), out_s[f"test_{s.name}"].to_numpy()
+        )
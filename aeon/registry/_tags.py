@@ -330,7 +330,7 @@ ESTIMATOR_TAG_REGISTER = [
     ),
     (
         "remember_data",
-        ["forecaster", "transformer"],
+        ["forecaster", "transformer", "series-annotator"],
         "bool",
         "whether estimator remembers all data seen as self._X, self._y, etc",
     ),
@@ -11,9 +11,11 @@ __all__ = ["KNeighborsTimeSeriesRegressor"]
 import numpy as np
 
 from aeon.distances import get_distance_function
+from aeon.distances._lower_bound import _LowerBoundSearch
 from aeon.regression.base import BaseRegressor
 
 WEIGHTS_SUPPORTED = ["uniform", "distance"]
+SEARCH_STRATEGIES_SUPPORTED = ["brute", "lower_bound"]
 
 
 class KNeighborsTimeSeriesRegressor(BaseRegressor):
@@ -46,6 +48,15 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
             output must be mxn array if X is array of m Series, X2 of n Series.
     distance_params : dict, default = None
         Dictionary for metric parameters , in case that distance is a str.
+    search_strategy : str, default="brute"
+        How the nearest neighbours of a case are found, one of:
+            'brute' computes the distance to every training case.
+            'lower_bound' visits the training cases in order of a lower bound,
+            skips cases whose LB_Kim, LB_Keogh or LB_Improved bound rules them out
+            and early abandons the distance computation once it exceeds the current
+            k-th best distance. Gives the same neighbours as 'brute'. It is used
+            for the 'dtw', 'wdtw' and 'msm' (without a window) distances on equal
+            length series, other settings fall back to 'brute'.
 
     Examples
     --------
@@ -72,6 +83,7 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
         distance_params=None,
         n_neighbors=1,
         weights="uniform",
+        search_strategy="brute",
     ):
         self.distance = distance
         self.distance_params = distance_params
@@ -84,6 +96,13 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
             )
         self.weights = weights
 
+        if search_strategy not in SEARCH_STRATEGIES_SUPPORTED:
+            raise ValueError(
+                f"Unrecognised kNN search_strategy: {search_strategy}. "
+                f"Allowed values are: {SEARCH_STRATEGIES_SUPPORTED}. "
+            )
+        self.search_strategy = search_strategy
+
         self._distance_params = distance_params
         if self._distance_params is None:
             self._distance_params = {}
@@ -107,6 +126,12 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
             self.metric_ = get_distance_function(metric=self.distance)
 
         self.X_ = X
+        self._search = None
+        if self.search_strategy == "lower_bound" and _LowerBoundSearch.supports(
+            self.distance, self._distance_params, X
+        ):
+            self._search = _LowerBoundSearch(self.distance, self._distance_params)
+            self._search.fit(X)
         self.y_ = y
         return self
 
@@ -155,23 +180,27 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
         ws : array
             Array representing the weights of each neighbor.
         """
-        distances = np.array(
-            [
-                self.metric_(X, self.X_[j], **self._distance_params)
-                for j in range(len(self.X_))
-            ]
-        )
-
-        # Find indices of k nearest neighbors using partitioning:
-        # [0..k-1], [k], [k+1..n-1]
-        # They might not be ordered within themselves,
-        # but it is not necessary and partitioning is
-        # O(n) while sorting is O(nlogn)
-        closest_idx = np.argpartition(distances, self.n_neighbors)
-        closest_idx = closest_idx[: self.n_neighbors]
+        if self._search is not None and X.shape == self.X_.shape[1:]:
+            closest_idx, closest_dist = self._search.kneighbors(X, self.n_neighbors)
+        else:
+            distances = np.array(
+                [
+                    self.metric_(X, self.X_[j], **self._distance_params)
+                    for j in range(len(self.X_))
+                ]
+            )
+
+            # Find indices of k nearest neighbors using partitioning:
+            # [0..k-1], [k], [k+1..n-1]
+            # They might not be ordered within themselves,
+            # but it is not necessary and partitioning is
+            # O(n) while sorting is O(nlogn)
+            closest_idx = np.argpartition(distances, self.n_neighbors)
+            closest_idx = closest_idx[: self.n_neighbors]
+            closest_dist = distances[closest_idx]
 
         if self.weights == "distance":
-            ws = distances[closest_idx]
+            ws = closest_dist
             ws = ws**2
 
             # Using epsilon ~= 0 to avoid division by zero
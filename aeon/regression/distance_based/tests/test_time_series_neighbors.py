@@ -23,3 +23,19 @@ def test_knn_neighbors():
     y_pred_expected = np.array([-216.06541863, -4.54133078, -324.7624233])
 
     assert np.abs(y_pred - y_pred_expected).max() < 1e-6
+
+
+def test_knn_lower_bound_search():
+    """Test the lower bound search gives the same predictions as brute force."""
+    rng = np.random.default_rng(0)
+    X = np.cumsum(rng.normal(size=(30, 2, 40)), axis=2)
+    y = rng.normal(size=30)
+
+    brute = KNeighborsTimeSeriesRegressor(n_neighbors=3, weights="distance")
+    pruned = KNeighborsTimeSeriesRegressor(
+        n_neighbors=3, weights="distance", search_strategy="lower_bound"
+    )
+    brute.fit(X[:20], y[:20])
+    pruned.fit(X[:20], y[:20])
+
+    np.testing.assert_allclose(brute.predict(X[20:]), pruned.predict(X[20:]))
@@ -1,7 +1,12 @@
 """BaseSimilaritySearch."""
 
 __author__ = ["baraline"]
-__all__ = ["BaseSimiliaritySearch", "TopKSimilaritySearch"]
+__all__ = [
+    "BaseSimiliaritySearch",
+    "RangeSimilaritySearch",
+    "TopKSimilaritySearch",
+]
 
 from aeon.similarity_search.base import BaseSimiliaritySearch
+from aeon.similarity_search.range_similarity import RangeSimilaritySearch
 from aeon.similarity_search.top_k_similarity import TopKSimilaritySearch
@@ -20,6 +20,9 @@ class DummySimilaritySearch(BaseSimiliaritySearch):
     store_distance_profile : bool, default = =False.
         Whether to store the computed distance profile in the attribute
         "_distance_profile" after calling the predict method.
+    n_jobs : int, default=1
+        The number of threads used by ``predict_batch`` to process the queries.
+        ``-1`` means using all processors.
 
     Attributes
     ----------
@@ -44,12 +47,17 @@ class DummySimilaritySearch(BaseSimiliaritySearch):
     """
 
     def __init__(
-        self, distance="euclidean", normalize=False, store_distance_profile=False
+        self,
+        distance="euclidean",
+        normalize=False,
+        store_distance_profile=False,
+        n_jobs=1,
     ):
         super(DummySimilaritySearch, self).__init__(
             distance=distance,
             normalize=normalize,
             store_distance_profile=store_distance_profile,
+            n_jobs=n_jobs,
         )
 
     def _fit(self, X, y):
@@ -90,21 +98,7 @@ class DummySimilaritySearch(BaseSimiliaritySearch):
             An array containing the index of the best match between q and _X.
 
         """
-        if self.normalize:
-            distance_profile = self.distance_profile_function(
-                self._X,
-                q,
-                mask,
-                self._X_means,
-                self._X_stds,
-                self._q_means,
-                self._q_stds,
-            )
-        else:
-            distance_profile = self.distance_profile_function(self._X, q, mask)
-
-        if self.store_distance_profile:
-            self._distance_profile = distance_profile
+        distance_profile = self._compute_distance_profile(q, mask)
 
         # For now, deal with the multidimensional case as "dependent", so we sum.
         search_size = distance_profile.shape[-1]
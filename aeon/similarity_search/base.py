@@ -7,13 +7,18 @@ from collections.abc import Iterable
 from typing import final
 
 import numpy as np
+from joblib import Parallel, delayed
 
 from aeon.base import BaseEstimator
 from aeon.similarity_search.distance_profiles import (
+    mass_euclidean_profile,
     naive_euclidean_profile,
+    normalized_mass_euclidean_profile,
     normalized_naive_euclidean_profile,
 )
+from aeon.similarity_search.distance_profiles.mass_euclidean import _sliding_square_sums
 from aeon.utils.numba.general import sliding_mean_std_one_series
+from aeon.utils.validation import check_n_jobs
 
 
 class BaseSimiliaritySearch(BaseEstimator, ABC):
@@ -23,12 +28,17 @@ class BaseSimiliaritySearch(BaseEstimator, ABC):
     Parameters
     ----------
     distance : str, default ="euclidean"
-        Name of the distance function to use.
+        Name of the distance function to use. "euclidean" computes the distance
+        profile in a brute force way, "mass" computes the same euclidean distance
+        profile with FFT, which is faster for long queries.
     normalize : bool, default = False
         Whether the distance function should be z-normalized.
     store_distance_profile : bool, default = False.
         Whether to store the computed distance profile in the attribute
         "_distance_profile" after calling the predict method.
+    n_jobs : int, default=1
+        The number of threads used by ``predict_batch`` to process the queries.
+        ``-1`` means using all processors.
 
     Attributes
     ----------
@@ -38,6 +48,10 @@ class BaseSimiliaritySearch(BaseEstimator, ABC):
         The function used to compute the distance profile affected
         during the fit method based on the distance and normalize
         parameters.
+    _index : dict
+        Statistics of ``_X`` that do not depend on the query values, indexed by query
+        length. They are computed the first time a query of a given length is seen
+        and reused by all the following queries of that length.
     """
 
     _tags = {
@@ -46,11 +60,16 @@ class BaseSimiliaritySearch(BaseEstimator, ABC):
     }
 
     def __init__(
-        self, distance="euclidean", normalize=False, store_distance_profile=False
+        self,
+        distance="euclidean",
+        normalize=False,
+        store_distance_profile=False,
+        n_jobs=1,
     ):
         self.distance = distance
         self.normalize = normalize
         self.store_distance_profile = store_distance_profile
+        self.n_jobs = n_jobs
         super(BaseSimiliaritySearch, self).__init__()
 
     def _get_distance_profile_function(self):
@@ -61,20 +80,104 @@ class BaseSimiliaritySearch(BaseEstimator, ABC):
             )
         return dist_profile[self.normalize]
 
-    def _store_mean_std_from_inputs(self, q_length):
-        n_instances, n_channels, X_length = self._X.shape
-        search_space_size = X_length - q_length + 1
+    def _get_index(self, q_length):
+        """
+        Get the statistics of _X used by the distance profile for a query length.
+
+        The returned dictionary is given as keyword arguments to the distance profile
+        function. It is built once per query length and kept in ``_index``.
+
+        Parameters
+        ----------
+        q_length : int
+            Length of the query.
+
+        Returns
+        -------
+        dict
+            Keyword arguments of the distance profile function that only depend on
+            _X and on the query length.
+        """
+        index = self._index.get(q_length)
+        if index is not None:
+            return index
+
+        index = {}
+        if self.normalize:
+            n_instances, n_channels, X_length = self._X.shape
+            search_space_size = X_length - q_length + 1
+
+            means = np.zeros((n_instances, n_channels, search_space_size))
+            stds = np.zeros((n_instances, n_channels, search_space_size))
+
+            for i in range(n_instances):
+                _mean, _std = sliding_mean_std_one_series(self._X[i], q_length, 1)
+                stds[i] = _std
+                means[i] = _mean
+
+            index["X_means"] = means
+            index["X_stds"] = stds
+
+        if self.distance == "mass":
+            # The FFT of _X does not depend on the query length, only the sums of
+            # squares of the subsequences do.
+            index["X_fft"] = self._X_fft
+            if not self.normalize:
+                index["X_sq_sums"] = _sliding_square_sums(self._X, q_length)
+
+        self._index[q_length] = index
+        return index
 
-        means = np.zeros((n_instances, n_channels, search_space_size))
-        stds = np.zeros((n_instances, n_channels, search_space_size))
+    def _compute_distance_profile(self, q, mask, instances=None, threshold=np.inf):
+        """
+        Compute the distance profile of q using the statistics cached in the index.
+
+        Parameters
+        ----------
+        q :  array, shape (n_channels, q_length)
+            Input query used for similarity search.
+        mask : array, shape (n_instances, n_channels, n_timestamps - (q_length - 1))
+            Boolean mask of the shape of the distance profile indicating for which part
+            of it the distance should be computed.
+        instances : slice, default=None
+            If given, only compute the distance profile for these instances of _X. The
+            distance profile is then not stored, even if store_distance_profile is
+            True.
+        threshold : float, default=np.inf
+            Candidates for which the sum of the distances over the channels is greater
+            than threshold get an infinite distance. The distance profile function can
+            abandon their computation early.
+
+        Returns
+        -------
+        distance_profile : array, shape (n_instances, n_channels, profile_size)
+            The distance profile between q and _X for each channel.
+        """
+        index = self._get_index(q.shape[-1])
+        X = self._X
+        if instances is not None:
+            X = X[instances]
+            mask = mask[instances]
+            index = {key: value[instances] for key, value in index.items()}
 
-        for i in range(n_instances):
-            _mean, _std = sliding_mean_std_one_series(self._X[i], q_length, 1)
-            stds[i] = _std
-            means[i] = _mean
+        if self.normalize:
+            distance_profile = self.distance_profile_function(
+                X,
+                q,
+                mask,
+                q_means=np.mean(q, axis=-1),
+                q_stds=np.std(q, axis=-1),
+                threshold=threshold,
+                **index,
+            )
+        else:
+            distance_profile = self.distance_profile_function(
+                X, q, mask, threshold=threshold, **index
+            )
 
-        self._X_means = means
-        self._X_stds = stds
+        if self.store_distance_profile and instances is None:
+            self._distance_profile = distance_profile
+        return distance_profile
 
     @final
     def fit(self, X, y=None):
@@ -110,6 +213,10 @@ class BaseSimiliaritySearch(BaseEstimator, ABC):
         self.distance_profile_function = self._get_distance_profile_function()
 
         self._X = X.astype(float)
+        self._n_jobs = check_n_jobs(self.n_jobs)
+        self._index = {}
+        if self.distance == "mass":
+            self._X_fft = np.fft.rfft(self._X, axis=-1)
         self._fit(X, y)
         return self
 
@@ -118,8 +225,9 @@ class BaseSimiliaritySearch(BaseEstimator, ABC):
         """
         Predict method: Check the shape of q and call _predict to perform the search.
 
-        If the distance profile function is normalized, it stores the mean and stds
-        from q and _X.
+        The statistics of _X needed by the distance profile function (e.g. the means
+        and stds of the subsequences if it is normalized) are cached in the index for
+        the length of q.
 
         Parameters
         ----------
@@ -152,6 +260,77 @@ class BaseSimiliaritySearch(BaseEstimator, ABC):
             (e.g. top-k, threshold, ...).
 
         """
+        q, mask = self._check_query(q, q_index, exclusion_factor)
+        return self._predict(q, mask)
+
+    @final
+    def predict_batch(self, Q, q_indexes=None, exclusion_factor=2.0):
+        """
+        Predict method for several queries, processed in parallel threads.
+
+        The statistics of _X needed for each query length are computed once before
+        the search, and shared by all the queries of that length.
+
+        Parameters
+        ----------
+        Q : array, shape (n_queries, n_channels, q_length) or list of arrays
+            Input queries used for similarity search. A list of 2D arrays of shape
+            (n_channels, q_length) can be used for queries of different lengths.
+        q_indexes : Iterable, default=None
+            An iterable of size n_queries giving for each query the q_index parameter
+            of the predict method, or None if the query is not extracted from X.
+        exclusion_factor : float, default=2.
+            The factor to apply to the query length to define the exclusion zone.
+
+        Raises
+        ------
+        ValueError
+            If q_indexes is not of the same size as Q.
+
+        Returns
+        -------
+        list
+            The output of the predict method for each query in Q.
+        """
+        if q_indexes is None:
+            q_indexes = [None] * len(Q)
+        elif len(q_indexes) != len(Q):
+            raise ValueError(
+                "q_indexes should contain one element per query, but got {} elements"
+                " for {} queries".format(len(q_indexes), len(Q))
+            )
+
+        queries = [
+            self._check_query(q, q_index, exclusion_factor)
+            for q, q_index in zip(Q, q_indexes)
+        ]
+        for q, _ in queries:
+            self._get_index(q.shape[-1])
+
+        return Parallel(n_jobs=self._n_jobs, prefer="threads")(
+            delayed(self._predict)(q, mask) for q, mask in queries
+        )
+
+    def _check_query(self, q, q_index, exclusion_factor):
+        """
+        Check the query and build the mask of the candidates to consider.
+
+        Parameters
+        ----------
+        q :  array, shape (n_channels, q_length)
+            Input query used for similarity search.
+        q_index : Iterable
+            Index of q in the input data X given during the fit method, or None.
+        exclusion_factor : float
+            The factor to apply to the query length to define the exclusion zone.
+
+        Returns
+        -------
+        q : array, shape (n_channels, q_length)
+            The query converted to float.
+        mask : array, shape (n_instances, n_channels, n_timestamps)
+            Boolean mask indicating which candidates should be considered.
+        """
         if not isinstance(q, np.ndarray) or q.ndim != 2:
             raise TypeError(
                 "Error, only supports 2D numpy atm. If q is univariate"
@@ -206,19 +385,14 @@ class BaseSimiliaritySearch(BaseEstimator, ABC):
             )
             mask[i_instance, :, exclusion_LB:exclusion_UB] = False
 
-        if self.normalize:
-            self._q_means = np.mean(q, axis=-1)
-            self._q_stds = np.std(q, axis=-1)
-            self._store_mean_std_from_inputs(q_length)
-
-        return self._predict(q.astype(float), mask)
+        return q.astype(float), mask
 
     @abstractmethod
     def _fit(self, X, y):
         ...
 
     @abstractmethod
-    def _predict(self, q):
+    def _predict(self, q, mask):
         ...
 
 
@@ -229,5 +403,9 @@ DISTANCE_PROFILE_DICT = {
     "euclidean": {
         True: normalized_naive_euclidean_profile,
         False: naive_euclidean_profile,
-    }
+    },
+    "mass": {
+        True: normalized_mass_euclidean_profile,
+        False: mass_euclidean_profile,
+    },
 }
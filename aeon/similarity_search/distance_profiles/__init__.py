@@ -1,9 +1,18 @@
 """Distance profiles."""
 
 __author__ = ["baraline"]
-__all__ = ["naive_euclidean_profile", "normalized_naive_euclidean_profile"]
+__all__ = [
+    "naive_euclidean_profile",
+    "normalized_naive_euclidean_profile",
+    "mass_euclidean_profile",
+    "normalized_mass_euclidean_profile",
+]
 
 
+from aeon.similarity_search.distance_profiles.mass_euclidean import (
+    mass_euclidean_profile,
+    normalized_mass_euclidean_profile,
+)
 from aeon.similarity_search.distance_profiles.naive_euclidean import (
     naive_euclidean_profile,
 )
@@ -0,0 +1,210 @@
+"""MASS Euclidean distance profiles."""
+
+import numpy as np
+from numba import njit
+
+from aeon.similarity_search.distance_profiles._commons import (
+    AEON_SIMSEARCH_STD_THRESHOLD,
+)
+
+
+def mass_euclidean_profile(X, q, mask, X_fft=None, X_sq_sums=None, threshold=np.inf):
+    r"""
+    Compute a euclidean distance profile using MASS.
+
+    It computes the distance profiles between the input time series and the query using
+    the Euclidean distance, following Mueen's Algorithm for Similarity Search (MASS).
+    The dot products between the query and all the candidates are computed with a
+    single FFT convolution per channel, and the squared norms of the candidates with
+    a cumulative sum, which gives a complexity of :math:`O(m \log m)` instead of the
+    :math:`O(m l)` of the brute force approach.
+
+    A distance profile between a (univariate) time series :math:`X_i = {x_1, ..., x_m}`
+    and a query :math:`Q = {q_1, ..., q_m}` is defined as a vector of size :math:`m-(
+    l-1)`, such as :math:`P(X_i, Q) = {d(C_1, Q), ..., d(C_m-(l-1), Q)}` with d the
+    Euclidean distance, and :math:`C_j = {x_j, ..., x_{j+(l-1)}}` the j-th candidate
+    subsequence of size :math:`l` in :math:`X_i`.
+
+    Parameters
+    ----------
+    X: array shape (n_instances, n_channels, series_length)
+        The input samples.
+    q : np.ndarray shape (n_channels, query_length)
+        The query used for similarity search.
+    mask : array, shape (n_instances, n_channels, n_timestamps - (q_length - 1))
+        Boolean mask of the shape of the distance profile indicating for which part
+        of it the distance should be computed.
+    X_fft : array, shape (n_instances, n_channels, series_length // 2 + 1), optional
+        Real FFT of X along the time axis, as returned by ``np.fft.rfft(X)``. It does
+        not depend on the query, so it can be computed once for all queries.
+    X_sq_sums : array, shape (n_instances, n_channels, series_length - (q_length-1))
+        Sums of squares of each subsequences of X of size query_length, computed
+        if not given.
+    threshold : float, default=np.inf
+        Candidates for which the sum of the distances over the channels is greater
+        than threshold get an infinite distance. As all the dot products are computed
+        at once, this does not make the computation faster.
+
+    Returns
+    -------
+    distance_profile : np.ndarray
+        shape (n_instances, n_channels, series_length - query_length + 1)
+        The distance profile between q and the input time series X independently
+        for each channel.
+
+    References
+    ----------
+    .. [1] Abdullah Mueen, Yan Zhu, Michael Yeh, Kaveh Kamgar, Krishnamurthy
+    Viswanathan, Chetan Kumar Gupta and Eamonn Keogh. The Fastest Similarity Search
+    Algorithm for Time Series Subsequences under Euclidean Distance, 2022.
+    """
+    X = X.astype(float)
+    q = q.astype(float)
+    QX = _sliding_dot_products(X, q, X_fft)
+    if X_sq_sums is None:
+        X_sq_sums = _sliding_square_sums(X, q.shape[-1])
+    q_sq_sums = np.sum(q**2, axis=-1)
+    distance_profile = _mass_euclidean_profile(QX, X_sq_sums, q_sq_sums, mask)
+    return _apply_threshold(distance_profile, threshold)
+
+
+def normalized_mass_euclidean_profile(
+    X, q, mask, X_means, X_stds, q_means, q_stds, X_fft=None, threshold=np.inf
+):
+    """
+    Compute a z-normalized euclidean distance profile using MASS.
+
+    It computes the distance profiles between the input time series and the query using
+    the z-normalized Euclidean distance, following Mueen's Algorithm for Similarity
+    Search (MASS). The dot products between the query and all the candidates are
+    computed with a single FFT convolution per channel, and combined with the
+    precomputed means and standard deviations of the candidates and of the query.
+
+    Parameters
+    ----------
+    X : array, shape (n_instances, n_channels, series_length)
+        The input samples.
+    q : array, shape (n_channels, query_length)
+        The query used for similarity search.
+    mask : array, shape (n_instances, n_channels, n_timestamps - (q_length - 1))
+        Boolean mask of the shape of the distance profile indicating for which part
+        of it the distance should be computed.
+    X_means : array, shape (n_instances, n_channels, series_length - (query_length-1))
+        Means of each subsequences of X of size query_length
+    X_stds : array, shape (n_instances, n_channels, series_length - (query_length-1))
+        Stds of each subsequences of X of size query_length
+    q_means : array, shape (n_channels)
+        Means of the query q
+    q_stds : array, shape (n_channels)
+        Stds of the query q
+    X_fft : array, shape (n_instances, n_channels, series_length // 2 + 1), optional
+        Real FFT of X along the time axis, as returned by ``np.fft.rfft(X)``. It does
+        not depend on the query, so it can be computed once for all queries.
+    threshold : float, default=np.inf
+        Candidates for which the sum of the distances over the channels is greater
+        than threshold get an infinite distance. As all the dot products are computed
+        at once, this does not make the computation faster.
+
+    Returns
+    -------
+    distance_profile : np.ndarray
+        shape (n_instances, n_channels, series_length - query_length + 1).
+        The distance profile between q and the input time series X independently
+        for each channel.
+
+    References
+    ----------
+    .. [1] Abdullah Mueen, Yan Zhu, Michael Yeh, Kaveh Kamgar, Krishnamurthy
+    Viswanathan, Chetan Kumar Gupta and Eamonn Keogh. The Fastest Similarity Search
+    Algorithm for Time Series Subsequences under Euclidean Distance, 2022.
+    """
+    QX = _sliding_dot_products(X.astype(float), q.astype(float), X_fft)
+    distance_profile = _normalized_mass_euclidean_profile(
+        QX, mask, X_means, X_stds, q_means, q_stds, q.shape[-1]
+    )
+    return _apply_threshold(distance_profile, threshold)
+
+
+def _sliding_dot_products(X, q, X_fft=None):
+    # The circular convolution of X with the reversed query is equal to the sliding
+    # dot products from index q_length - 1 onwards, so an FFT of size X_length is
+    # enough and X_fft is shared by all query lengths.
+    X_length = X.shape[-1]
+    q_length = q.shape[-1]
+    if X_fft is None:
+        X_fft = np.fft.rfft(X, axis=-1)
+    q_fft = np.fft.rfft(q[:, ::-1], n=X_length, axis=-1)
+    return np.fft.irfft(X_fft * q_fft, n=X_length, axis=-1)[..., q_length - 1 :]
+
+
+def _apply_threshold(distance_profile, threshold):
+    if threshold < np.inf:
+        over = distance_profile.sum(axis=1) > threshold
+        distance_profile[
+            np.broadcast_to(over[:, np.newaxis], distance_profile.shape)
+        ] = np.inf
+    return distance_profile
+
+
+def _sliding_square_sums(X, q_length):
+    X_sq_sums = np.zeros(X.shape[:-1] + (X.shape[-1] + 1,))
+    np.cumsum(X**2, axis=-1, out=X_sq_sums[..., 1:])
+    return X_sq_sums[..., q_length:] - X_sq_sums[..., :-q_length]
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _mass_euclidean_profile(QX, X_sq_sums, q_sq_sums, mask):
+    n_instances, n_channels, profile_size = QX.shape
+    distance_profile = np.full((n_instances, n_channels, profile_size), np.inf)
+
+    for i_instance in range(n_instances):
+        for i_channel in range(n_channels):
+            for i_candidate in range(profile_size):
+                if mask[i_instance, i_channel, i_candidate]:
+                    dist = (
+                        X_sq_sums[i_instance, i_channel, i_candidate]
+                        + q_sq_sums[i_channel]
+                        - 2 * QX[i_instance, i_channel, i_candidate]
+                    )
+                    distance_profile[i_instance, i_channel, i_candidate] = np.sqrt(
+                        max(dist, 0.0)
+                    )
+    return distance_profile
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _normalized_mass_euclidean_profile(
+    QX, mask, X_means, X_stds, q_means, q_stds, q_length
+):
+    n_instances, n_channels, profile_size = QX.shape
+    distance_profile = np.full((n_instances, n_channels, profile_size), np.inf)
+
+    for i_channel in range(n_channels):
+        # As in the brute force version, a constant query is only centered. Its sum
+        # of squares after normalization is then its variance times its length.
+        q_std = q_stds[i_channel]
+        if q_std < AEON_SIMSEARCH_STD_THRESHOLD:
+            q_sq_sum = q_length * q_std**2
+            q_std = 1.0
+        else:
+            q_sq_sum = q_length
+        for i_instance in range(n_instances):
+            for i_candidate in range(profile_size):
+                if mask[i_instance, i_channel, i_candidate]:
+                    X_std = X_stds[i_instance, i_channel, i_candidate]
+                    if X_std < AEON_SIMSEARCH_STD_THRESHOLD:
+                        X_sq_sum = q_length * X_std**2
+                        X_std = 1.0
+                    else:
+                        X_sq_sum = q_length
+                    dot = (
+                        QX[i_instance, i_channel, i_candidate]
+                        - q_length
+                        * q_means[i_channel]
+                        * X_means[i_instance, i_channel, i_candidate]
+                    ) / (q_std * X_std)
+                    dist = X_sq_sum + q_sq_sum - 2 * dot
+                    distance_profile[i_instance, i_channel, i_candidate] = np.sqrt(
+                        max(dist, 0.0)
+                    )
+    return distance_profile
@@ -5,11 +5,10 @@ __author__ = ["baraline"]
 import numpy as np
 from numba import njit
 
-from aeon.distances import euclidean_distance
 from aeon.similarity_search.distance_profiles._commons import _get_input_sizes
 
 
-def naive_euclidean_profile(X, q, mask):
+def naive_euclidean_profile(X, q, mask, threshold=np.inf):
     r"""
     Compute a euclidean distance profile in a brute force way.
 
@@ -23,6 +22,10 @@ def naive_euclidean_profile(X, q, mask):
     Euclidean distance, and :math:`C_j = {x_j, ..., x_{j+(l-1)}}` the j-th candidate
     subsequence of size :math:`l` in :math:`X_i`.
 
+    If a threshold is given, the computation of a candidate is abandoned as soon as
+    the sum of its distances over the channels exceeds it, and the distance of such
+    candidates is set to infinity in all channels.
+
     Parameters
     ----------
     X: array shape (n_cases, n_channels, series_length)
@@ -32,6 +35,9 @@ def naive_euclidean_profile(X, q, mask):
     mask : array, shape (n_instances, n_channels, n_timestamps - (q_length - 1))
         Boolean mask of the shape of the distance profile indicating for which part
         of it the distance should be computed.
+    threshold : float, default=np.inf
+        Candidates for which the sum of the distances over the channels is greater
+        than threshold are not fully computed and get an infinite distance.
 
     Returns
     -------
@@ -41,23 +47,47 @@ def naive_euclidean_profile(X, q, mask):
         for each channel.
 
     """
-    return _naive_euclidean_profile(X, q, mask)
+    return _naive_euclidean_profile(X, q, mask, threshold)
 
 
-@njit(cache=True, fastmath=True)
-def _naive_euclidean_profile(X, q, mask):
+@njit(cache=True, fastmath=True, nogil=True)
+def _naive_euclidean_profile(X, q, mask, threshold):
     n_instances, n_channels, X_length, q_length, profile_size = _get_input_sizes(X, q)
     distance_profile = np.full((n_instances, n_channels, profile_size), np.inf)
+    use_threshold = threshold < np.inf
 
+    # Compute euclidean distance for all candidate in a "brute force" way
     for i_instance in range(n_instances):
-        for i_channel in range(n_channels):
-            for i_candidate in range(profile_size):
-                if mask[i_instance, i_channel, i_candidate]:
-                    distance_profile[
-                        i_instance, i_channel, i_candidate
-                    ] = euclidean_distance(
-                        q[i_channel],
-                        X[i_instance, i_channel, i_candidate : i_candidate + q_length],
+        for i_candidate in range(profile_size):
+            # Sum of the distances of the channels already computed
+            total = 0.0
+            abandoned = False
+            for i_channel in range(n_channels):
+                if not mask[i_instance, i_channel, i_candidate]:
+                    # The distance of a masked channel is infinite
+                    abandoned = use_threshold
+                    if abandoned:
+                        break
+                    continue
+                bound = np.inf
+                if use_threshold:
+                    bound = (threshold - total) ** 2
+                dist = 0.0
+                for i_t in range(q_length):
+                    diff = (
+                        X[i_instance, i_channel, i_candidate + i_t] - q[i_channel, i_t]
                     )
+                    dist += diff * diff
+                    if dist > bound:
+                        abandoned = True
+                        break
+                if abandoned:
+                    break
+                dist = np.sqrt(dist)
+                distance_profile[i_instance, i_channel, i_candidate] = dist
+                total += dist
+
+            if abandoned:
+                distance_profile[i_instance, :, i_candidate] = np.inf
 
     return distance_profile
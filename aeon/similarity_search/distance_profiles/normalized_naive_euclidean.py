@@ -5,16 +5,16 @@ __author__ = ["baraline"]
 import numpy as np
 from numba import njit
 
-from aeon.distances import euclidean_distance
 from aeon.similarity_search.distance_profiles._commons import (
     AEON_SIMSEARCH_STD_THRESHOLD,
     _get_input_sizes,
-    _z_normalize_1D_series_with_mean_std,
     _z_normalize_2D_series_with_mean_std,
 )
 
 
-def normalized_naive_euclidean_profile(X, q, mask, X_means, X_stds, q_means, q_stds):
+def normalized_naive_euclidean_profile(
+    X, q, mask, X_means, X_stds, q_means, q_stds, threshold=np.inf
+):
     """
     Compute a euclidean distance profile in a brute force way.
 
@@ -28,6 +28,10 @@ def normalized_naive_euclidean_profile(X, q, mask, X_means, X_stds, q_means, q_s
     Euclidean distance, and :math:`C_j = {x_j, ..., x_{j+(l-1)}}` the j-th candidate
     subsequence of size :math:`l` in :math:`X_i`.
 
+    If a threshold is given, the computation of a candidate is abandoned as soon as
+    the sum of its distances over the channels exceeds it, and the distance of such
+    candidates is set to infinity in all channels.
+
     Parameters
     ----------
     X : array, shape (n_instances, n_channels, series_length)
@@ -45,6 +49,9 @@ def normalized_naive_euclidean_profile(X, q, mask, X_means, X_stds, q_means, q_s
         Means of the query q
     q_stds : array, shape (n_channels)
         Stds of the query q
+    threshold : float, default=np.inf
+        Candidates for which the sum of the distances over the channels is greater
+        than threshold are not fully computed and get an infinite distance.
 
     Returns
     -------
@@ -59,28 +66,54 @@ def normalized_naive_euclidean_profile(X, q, mask, X_means, X_stds, q_means, q_s
     X_stds[X_stds < AEON_SIMSEARCH_STD_THRESHOLD] = 1
 
     return _normalized_naive_euclidean_profile(
-        X, q, mask, X_means, X_stds, q_means, q_stds
+        X, q, mask, X_means, X_stds, q_means, q_stds, threshold
     )
 
 
-@njit(cache=True, fastmath=True)
-def _normalized_naive_euclidean_profile(X, q, mask, X_means, X_stds, q_means, q_stds):
+@njit(cache=True, fastmath=True, nogil=True)
+def _normalized_naive_euclidean_profile(
+    X, q, mask, X_means, X_stds, q_means, q_stds, threshold
+):
     n_instances, n_channels, X_length, q_length, profile_size = _get_input_sizes(X, q)
     q = _z_normalize_2D_series_with_mean_std(q, q_means, q_stds)
     distance_profile = np.full((n_instances, n_channels, profile_size), np.inf)
+    use_threshold = threshold < np.inf
 
     # Compute euclidean distance for all candidate in a "brute force" way
     for i_instance in range(n_instances):
-        for i_channel in range(n_channels):
-            for i_candidate in range(profile_size):
-                if mask[i_instance, i_channel, i_candidate]:
-                    # Extract and normalize the candidate
-                    _C = _z_normalize_1D_series_with_mean_std(
-                        X[i_instance, i_channel, i_candidate : i_candidate + q_length],
-                        X_means[i_instance, i_channel, i_candidate],
-                        X_stds[i_instance, i_channel, i_candidate],
-                    )
-                    distance_profile[
-                        i_instance, i_channel, i_candidate
-                    ] = euclidean_distance(q[i_channel], _C)
+        for i_candidate in range(profile_size):
+            # Sum of the distances of the channels already computed
+            total = 0.0
+            abandoned = False
+            for i_channel in range(n_channels):
+                if not mask[i_instance, i_channel, i_candidate]:
+                    # The distance of a masked channel is infinite
+                    abandoned = use_threshold
+                    if abandoned:
+                        break
+                    continue
+                bound = np.inf
+                if use_threshold:
+                    bound = (threshold - total) ** 2
+                # Normalize the candidate on the fly
+                _mean = X_means[i_instance, i_channel, i_candidate]
+                _std = X_stds[i_instance, i_channel, i_candidate]
+                dist = 0.0
+                for i_t in range(q_length):
+                    diff = (
+                        X[i_instance, i_channel, i_candidate + i_t] - _mean
+                    ) / _std - q[i_channel, i_t]
+                    dist += diff * diff
+                    if dist > bound:
+                        abandoned = True
+                        break
+                if abandoned:
+                    break
+                dist = np.sqrt(dist)
+                distance_profile[i_instance, i_channel, i_candidate] = dist
+                total += dist
+
+            if abandoned:
+                distance_profile[i_instance, :, i_candidate] = np.inf
+
     return distance_profile
@@ -0,0 +1,98 @@
+"""Tests for MASS Euclidean distance profiles."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from aeon.similarity_search.distance_profiles.mass_euclidean import (
+    mass_euclidean_profile,
+    normalized_mass_euclidean_profile,
+)
+from aeon.similarity_search.distance_profiles.naive_euclidean import (
+    naive_euclidean_profile,
+)
+from aeon.similarity_search.distance_profiles.normalized_naive_euclidean import (
+    normalized_naive_euclidean_profile,
+)
+from aeon.utils.numba.general import sliding_mean_std_one_series
+
+DATATYPES = ["int64", "float64"]
+
+
+def _get_mean_std(X, q_length):
+    search_space_size = X.shape[-1] - q_length + 1
+    X_means = np.zeros((X.shape[0], X.shape[1], search_space_size))
+    X_stds = np.zeros((X.shape[0], X.shape[1], search_space_size))
+    for i in range(X.shape[0]):
+        X_means[i], X_stds[i] = sliding_mean_std_one_series(
+            X[i].astype(float), q_length, 1
+        )
+    return X_means, X_stds
+
+
+@pytest.mark.parametrize("dtype", DATATYPES)
+def test_mass_euclidean(dtype):
+    rng = np.random.default_rng(0)
+    X = rng.integers(-10, 10, size=(3, 2, 50)).astype(dtype)
+    q = rng.integers(-10, 10, size=(2, 12)).astype(dtype)
+
+    mask = np.ones(X.shape, dtype=bool)
+    mask[1, :, 5:10] = False
+    dist_profile = mass_euclidean_profile(X, q, mask)
+    expected = naive_euclidean_profile(X.astype(float), q.astype(float), mask)
+    assert_array_almost_equal(dist_profile, expected)
+    assert np.all(np.isinf(dist_profile[1, :, 5:10]))
+
+
+@pytest.mark.parametrize("dtype", DATATYPES)
+def test_normalized_mass_euclidean(dtype):
+    rng = np.random.default_rng(0)
+    X = rng.integers(-10, 10, size=(3, 2, 50)).astype(dtype)
+    X[0, 0, 10:30] = 3
+    q = rng.integers(-10, 10, size=(2, 12)).astype(dtype)
+
+    X_means, X_stds = _get_mean_std(X, q.shape[-1])
+    q_means = q.mean(axis=-1)
+    q_stds = q.std(axis=-1)
+    mask = np.ones(X.shape, dtype=bool)
+
+    dist_profile = normalized_mass_euclidean_profile(
+        X, q, mask, X_means, X_stds, q_means, q_stds
+    )
+    expected = normalized_naive_euclidean_profile(
+        X.astype(float),
+        q.astype(float),
+        mask,
+        X_means.copy(),
+        X_stds.copy(),
+        q_means.copy(),
+        q_stds.copy(),
+    )
+    assert_array_almost_equal(dist_profile, expected)
+
+
+def test_normalized_mass_euclidean_constant_case():
+    X = np.ones((2, 1, 10))
+    q = np.zeros((1, 3))
+
+    X_means, X_stds = _get_mean_std(X, q.shape[-1])
+    q_means = q.mean(axis=-1)
+    q_stds = q.std(axis=-1)
+    mask = np.ones(X.shape, dtype=bool)
+
+    dist_profile = normalized_mass_euclidean_profile(
+        X, q, mask, X_means, X_stds, q_means, q_stds
+    )
+    assert_array_almost_equal(dist_profile, np.zeros(dist_profile.shape))
+
+
+def test_non_alteration_of_inputs_mass_euclidean():
+    X = np.asarray([[[1, 2, 3, 4, 5, 6, 7, 8]], [[1, 2, 4, 4, 5, 6, 5, 4]]])
+    X_copy = np.copy(X)
+    q = np.asarray([[3, 4, 5]])
+    q_copy = np.copy(q)
+
+    mask = np.ones(X.shape, dtype=bool)
+    _ = mass_euclidean_profile(X, q, mask)
+    assert_array_equal(q, q_copy)
+    assert_array_equal(X, X_copy)
@@ -0,0 +1,124 @@
+"""RangeSimilaritySearch."""
+
+import numpy as np
+
+from aeon.similarity_search.base import BaseSimiliaritySearch
+
+
+class RangeSimilaritySearch(BaseSimiliaritySearch):
+    """
+    Range similarity search method.
+
+    Finds all the subsequences of the series within a distance threshold of the query
+    series. With the brute force euclidean distance, the computation of a candidate is
+    abandoned as soon as its distance exceeds the threshold.
+
+    Parameters
+    ----------
+    threshold : float, default=1.0
+        The maximum distance between the query and a match.
+    distance : str, default ="euclidean"
+        Name of the distance function to use. "euclidean" computes the distance
+        profile in a brute force way, "mass" computes the same euclidean distance
+        profile with FFT, which is faster for long queries.
+    normalize : bool, default = False
+        Whether the distance function should be z-normalized.
+    store_distance_profile : bool, default = =False.
+        Whether to store the computed distance profile in the attribute
+        "_distance_profile" after calling the predict method. Candidates further than
+        threshold from the query have an infinite distance in it.
+    n_jobs : int, default=1
+        The number of threads used by ``predict_batch`` to process the queries.
+        ``-1`` means using all processors.
+
+    Attributes
+    ----------
+    _X : array, shape (n_instances, n_channels, n_timestamps)
+        The input time series stored during the fit method.
+    distance_profile_function : function
+        The function used to compute the distance profile affected
+        during the fit method based on the distance and normalize
+        parameters.
+
+    Examples
+    --------
+    >>> from aeon.similarity_search import RangeSimilaritySearch
+    >>> from aeon.datasets import load_unit_test
+    >>> X_train, y_train = load_unit_test(split="train")
+    >>> X_test, y_test = load_unit_test(split="test")
+    >>> clf = RangeSimilaritySearch(threshold=2.0)
+    >>> clf.fit(X_train, y_train)
+    RangeSimilaritySearch(...)
+    >>> q = X_test[0, :, 5:15]
+    >>> y_pred = clf.predict(q)
+    """
+
+    def __init__(
+        self,
+        threshold=1.0,
+        distance="euclidean",
+        normalize=False,
+        store_distance_profile=False,
+        n_jobs=1,
+    ):
+        self.threshold = threshold
+        super(RangeSimilaritySearch, self).__init__(
+            distance=distance,
+            normalize=normalize,
+            store_distance_profile=store_distance_profile,
+            n_jobs=n_jobs,
+        )
+
+    def _fit(self, X, y):
+        """
+        Private fit method, does nothing more than the base class.
+
+        Parameters
+        ----------
+        X : array, shape (n_instances, n_channels, n_timestamps)
+            Input array to used as database for the similarity search
+        y : optional
+            Not used.
+
+        Returns
+        -------
+        self
+
+        """
+        return self
+
+    def _predict(self, q, mask):
+        """
+        Private predict method for RangeSimilaritySearch.
+
+        It compute the distance profiles, abandoning the candidates further than the
+        threshold, and return all the remaining matches.
+
+        Parameters
+        ----------
+        q :  array, shape (n_channels, q_length)
+            Input query used for similarity search.
+        mask : array, shape (n_instances, n_channels, n_timestamps - (q_length - 1))
+            Boolean mask of the shape of the distance profile indicating for which part
+            of it the distance should be computed.
+
+        Returns
+        -------
+        array
+            An array containing the indexes of the matches within threshold of q in
+            _X, sorted by increasing distance.
+
+        """
+        distance_profile = self._compute_distance_profile(
+            q, mask, threshold=self.threshold
+        )
+
+        # For now, deal with the multidimensional case as "dependent", so we sum.
+        distance_profile = distance_profile.sum(axis=1)
+
+        search_size = distance_profile.shape[-1]
+        distance_profile = distance_profile.ravel()
+        matches = np.flatnonzero(distance_profile <= self.threshold)
+        matches = matches[np.argsort(distance_profile[matches], kind="stable")]
+
+        return [(i // search_size, i % search_size) for i in matches]
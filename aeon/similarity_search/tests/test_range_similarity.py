@@ -0,0 +1,57 @@
+"""Tests for RangeSimilaritySearch."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from aeon.similarity_search.range_similarity import RangeSimilaritySearch
+from aeon.similarity_search.top_k_similarity import TopKSimilaritySearch
+
+DATATYPES = ["int64", "float64"]
+
+
+@pytest.mark.parametrize("dtype", DATATYPES)
+def test_RangeSimilaritySearch(dtype):
+    X = np.asarray(
+        [[[1, 2, 3, 4, 5, 6, 7, 8]], [[1, 2, 4, 4, 5, 6, 5, 4]]], dtype=dtype
+    )
+    q = np.asarray([[3, 4, 5]], dtype=dtype)
+
+    search = RangeSimilaritySearch(threshold=1.5)
+    search.fit(X)
+    idx = search.predict(q)
+    assert_array_equal(idx, [(0, 2), (1, 2), (1, 1)])
+
+    idx = search.predict(q, q_index=(0, 2))
+    assert_array_equal(idx, [(1, 2), (1, 1)])
+
+    search = RangeSimilaritySearch(threshold=0.0)
+    search.fit(X)
+    assert_array_equal(search.predict(q), [(0, 2)])
+
+
+@pytest.mark.parametrize("distance", ["euclidean", "mass"])
+@pytest.mark.parametrize("normalize", [True, False])
+def test_RangeSimilaritySearch_matches_top_k(distance, normalize):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(4, 2, 50))
+    q = X[2, :, 10:20]
+
+    top_k = TopKSimilaritySearch(
+        k=10, distance=distance, normalize=normalize, store_distance_profile=True
+    ).fit(X)
+    expected = top_k.predict(q)
+    threshold = top_k._distance_profile.sum(axis=1)[expected[-1]] + 1e-8
+
+    search = RangeSimilaritySearch(
+        threshold=threshold,
+        distance=distance,
+        normalize=normalize,
+        store_distance_profile=True,
+    ).fit(X)
+    assert_array_equal(search.predict(q), expected)
+
+    # Abandoned candidates have an infinite distance in every channel
+    profile = search._distance_profile
+    assert np.all(np.isinf(profile) == np.isinf(profile[:, :1]))
+    assert np.isinf(profile).sum() == 2 * (profile[:, 0].size - 10)
@@ -38,3 +38,62 @@ def test_TopKSimilaritySearch(dtype):
     search.fit(X)
     idx = search.predict(q, q_index=(1, 2))
     assert_array_equal(idx, [(1, 0)])
+
+
+@pytest.mark.parametrize("dtype", DATATYPES)
+@pytest.mark.parametrize("normalize", [True, False])
+def test_TopKSimilaritySearch_mass(dtype, normalize):
+    rng = np.random.default_rng(0)
+    X = rng.integers(-10, 10, size=(3, 2, 60)).astype(dtype)
+    q = X[1, :, 20:35]
+
+    naive = TopKSimilaritySearch(k=3, normalize=normalize).fit(X)
+    mass = TopKSimilaritySearch(k=3, distance="mass", normalize=normalize).fit(X)
+    assert_array_equal(naive.predict(q), mass.predict(q))
+    assert_array_equal(
+        naive.predict(q, q_index=(1, 20)), mass.predict(q, q_index=(1, 20))
+    )
+
+
+@pytest.mark.parametrize("distance", ["euclidean", "mass"])
+@pytest.mark.parametrize("normalize", [True, False])
+def test_TopKSimilaritySearch_predict_batch(distance, normalize):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(3, 2, 60))
+    Q = [X[0, :, 5:15], X[2, :, 30:42], X[1, :, 0:10]]
+    q_indexes = [(0, 5), None, (1, 0)]
+
+    search = TopKSimilaritySearch(
+        k=2, distance=distance, normalize=normalize, n_jobs=2
+    ).fit(X)
+    expected = [search.predict(q, q_index=i) for q, i in zip(Q, q_indexes)]
+    assert_array_equal(search.predict_batch(Q, q_indexes=q_indexes), expected)
+    assert sorted(search._index.keys()) == [10, 12]
+
+    with pytest.raises(ValueError):
+        search.predict_batch(Q, q_indexes=[None])
+
+
+@pytest.mark.parametrize("distance", ["euclidean", "mass"])
+@pytest.mark.parametrize("chunk_size", [1, 2, 10])
+def test_TopKSimilaritySearch_chunk_size(distance, chunk_size):
+    rng = np.random.default_rng(0)
+    X = rng.integers(-3, 3, size=(5, 2, 40)).astype(float)
+    q = X[3, :, 10:16]
+
+    search = TopKSimilaritySearch(k=7, distance=distance).fit(X)
+    chunked = TopKSimilaritySearch(k=7, distance=distance, chunk_size=chunk_size)
+    chunked.fit(X)
+    assert_array_equal(search.predict(q), chunked.predict(q))
+    assert_array_equal(
+        search.predict(q, q_index=(3, 10)), chunked.predict(q, q_index=(3, 10))
+    )
+
+
+def test_TopKSimilaritySearch_ties():
+    X = np.zeros((3, 1, 10))
+    q = np.zeros((1, 3))
+
+    for chunk_size in [None, 1, 2]:
+        search = TopKSimilaritySearch(k=4, chunk_size=chunk_size).fit(X)
+        assert_array_equal(search.predict(q), [(0, 0), (0, 1), (0, 2), (0, 3)])
@@ -2,6 +2,8 @@
 
 __author__ = ["baraline"]
 
+import numpy as np
+
 from aeon.similarity_search.base import BaseSimiliaritySearch
 
 
@@ -16,12 +18,23 @@ class TopKSimilaritySearch(BaseSimiliaritySearch):
     k : int, default=1
         The number of nearest matches from Q to return.
     distance : str, default ="euclidean"
-        Name of the distance function to use.
+        Name of the distance function to use. "euclidean" computes the distance
+        profile in a brute force way, "mass" computes the same euclidean distance
+        profile with FFT, which is faster for long queries.
     normalize : bool, default = False
         Whether the distance function should be z-normalized.
     store_distance_profile : bool, default = =False.
         Whether to store the computed distance profile in the attribute
         "_distance_profile" after calling the predict method.
+    n_jobs : int, default=1
+        The number of threads used by ``predict_batch`` to process the queries.
+        ``-1`` means using all processors.
+    chunk_size : int, default=None
+        If None, the distance profile between the query and all the series is computed
+        at once before selecting the k best matches. Otherwise, it is computed for
+        ``chunk_size`` series at a time and only the k best matches found so far are
+        kept, which bounds the memory used by predict for large databases. It is
+        ignored if store_distance_profile is True.
 
     Attributes
     ----------
@@ -46,13 +59,21 @@ class TopKSimilaritySearch(BaseSimiliaritySearch):
     """
 
     def __init__(
-        self, k=1, distance="euclidean", normalize=False, store_distance_profile=False
+        self,
+        k=1,
+        distance="euclidean",
+        normalize=False,
+        store_distance_profile=False,
+        n_jobs=1,
+        chunk_size=None,
     ):
         self.k = k
+        self.chunk_size = chunk_size
         super(TopKSimilaritySearch, self).__init__(
             distance=distance,
             normalize=normalize,
             store_distance_profile=store_distance_profile,
+            n_jobs=n_jobs,
         )
 
     def _fit(self, X, y):
@@ -93,29 +114,76 @@ class TopKSimilaritySearch(BaseSimiliaritySearch):
             An array containing the indexes of the best k matches between q and _X.
 
         """
-        if self.normalize:
-            distance_profile = self.distance_profile_function(
-                self._X,
-                q,
-                mask,
-                self._X_means,
-                self._X_stds,
-                self._q_means,
-                self._q_stds,
+        if self.chunk_size is None or self.store_distance_profile:
+            # For now, deal with the multidimensional case as "dependent", so we sum.
+            distance_profile = self._compute_distance_profile(q, mask).sum(axis=1)
+            search_size = distance_profile.shape[-1]
+            top_k_dist, top_k_idx = _update_top_k(
+                np.empty(0),
+                np.empty(0, dtype=np.int64),
+                distance_profile.ravel(),
+                np.arange(distance_profile.size),
+                self.k,
             )
         else:
-            distance_profile = self.distance_profile_function(self._X, q, mask)
-
-        if self.store_distance_profile:
-            self._distance_profile = distance_profile
+            n_instances = self._X.shape[0]
+            search_size = self._X.shape[-1] - q.shape[-1] + 1
+            top_k_dist = np.empty(0)
+            top_k_idx = np.empty(0, dtype=np.int64)
+            for i_start in range(0, n_instances, self.chunk_size):
+                instances = slice(i_start, min(i_start + self.chunk_size, n_instances))
+                distance_profile = self._compute_distance_profile(
+                    q, mask, instances=instances
+                ).sum(axis=1)
+                top_k_dist, top_k_idx = _update_top_k(
+                    top_k_dist,
+                    top_k_idx,
+                    distance_profile.ravel(),
+                    i_start * search_size + np.arange(distance_profile.size),
+                    self.k,
+                )
+
+        # Sort the k best matches by distance, then by position for ties
+        order = np.lexsort((top_k_idx, top_k_dist))
+        return [
+            (top_k_idx[i] // search_size, top_k_idx[i] % search_size) for i in order
+        ]
 
-        # For now, deal with the multidimensional case as "dependent", so we sum.
-        distance_profile = distance_profile.sum(axis=1)
 
-        search_size = distance_profile.shape[-1]
-        _argsort = distance_profile.argsort(axis=None)[: self.k]
+def _update_top_k(top_k_dist, top_k_idx, dist, idx, k):
+    """
+    Merge new candidates in the current k best matches.
 
-        return [
-            (_argsort[i] // search_size, _argsort[i] % search_size)
-            for i in range(self.k)
-        ]
+    Parameters
+    ----------
+    top_k_dist : array, shape (n_best)
+        Distances of the current best matches, with n_best <= k.
+    top_k_idx : array, shape (n_best)
+        Flat indexes of the current best matches.
+    dist : array, shape (n_candidates)
+        Distances of the new candidates.
+    idx : array, shape (n_candidates)
+        Flat indexes of the new candidates.
+    k : int
+        The number of best matches to keep.
+
+    Returns
+    -------
+    top_k_dist : array, shape (min(k, n_best + n_candidates))
+        Distances of the updated best matches, in no particular order.
+    top_k_idx : array, shape (min(k, n_best + n_candidates))
+        Flat indexes of the updated best matches.
+    """
+    dist = np.concatenate((top_k_dist, dist))
+    idx = np.concatenate((top_k_idx, idx))
+    if dist.shape[0] > k:
+        kth = dist[np.argpartition(dist, k - 1)[k - 1]]
+        # Among the ties at the k-th distance, keep the smallest indexes so that the
+        # result does not depend on how the candidates were split in chunks.
+        ties = np.flatnonzero(dist == kth)
+        selected = np.concatenate(
+            (np.flatnonzero(dist < kth), ties[np.argsort(idx[ties])])
+        )
+        dist = dist[selected[:k]]
+        idx = idx[selected[:k]]
+    return dist, idx
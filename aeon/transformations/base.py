@@ -1071,6 +1071,11 @@ class BaseTransformer(BaseEstimator):
         kwargs["rowname_default"] = "transformers"
         kwargs["colname_default"] = "transformers"
 
+        # parallel backend for the loop, from config
+        config = self.get_config()
+        kwargs["backend"] = config["backend:parallel"]
+        kwargs["backend_params"] = config["backend:parallel:params"]
+
         FIT_METHODS = ["fit", "update"]
         TRAFO_METHODS = ["transform", "inverse_transform"]
 
@@ -244,7 +244,7 @@ class SAX(BaseCollectionTransformer):
         return params
 
 
-@njit(parallel=True, fastmath=True)
+@njit(parallel=True, fastmath=True, cache=True)
 def _invert_sax_symbols(sax_symbols, series_length, breakpoints_mid):
     """Reconstruct the original time series using a Gaussian estimation.
 
@@ -12,7 +12,8 @@ import time
 
 import numpy as np
 from joblib import Parallel, delayed
-from numba import njit
+from numba import get_num_threads, njit, prange, set_num_threads
+from numba.core.config import NUMBA_NUM_THREADS
 from numba.typed.typedlist import List
 from sklearn import preprocessing
 from sklearn.utils._random import check_random_state
@@ -248,6 +249,8 @@ class RandomShapeletTransform(BaseCollectionTransformer):
             [List([(-1.0, -1, -1, -1, -1, -1)]) for _ in range(self.n_classes_)]
         )
         n_shapelets_extracted = 0
+        # quality of the candidates evaluated so far, random draws often repeat
+        candidate_cache = {}
 
         rng = check_random_state(self.random_state)
 
@@ -266,6 +269,7 @@ class RandomShapeletTransform(BaseCollectionTransformer):
                         shapelets,
                         max_shapelets_per_class,
                         check_random_state(rng.randint(np.iinfo(np.int32).max)),
+                        candidate_cache,
                     )
                     for i in range(self._batch_size)
                 )
@@ -304,6 +308,7 @@ class RandomShapeletTransform(BaseCollectionTransformer):
                         shapelets,
                         max_shapelets_per_class,
                         check_random_state(rng.randint(np.iinfo(np.int32).max)),
+                        candidate_cache,
                     )
                     for i in range(n_shapelets_to_extract)
                 )
@@ -353,6 +358,28 @@ class RandomShapeletTransform(BaseCollectionTransformer):
         # find max shapelet length
         self.max_fitted_shapelet_length_ = max(self.shapelets, key=lambda x: x[1])[1]
 
+        # padded arrays of the shapelets for the transform, grouped by length and
+        # channel so the window statistics of a series are shared within a group
+        n_shapelets = len(self.shapelets)
+        self._shapelet_order = np.lexsort(
+            (
+                [s[3] for s in self.shapelets],
+                [s[1] for s in self.shapelets],
+            )
+        )
+        self._shapelet_values = np.zeros(
+            (n_shapelets, self.max_fitted_shapelet_length_)
+        )
+        self._shapelet_sorted_indicies = np.zeros(
+            (n_shapelets, self.max_fitted_shapelet_length_), dtype=np.int_
+        )
+        self._shapelet_info = np.zeros((n_shapelets, 3), dtype=np.int_)
+        for i, n in enumerate(self._shapelet_order):
+            s = self.shapelets[n]
+            self._shapelet_values[i, : s[1]] = s[6]
+            self._shapelet_sorted_indicies[i, : s[1]] = self._sorted_indicies[n]
+            self._shapelet_info[i] = (s[1], s[2], s[3])
+
     def _transform(self, X, y=None):
         """Transform X according to the extracted shapelets.
 
@@ -376,22 +403,25 @@ class RandomShapeletTransform(BaseCollectionTransformer):
                     "calling transform."
                 )
 
-        for i, series in enumerate(X):
-            dists = Parallel(
-                n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
-            )(
-                delayed(_online_shapelet_distance)(
-                    series[shapelet[3]],
-                    shapelet[6],
-                    self._sorted_indicies[n],
-                    shapelet[2],
-                    shapelet[1],
-                )
-                for n, shapelet in enumerate(self.shapelets)
+        # concatenate the series along the time axis to support unequal lengths
+        offsets = np.zeros(len(X) + 1, dtype=np.int_)
+        offsets[1:] = np.cumsum([series.shape[1] for series in X])
+        X = np.concatenate(list(X), axis=1).astype(np.float64)
+
+        prev_threads = get_num_threads()
+        set_num_threads(min(self._n_jobs, NUMBA_NUM_THREADS))
+        try:
+            dists = _shapelet_transform_distances(
+                X,
+                offsets,
+                self._shapelet_values,
+                self._shapelet_sorted_indicies,
+                self._shapelet_info,
             )
+        finally:
+            set_num_threads(prev_threads)
 
-            output[i] = dists
-
+        output[:, self._shapelet_order] = dists
         return output
 
     @classmethod
@@ -418,7 +448,7 @@ class RandomShapeletTransform(BaseCollectionTransformer):
             return {"max_shapelets": 5, "n_shapelet_samples": 50, "batch_size": 20}
 
     def _extract_random_shapelet(
-        self, X, y, i, shapelets, max_shapelets_per_class, rng
+        self, X, y, i, shapelets, max_shapelets_per_class, rng, candidate_cache
     ):
         inst_idx = i % self.n_instances_
         cls_idx = int(y[inst_idx])
@@ -435,13 +465,29 @@ class RandomShapeletTransform(BaseCollectionTransformer):
         position = rng.randint(0, self.min_series_length_ - length)
         channel = rng.randint(0, self.n_channels_)
 
+        # repeated draws reuse the cached quality if the result is known for the
+        # current worst quality, pruned candidates store the quality they failed
+        key = (inst_idx, channel, position, length)
+        if key in candidate_cache:
+            quality, pruned_with = candidate_cache[key]
+            if quality == -1 and pruned_with <= worst_quality:
+                return -1.0, length, position, channel, inst_idx, cls_idx
+            elif quality != -1:
+                if 0 < worst_quality and quality <= worst_quality:
+                    quality = -1.0
+                return (
+                    np.round(quality, 8),
+                    length,
+                    position,
+                    channel,
+                    inst_idx,
+                    cls_idx,
+                )
+
         shapelet = z_normalise_series(
             X[inst_idx][channel][position : position + length]
         )
-        sabs = np.abs(shapelet)
-        sorted_indicies = np.array(
-            sorted(range(length), reverse=True, key=lambda j: sabs[j])
-        )
+        sorted_indicies = np.argsort(-np.abs(shapelet), kind="stable")
 
         quality = self._find_shapelet_quality(
             X,
@@ -456,6 +502,7 @@ class RandomShapeletTransform(BaseCollectionTransformer):
             self.n_instances_ - self._class_counts[cls_idx],
             worst_quality,
         )
+        candidate_cache[key] = (quality, worst_quality if quality == -1 else -1)
 
         return np.round(quality, 8), length, position, channel, inst_idx, cls_idx
 
@@ -474,8 +521,10 @@ class RandomShapeletTransform(BaseCollectionTransformer):
         other_cls_count,
         worst_quality,
     ):
-        # This is slow and could be optimised, we spend 99% of time here
-        orderline = []
+        # the orderline is kept sorted by (distance, class) as the series are
+        # evaluated, the distance computation is the most expensive part
+        distances = np.zeros(len(X))
+        orderline = np.zeros(len(X), dtype=np.int_)
         this_cls_traversed = 0
         other_cls_traversed = 0
 
@@ -494,12 +543,20 @@ class RandomShapeletTransform(BaseCollectionTransformer):
                 cls = -1
                 other_cls_traversed += 1
 
-            orderline.append((distance, cls))
-            orderline.sort()
+            pos = i
+            while pos > 0 and (
+                distances[pos - 1] > distance
+                or (distances[pos - 1] == distance and orderline[pos - 1] > cls)
+            ):
+                distances[pos] = distances[pos - 1]
+                orderline[pos] = orderline[pos - 1]
+                pos -= 1
+            distances[pos] = distance
+            orderline[pos] = cls
 
             if worst_quality > 0:
                 quality = _calc_early_binary_ig(
-                    orderline,
+                    orderline[: i + 1],
                     this_cls_traversed,
                     other_cls_traversed,
                     this_cls_count - this_cls_traversed,
@@ -637,6 +694,110 @@ def _online_shapelet_distance(series, shapelet, sorted_indicies, position, lengt
     return best_dist if best_dist == 0 else 1 / length * best_dist
 
 
+@njit(fastmath=True, cache=True, parallel=True)
+def _shapelet_transform_distances(X, offsets, shapelets, sorted_indicies, info):
+    n_instances = offsets.shape[0] - 1
+    n_shapelets = shapelets.shape[0]
+    dists = np.zeros((n_instances, n_shapelets))
+
+    for i in prange(n_instances):
+        means = np.zeros(0)
+        stds = np.zeros(0)
+        for n in range(n_shapelets):
+            length, position, channel = info[n]
+            series = X[channel, offsets[i] : offsets[i + 1]]
+
+            # shapelets are sorted by length and channel, only compute the window
+            # statistics when starting a new group
+            if n == 0 or length != info[n - 1, 0] or channel != info[n - 1, 2]:
+                means, stds = _sliding_mean_std(series, length)
+
+            dists[i, n] = _shapelet_distance(
+                series,
+                shapelets[n],
+                sorted_indicies[n],
+                position,
+                length,
+                means,
+                stds,
+            )
+
+    return dists
+
+
+@njit(fastmath=True, cache=True)
+def _sliding_mean_std(series, length):
+    n_windows = series.shape[0] - length + 1
+    means = np.zeros(n_windows)
+    stds = np.zeros(n_windows)
+
+    sum = 0.0
+    sum2 = 0.0
+    for j in range(length):
+        sum += series[j]
+        sum2 += series[j] * series[j]
+
+    for j in range(n_windows):
+        if j > 0:
+            start = series[j - 1]
+            end = series[j - 1 + length]
+            sum += end - start
+            sum2 += end * end - start * start
+
+        means[j] = sum / length
+        stds[j] = math.sqrt(max((sum2 - means[j] * means[j] * length) / length, 0))
+
+    return means, stds
+
+
+@njit(fastmath=True, cache=True)
+def _shapelet_distance(
+    series, shapelet, sorted_indicies, position, length, means, stds
+):
+    # same distance as _online_shapelet_distance, the window the shapelet was
+    # extracted from is the initial best so far
+    subseq = series[position : position + length]
+
+    sum = 0.0
+    sum2 = 0.0
+    for i in subseq:
+        sum += i
+        sum2 += i * i
+
+    mean = sum / length
+    std = (sum2 - mean * mean * length) / length
+    if std > 0:
+        subseq = (subseq - mean) / std
+    else:
+        subseq = np.zeros(length)
+
+    best_dist = 0
+    for i in range(subseq.shape[0]):
+        temp = shapelet[i] - subseq[i]
+        best_dist += temp * temp
+
+    for pos in range(means.shape[0]):
+        if pos == position:
+            continue
+
+        mean = means[pos]
+        std = stds[pos]
+        dist = 0
+        use_std = std != 0
+        for j in range(length):
+            val = (series[pos + sorted_indicies[j]] - mean) / std if use_std else 0
+            temp = shapelet[sorted_indicies[j]] - val
+            dist += temp * temp
+
+            if dist > best_dist:
+                break
+
+        if dist < best_dist:
+            best_dist = dist
+
+    return best_dist if best_dist == 0 else 1 / length * best_dist
+
+
 @njit(fastmath=True, cache=True)
 def _calc_early_binary_ig(
     orderline,
@@ -660,7 +821,7 @@ def _calc_early_binary_ig(
 
     # evaluate each split point
     for split in range(len(orderline)):
-        next_class = orderline[split][1]  # +1 if this class, -1 if other
+        next_class = orderline[split]  # +1 if this class, -1 if other
         if next_class > 0:
             c1_count += 1
         else:
@@ -714,7 +875,7 @@ def _calc_binary_ig(orderline, c1, c2):
 
     # evaluate each split point
     for split in range(len(orderline)):
-        next_class = orderline[split][1]  # +1 if this class, -1 if other
+        next_class = orderline[split]  # +1 if this class, -1 if other
         if next_class > 0:
             c1_count += 1
         else:
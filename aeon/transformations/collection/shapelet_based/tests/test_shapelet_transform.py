@@ -1,9 +1,18 @@
 """Test shapelet transform."""
 
+import numpy as np
 import pytest
+from numpy.testing import assert_array_almost_equal
 
 from aeon.transformations.collection.shapelet_based import RandomShapeletTransform
-from aeon.utils._testing.collection import make_3d_test_data
+from aeon.transformations.collection.shapelet_based._shapelet_transform import (
+    _online_shapelet_distance,
+)
+from aeon.utils._testing.collection import (
+    make_3d_test_data,
+    make_unequal_length_test_data,
+)
+from aeon.utils.numba.general import z_normalise_series
 
 
 def test_shapelet_transform():
@@ -22,3 +31,70 @@ def test_shapelet_transform():
         "smaller than the min shapelet length",
     ):
         rst._transform(X)
+
+
+@pytest.mark.parametrize("equal_length", [True, False])
+def test_shapelet_transform_distances(equal_length):
+    """Test the batched transform against the distance of each shapelet."""
+    if equal_length:
+        X, y = make_3d_test_data(n_cases=10, n_channels=2, n_timepoints=30)
+    else:
+        X, y = make_unequal_length_test_data(
+            n_cases=10, n_channels=2, min_series_length=25, max_series_length=35
+        )
+    rst = RandomShapeletTransform(
+        n_shapelet_samples=50, max_shapelets=10, n_jobs=2, random_state=0
+    )
+    X_t = rst.fit_transform(X, y)
+
+    expected = np.array(
+        [
+            [
+                _online_shapelet_distance(
+                    series[shapelet[3]],
+                    shapelet[6],
+                    rst._sorted_indicies[n],
+                    shapelet[2],
+                    shapelet[1],
+                )
+                for n, shapelet in enumerate(rst.shapelets)
+            ]
+            for series in X
+        ]
+    )
+    assert_array_almost_equal(X_t, expected)
+
+
+def test_shapelet_quality_pruning():
+    """Test that candidates are only pruned if they cannot beat the worst quality."""
+    X, y = make_3d_test_data(n_cases=20, n_timepoints=30, n_labels=2, random_state=0)
+    rng = np.random.RandomState(0)
+    for _ in range(20):
+        inst_idx = rng.randint(20)
+        length = rng.randint(3, 20)
+        position = rng.randint(30 - length)
+        shapelet = z_normalise_series(X[inst_idx, 0, position : position + length])
+        sorted_indicies = np.argsort(-np.abs(shapelet), kind="stable")
+        this_cls_count = np.sum(y == y[inst_idx])
+
+        args = (
+            X,
+            y,
+            shapelet,
+            sorted_indicies,
+            position,
+            length,
+            0,
+            inst_idx,
+            this_cls_count,
+            20 - this_cls_count,
+        )
+        quality = RandomShapeletTransform._find_shapelet_quality(*args, -1.0)
+        for worst_quality in [0.01, quality / 2, quality * 2]:
+            pruned = RandomShapeletTransform._find_shapelet_quality(
+                *args, worst_quality
+            )
+            if pruned == -1:
+                assert quality <= worst_quality + 1e-10
+            else:
+                assert pruned == quality
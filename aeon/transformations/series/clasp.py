@@ -76,7 +76,8 @@ def _sliding_mean_std(X, m):
 def _compute_distances_iterative(X, m, k):
     """Compute kNN indices with dot-product.
 
-    No-loops implementation for a time series, given
+    The dot products of each subsequence with all the others are derived from the
+    ones of the previous subsequence in a compiled loop, for a time series, given
     a window size and k neighbours.
 
     Parameters
@@ -93,50 +94,125 @@ def _compute_distances_iterative(X, m, k):
     knns : array-like, shape = [n-m+1, k], dtype=int
         The knns (offsets!) for each subsequence in X
     """
-    length = len(X) - m + 1
-    knns = np.zeros(shape=(length, k), dtype=np.int64)
-
-    dot_prev = None
+    X = np.asarray(X, dtype=np.float64)
     means, stds = _sliding_mean_std(X, m)
+    dot_first = _sliding_dot_products(X[:m], X, m, len(X))
+    return _compute_knn(X, m, k, means, stds, dot_first, *_exclusion_bounds(m))
 
-    for order in range(0, length):
-        # first iteration O(n log n)
-        if order == 0:
-            # dot_first = _sliding_dot_product(X[:m], X)
-            dot_first = _sliding_dot_products(X[:m], X, len(X[:m]), len(X))
-            dot_rolled = dot_first
-        # O(1) further operations
-        else:
-            dot_rolled = (
-                np.roll(dot_prev, 1)
-                + X[order + m - 1] * X[m - 1 : length + m]
-                - X[order - 1] * np.roll(X[:length], 1)
-            )
-            dot_rolled[0] = dot_first[order]
 
-        x_mean = means[order]
-        x_std = stds[order]
+def _constrain_knn(X, knn, m, k, lbound, ubound):
+    """Derive the kNN indices of a range of X from the ones of the whole series.
 
-        dist = 2 * m * (1 - (dot_rolled - m * means * x_mean) / (m * stds * x_std))
+    The distances between subsequences do not depend on the range, so the global
+    k nearest neighbours of a subsequence which all lie in the range are also its
+    k nearest neighbours in the range. Only the subsequences with a neighbour
+    outside of the range are recomputed.
 
-        # self-join: exclusion zone
-        trivialMatchRange = (
-            int(max(0, order - np.round(m / 2, 0))),
-            int(min(order + np.round(m / 2 + 1, 0), length)),
-        )
-        dist[trivialMatchRange[0] : trivialMatchRange[1]] = np.inf
+    Parameters
+    ----------
+    X : array-like, shape [n]
+        A single univariate time series of length n
+    knn : array-like, shape = [n-m+1, k], dtype=int
+        The knns of each subsequence in X, as given by _compute_distances_iterative
+    m : int
+        The window size to generate sliding windows
+    k : int
+        The number of nearest neighbors
+    lbound : int
+        Start of the range in X
+    ubound : int
+        End (exclusive) of the range in X
 
-        if len(dist) >= k:
-            idx = np.argpartition(dist, k)
-        else:
-            idx = np.arange(len(dist))
+    Returns
+    -------
+    knns : array-like, shape = [ubound-lbound-m+1, k], dtype=int
+        The knns (offsets!) for each subsequence in X[lbound:ubound]
+    """
+    n_subs = ubound - lbound - m + 1
+    knn = knn[lbound : lbound + n_subs] - lbound
+    rows = np.flatnonzero(np.any((knn < 0) | (knn >= n_subs), axis=1))
+    if rows.shape[0] > 0:
+        X = np.asarray(X[lbound:ubound], dtype=np.float64)
+        means, stds = _sliding_mean_std(X, m)
+        knn[rows] = _compute_knn_rows(X, m, k, means, stds, rows, *_exclusion_bounds(m))
+    return knn
 
-        knns[order, :] = idx[:k]
-        dot_prev = dot_rolled
+
+def _exclusion_bounds(m):
+    # Subsequences in [order - left, order + right) are trivial matches of order
+    return int(np.round(m / 2, 0)), int(np.round(m / 2 + 1, 0))
+
+
+@njit(fastmath=True, cache=True)
+def _compute_knn(X, m, k, means, stds, dot_first, ez_left, ez_right):
+    length = X.shape[0] - m + 1
+    knns = np.zeros(shape=(length, k), dtype=np.int64)
+    dot = dot_first.copy()
+    dist = np.zeros(length)
+
+    for order in range(length):
+        # O(1) update of each dot product from the previous subsequence
+        if order > 0:
+            for j in range(length - 1, 0, -1):
+                dot[j] = (
+                    dot[j - 1]
+                    + X[order + m - 1] * X[j + m - 1]
+                    - X[order - 1] * X[j - 1]
+                )
+            dot[0] = dot_first[order]
+        _knn_row(dot, means, stds, order, m, ez_left, ez_right, dist, knns[order])
+
+    return knns
+
+
+@njit(fastmath=True, cache=True)
+def _compute_knn_rows(X, m, k, means, stds, rows, ez_left, ez_right):
+    length = X.shape[0] - m + 1
+    knns = np.zeros(shape=(rows.shape[0], k), dtype=np.int64)
+    dot = np.zeros(length)
+    dist = np.zeros(length)
+
+    for i in range(rows.shape[0]):
+        order = rows[i]
+        for j in range(length):
+            dot[j] = 0.0
+            for t in range(m):
+                dot[j] += X[order + t] * X[j + t]
+        _knn_row(dot, means, stds, order, m, ez_left, ez_right, dist, knns[i])
 
     return knns
 
 
+@njit(fastmath=True, cache=True)
+def _knn_row(dot, means, stds, order, m, ez_left, ez_right, dist, knn):
+    length = dot.shape[0]
+    k = knn.shape[0]
+    for j in range(length):
+        dist[j] = (
+            2
+            * m
+            * (1 - (dot[j] - m * means[j] * means[order]) / (m * stds[j] * stds[order]))
+        )
+
+    # self-join: exclusion zone
+    for j in range(max(0, order - ez_left), min(order + ez_right, length)):
+        dist[j] = np.inf
+
+    # keep the k smallest distances, sorted, ties going to the smallest offset
+    best = np.full(k, np.inf)
+    n_best = 0
+    for j in range(length):
+        if n_best < k or dist[j] < best[n_best - 1]:
+            pos = min(n_best, k - 1)
+            while pos > 0 and best[pos - 1] > dist[j]:
+                best[pos] = best[pos - 1]
+                knn[pos] = knn[pos - 1]
+                pos -= 1
+            best[pos] = dist[j]
+            knn[pos] = j
+            n_best = min(n_best + 1, k)
+
+
 @njit(fastmath=True, cache=True)
 def _calc_knn_labels(knn_mask, split_idx, m):
     """Compute kNN indices relabeling at a given split index.
@@ -185,7 +261,7 @@ def _calc_knn_labels(knn_mask, split_idx, m):
     return y_true, y_pred
 
 
-@njit(fastmath=True, cache=False)
+@njit(fastmath=True, cache=True)
 def _binary_f1_score(y_true, y_pred):
     """Compute f1-score.
 
@@ -316,6 +392,7 @@ def clasp(
     score=_roc_auc_score,
     interpolate=True,
     exclusion_radius=0.05,
+    knn=None,
 ):
     """Calculate ClaSP for a time series and a window size.
 
@@ -333,13 +410,17 @@ def clasp(
         Interpolate the profile
     exclusion_radius : int
         Blind spot of the profile to the corners
+    knn : array-like, shape = [n-m+1, k_neighbours], dtype=int, default=None
+        Precomputed knns of each subsequence, computed if None
 
     Returns
     -------
     Tuple (array-like of shape [n], array-like of shape [k_neighbours, n])
         The ClaSP and the knn_mask
     """
-    knn_mask = _compute_distances_iterative(X, m, k_neighbours).T
+    if knn is None:
+        knn = _compute_distances_iterative(X, m, k_neighbours)
+    knn_mask = knn.T
 
     n_timepoints = knn_mask.shape[1]
     exclusion_zone = max(m, np.int64(n_timepoints * exclusion_radius))
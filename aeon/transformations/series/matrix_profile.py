@@ -1,9 +1,20 @@
 """Implements matrix profile transformation."""
 
 __author__ = ["mloning"]
-__all__ = ["MatrixProfileTransformer"]
+__all__ = ["MatrixProfileTransformer", "StreamingMatrixProfile"]
+
+import math
+from copy import deepcopy
+
+import numpy as np
+from numba import njit
 
 from aeon.transformations.base import BaseTransformer
+from aeon.utils.numba.matrix_profile import (
+    _z_normalised_distance,
+    matrix_profile_self_join,
+    multivariate_matrix_profile_self_join,
+)
 
 
 class MatrixProfileTransformer(BaseTransformer):
@@ -14,17 +25,38 @@ class MatrixProfileTransformer(BaseTransformer):
     z-normalized Euclidean distance between any subsequence within a
     time series and its nearest neighbor.
 
+    For multivariate series, the multidimensional matrix profiles of mSTAMP are
+    returned: the k-th column is the profile obtained when each pair of subsequences
+    is compared on its k best matching channels.
+
     For more information on the matrix profile, see `stumpy's tutorial
     <https://stumpy.readthedocs.io/en/latest/Tutorial_The_Matrix_Profile.html>`_
 
     Parameters
     ----------
-    window_length : int
+    window_length : int, default=3
+        Length of the subsequences.
+    return_index : bool, default=False
+        Whether to also return the index profile, i.e. the start of the nearest
+        neighbour of each subsequence, after the matrix profile columns.
+    exclusion_zone : int, default=None
+        Subsequences starting at most exclusion_zone points from each other are not
+        compared. If None, ``ceil(window_length / 4)`` is used, as in stumpy.
+    n_jobs : int, default=1
+        The number of threads used to compute the matrix profile. ``-1`` means using
+        all processors.
 
     Notes
     -----
-    Provides wrapper around functionality in `stumpy.stump
-    <https://stumpy.readthedocs.io/en/latest/api.html#stumpy.stump>`_
+    The matrix profile is computed with the compiled STOMP implementation of
+    ``aeon.utils.numba.matrix_profile``. With the default exclusion zone, the
+    univariate profile is the one of `stumpy.stump
+    <https://stumpy.readthedocs.io/en/latest/api.html#stumpy.stump>`_.
+
+    References
+    ----------
+    .. [1] Yeh, C. C. M., Kavantzas, N. and Keogh, E. (2017). Matrix Profile VI:
+    Meaningful Multidimensional Motif Discovery. IEEE ICDM 2017.
 
     Examples
     --------
@@ -32,8 +64,8 @@ class MatrixProfileTransformer(BaseTransformer):
     MatrixProfileTransformer
     >>> from aeon.datasets import load_airline
     >>> y = load_airline()
-    >>> transformer = MatrixProfileTransformer()  # doctest: +SKIP
-    >>> y_hat = transformer.fit_transform(y)  # doctest: +SKIP
+    >>> transformer = MatrixProfileTransformer()
+    >>> y_hat = transformer.fit_transform(y)
     """
 
     _tags = {
@@ -45,13 +77,16 @@ class MatrixProfileTransformer(BaseTransformer):
         "X_inner_type": ["np.ndarray"],
         # which mtypes do _fit/_predict support for X?
         "y_inner_type": "None",  # which mtypes do _fit/_predict support for y?,
-        "univariate-only": True,
         "fit_is_empty": True,  # for unit test cases
-        "python_dependencies": "stumpy",
     }
 
-    def __init__(self, window_length=3):
+    def __init__(
+        self, window_length=3, return_index=False, exclusion_zone=None, n_jobs=1
+    ):
         self.window_length = window_length
+        self.return_index = return_index
+        self.exclusion_zone = exclusion_zone
+        self.n_jobs = n_jobs
         super(MatrixProfileTransformer, self).__init__()
 
     def _transform(self, X, y=None):
@@ -61,21 +96,354 @@ class MatrixProfileTransformer(BaseTransformer):
 
         Parameters
         ----------
-        X : 2D np.ndarray
+        X : np.ndarray, shape (n_timepoints,) or (n_timepoints, n_channels)
             Data to be transformed
         y : ignored argument for interface compatibility
             Additional data, e.g., labels for transformation
 
         Returns
         -------
-        Xt : 1D np.ndarray
-            transformed version of X
+        Xt : np.ndarray
             Matrix Profile of time series as output with length as
-            (n_timepoints-window_length+1)
+            (n_timepoints-window_length+1). It is 1D for a univariate series without
+            index, and otherwise has one column per channel for the matrix profiles,
+            followed by the same number of columns for the index profiles if
+            return_index is True.
+        """
+        exclusion_zone = (
+            math.ceil(self.window_length / 4)
+            if self.exclusion_zone is None
+            else self.exclusion_zone
+        )
+        X = X.reshape(X.shape[0], -1).T
+        if X.shape[0] == 1:
+            mp, ip = matrix_profile_self_join(
+                X[0], self.window_length, exclusion_zone, n_jobs=self.n_jobs
+            )
+            mp, ip = mp[np.newaxis], ip[np.newaxis]
+        else:
+            mp, ip = multivariate_matrix_profile_self_join(
+                X, self.window_length, exclusion_zone, n_jobs=self.n_jobs
+            )
+
+        if self.return_index:
+            return np.concatenate([mp, ip.astype(float)]).T
+        if mp.shape[0] == 1:
+            return mp[0]
+        return mp.T
+
+
+class StreamingMatrixProfile(BaseTransformer):
+    """Incrementally maintained matrix profile of a streaming time series (STAMPI).
+
+    The series is given in ``fit`` and extended with ``update``. For each new
+    subsequence, its dot products with all the previous subsequences are derived from
+    the ones of the previous subsequence, so that the distance profile, the matrix
+    profile and the index profile are updated in O(n) per appended point instead of
+    being recomputed.
+
+    The left matrix profile holds the distance of each subsequence to its nearest
+    neighbour among the subsequences that arrived before it, which is the discord
+    score of the subsequence at ingestion time. ``transform`` returns these scores for
+    the points of ``X`` as if they were appended to the series, without updating it.
+
+    Parameters
+    ----------
+    window_length : int, default=3
+        Length of the subsequences.
+    exclusion_zone : int, default=None
+        Subsequences starting at most exclusion_zone points from each other are not
+        compared. If None, window_length // 2 is used.
+    max_history : int, default=None
+        If given, only the last max_history points are kept in fixed size buffers,
+        older points and subsequences being discarded. The profiles of the kept
+        subsequences still account for the neighbours seen before they were
+        discarded. If None, the whole series is kept.
+
+    Attributes
+    ----------
+    matrix_profile_ : np.ndarray
+        The matrix profile of the subsequences in the history.
+    index_profile_ : np.ndarray
+        The start of the nearest neighbour of each subsequence, counted from the
+        first point given in ``fit``, or -1 if none has been compared.
+    left_matrix_profile_ : np.ndarray
+        The left matrix profile of the subsequences in the history.
+    left_index_profile_ : np.ndarray
+        The start of the nearest left neighbour of each subsequence, counted from
+        the first point given in ``fit``, or -1 if none has been compared.
+    n_timepoints_seen_ : int
+        The number of points given in ``fit`` and ``update``.
+
+    References
+    ----------
+    .. [1] Yeh, C. C. M., Zhu, Y., Ulanova, L., Begum, N., Ding, Y., Dau, H. A.,
+    Silva, D. F., Mueen, A. and Keogh, E. (2016). Matrix Profile I: All Pairs
+    Similarity Joins for Time Series: A Unifying View that Includes Motifs,
+    Discords and Shapelets. IEEE ICDM 2016.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.transformations.series.matrix_profile import StreamingMatrixProfile
+    >>> X = np.random.default_rng(0).normal(size=100)
+    >>> stream = StreamingMatrixProfile(window_length=10).fit(X[:90])
+    >>> scores = stream.transform(X[90:])
+    >>> stream = stream.update(X[90:])
+    >>> stream.matrix_profile_.shape
+    (91,)
+    """
+
+    _tags = {
+        "input_data_type": "Series",
+        "output_data_type": "Series",
+        "instancewise": True,
+        "univariate-only": True,
+        "X_inner_type": "np.ndarray",
+        "y_inner_type": "None",
+        "fit_is_empty": False,
+        "transform-returns-same-time-index": True,
+    }
+
+    def __init__(self, window_length=3, exclusion_zone=None, max_history=None):
+        self.window_length = window_length
+        self.exclusion_zone = exclusion_zone
+        self.max_history = max_history
+        super(StreamingMatrixProfile, self).__init__()
+
+    def _fit(self, X, y=None):
+        """Start the stream with the series X.
+
+        Parameters
+        ----------
+        X : np.ndarray, shape (n_timepoints, 1)
+            The first points of the series.
+        y : ignored argument for interface compatibility
+
+        Returns
+        -------
+        self
+        """
+        self._start()
+        self._append(X)
+        return self
+
+    def _update(self, X, y=None):
+        """Append the points of X to the series and update the profiles.
+
+        Parameters
+        ----------
+        X : np.ndarray, shape (n_timepoints, 1)
+            The new points of the series, in chronological order.
+        y : ignored argument for interface compatibility
+
+        Returns
+        -------
+        self
+        """
+        self._append(X)
+        return self
+
+    def _transform(self, X, y=None):
+        """Score the points of X as if they were appended to the series.
+
+        Parameters
+        ----------
+        X : np.ndarray, shape (n_timepoints, 1)
+            The points to score, following the series given in ``fit`` and
+            ``update``.
+        y : ignored argument for interface compatibility
+
+        Returns
+        -------
+        Xt : np.ndarray, shape (n_timepoints,)
+            The left matrix profile value of the subsequence ending at each point,
+            NaN if fewer than window_length points have been seen and inf if the
+            subsequence has no left neighbour outside the exclusion zone.
         """
-        import stumpy
+        return deepcopy(self)._append(X)
+
+    def _fit_transform(self, X, y=None):
+        """Start the stream with the series X and score its points.
+
+        Parameters
+        ----------
+        X : np.ndarray, shape (n_timepoints, 1)
+            The first points of the series.
+        y : ignored argument for interface compatibility
+
+        Returns
+        -------
+        Xt : np.ndarray, shape (n_timepoints,)
+            The left matrix profile value of the subsequence ending at each point,
+            see ``transform``.
+        """
+        self._start()
+        return self._append(X)
+
+    def _start(self):
+        if self.max_history is not None and self.max_history < self.window_length:
+            raise ValueError(
+                f"max_history must be at least window_length={self.window_length}, "
+                f"got {self.max_history}."
+            )
+        self._exclusion_zone = (
+            self.window_length // 2
+            if self.exclusion_zone is None
+            else self.exclusion_zone
+        )
+        self.n_timepoints_seen_ = 0
+        self._n = 0
+        self._allocate(
+            self.window_length if self.max_history is None else self.max_history
+        )
+
+    def _append(self, X):
+        new_points = np.asarray(X, dtype=np.float64).flatten()
+        if (
+            self.max_history is None
+            and self._n + new_points.shape[0] > self._T.shape[0]
+        ):
+            self._allocate(max(2 * self._T.shape[0], self._n + new_points.shape[0]))
+
+        scores = np.empty(new_points.shape[0])
+        self._n = _stampi_update(
+            new_points,
+            self._n,
+            self.window_length,
+            self._exclusion_zone,
+            self.n_timepoints_seen_ - self._n,
+            self._T,
+            self._means,
+            self._stds,
+            self._QT,
+            self._mp,
+            self._ip,
+            self._left_mp,
+            self._left_ip,
+            scores,
+        )
+        self.n_timepoints_seen_ += new_points.shape[0]
+
+        n_subs = max(self._n - self.window_length + 1, 0)
+        self.matrix_profile_ = self._mp[:n_subs].copy()
+        self.index_profile_ = self._ip[:n_subs].copy()
+        self.left_matrix_profile_ = self._left_mp[:n_subs].copy()
+        self.left_index_profile_ = self._left_ip[:n_subs].copy()
+        return scores
+
+    def _allocate(self, capacity):
+        # The buffers are indexed by the position of the points and subsequences in
+        # the history, the profiles are copied when the capacity grows.
+        buffers = {
+            "_T": np.float64,
+            "_means": np.float64,
+            "_stds": np.float64,
+            "_QT": np.float64,
+            "_mp": np.float64,
+            "_ip": np.int64,
+            "_left_mp": np.float64,
+            "_left_ip": np.int64,
+        }
+        for name, dtype in buffers.items():
+            buffer = np.zeros(capacity, dtype=dtype)
+            if hasattr(self, name):
+                old = getattr(self, name)
+                buffer[: old.shape[0]] = old
+            setattr(self, name, buffer)
+
+    @classmethod
+    def get_test_params(cls, parameter_set="default"):
+        """Return testing parameter settings for the estimator.
+
+        Parameters
+        ----------
+        parameter_set : str, default="default"
+            Name of the set of test parameters to return, for use in tests. If no
+            special parameters are defined for a value, will return `"default"` set.
+
+        Returns
+        -------
+        params : dict or list of dict, default = {}
+            Parameters to create testing instances of the class
+        """
+        return [{"window_length": 5}, {"window_length": 5, "max_history": 20}]
+
+
+@njit(cache=True, fastmath=True)
+def _stampi_update(
+    new_points,
+    n,
+    m,
+    exclusion_zone,
+    offset,
+    T,
+    means,
+    stds,
+    QT,
+    mp,
+    ip,
+    left_mp,
+    left_ip,
+    scores,
+):
+    capacity = T.shape[0]
+    for i, x in enumerate(new_points):
+        if n == capacity:
+            # Bounded history, discard the oldest point and subsequence
+            n_subs = n - m + 1
+            T[:-1] = T[1:]
+            means[: n_subs - 1] = means[1:n_subs]
+            stds[: n_subs - 1] = stds[1:n_subs]
+            QT[: n_subs - 1] = QT[1:n_subs]
+            mp[: n_subs - 1] = mp[1:n_subs]
+            ip[: n_subs - 1] = ip[1:n_subs]
+            left_mp[: n_subs - 1] = left_mp[1:n_subs]
+            left_ip[: n_subs - 1] = left_ip[1:n_subs]
+            n -= 1
+            offset += 1
+
+        T[n] = x
+        n += 1
+        s = n - m
+        if s < 0:
+            scores[i] = np.nan
+            continue
+
+        _mean = 0.0
+        for t in range(m):
+            _mean += T[s + t]
+        _mean /= m
+        _var = 0.0
+        for t in range(m):
+            _var += (T[s + t] - _mean) ** 2
+        means[s] = _mean
+        stds[s] = np.sqrt(_var / m)
+
+        # QT holds the dot products of the previous last subsequence with all the
+        # others, shift them to the new last subsequence.
+        for j in range(s, 0, -1):
+            QT[j] = QT[j - 1] - T[s - 1] * T[j - 1] + T[s + m - 1] * T[j + m - 1]
+        QT[0] = 0.0
+        for t in range(m):
+            QT[0] += T[s + t] * T[t]
+
+        min_dist = np.inf
+        min_idx = -1
+        for j in range(s - exclusion_zone):
+            dist = _z_normalised_distance(
+                QT[j], means[j], stds[j], means[s], stds[s], m
+            )
+            if dist < mp[j]:
+                mp[j] = dist
+                ip[j] = s + offset
+            if dist < min_dist:
+                min_dist = dist
+                min_idx = j + offset
+        mp[s] = min_dist
+        ip[s] = min_idx
+        left_mp[s] = min_dist
+        left_ip[s] = min_idx
+        scores[i] = min_dist
 
-        X = X.flatten()
-        Xt = stumpy.stump(X, self.window_length)
-        Xt = Xt[:, 0].astype("float")
-        return Xt
+    return n
@@ -0,0 +1,120 @@
+"""Tests for MatrixProfileTransformer."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from aeon.transformations.series.matrix_profile import (
+    MatrixProfileTransformer,
+    StreamingMatrixProfile,
+)
+from aeon.utils.numba.matrix_profile import (
+    matrix_profile_self_join,
+    multivariate_matrix_profile_self_join,
+)
+
+
+def test_matrix_profile_transformer_univariate():
+    """Test the output of the transformer on a univariate series."""
+    X = np.random.default_rng(0).normal(size=40)
+    mp, ip = matrix_profile_self_join(X, 5, exclusion_zone=2)
+
+    Xt = MatrixProfileTransformer(window_length=5).fit_transform(X)
+    assert_array_almost_equal(Xt, mp)
+
+    Xt = MatrixProfileTransformer(window_length=5, return_index=True).fit_transform(X)
+    assert Xt.shape == (36, 2)
+    assert_array_almost_equal(Xt[:, 0], mp)
+    assert_array_equal(Xt[:, 1], ip)
+
+
+def test_matrix_profile_transformer_multivariate():
+    """Test the output of the transformer on a multivariate series."""
+    X = np.random.default_rng(0).normal(size=(40, 3))
+    mp, ip = multivariate_matrix_profile_self_join(X.T, 5, exclusion_zone=2)
+
+    Xt = MatrixProfileTransformer(window_length=5, return_index=True).fit_transform(
+        pd.DataFrame(X)
+    )
+    assert Xt.shape == (36, 6)
+    assert_array_almost_equal(Xt.iloc[:, :3], mp.T)
+    assert_array_equal(Xt.iloc[:, 3:], ip.T)
+
+
+@pytest.mark.parametrize("window_length", [3, 6, 9])
+def test_matrix_profile_transformer_exclusion_zone(window_length):
+    """Test the default exclusion zone against the previous stumpy based output."""
+    X = np.random.default_rng(0).normal(size=60)
+
+    # brute force profile with the exclusion zone of stumpy.stump, ceil(m / 4)
+    n_subs = len(X) - window_length + 1
+    subs = np.array([X[i : i + window_length] for i in range(n_subs)])
+    subs = (subs - subs.mean(axis=1, keepdims=True)) / subs.std(axis=1, keepdims=True)
+    dists = np.sqrt(((subs[:, np.newaxis] - subs[np.newaxis]) ** 2).sum(axis=2))
+    offsets = np.abs(np.subtract.outer(np.arange(n_subs), np.arange(n_subs)))
+    dists[offsets <= np.ceil(window_length / 4)] = np.inf
+
+    Xt = MatrixProfileTransformer(window_length=window_length).fit_transform(X)
+    assert_array_almost_equal(Xt, dists.min(axis=1))
+
+    Xt = MatrixProfileTransformer(
+        window_length=window_length, exclusion_zone=window_length // 2
+    ).fit_transform(X)
+    assert_array_almost_equal(Xt, matrix_profile_self_join(X, window_length)[0])
+
+
+def test_streaming_matrix_profile():
+    """Test the incremental profiles against the batch computation."""
+    X = np.random.default_rng(0).normal(size=120)
+    stream = StreamingMatrixProfile(window_length=8).fit(X[:7])
+    for i in range(7, 120, 7):
+        stream.update(X[i : i + 7])
+    mp, ip = matrix_profile_self_join(X, 8)
+    assert stream.n_timepoints_seen_ == 120
+    assert_array_almost_equal(stream.matrix_profile_, mp)
+    assert_array_equal(stream.index_profile_, ip)
+
+    # The left profile of a subsequence is its profile when it arrived
+    mp_left, ip_left = matrix_profile_self_join(X[:60], 8)
+    assert_array_almost_equal(stream.left_matrix_profile_[52], mp_left[-1])
+    assert stream.left_index_profile_[52] == ip_left[-1]
+
+
+def test_streaming_matrix_profile_bounded():
+    """Test that the bounded history gives the same profiles within the history."""
+    X = np.random.default_rng(0).normal(size=120)
+    stream = StreamingMatrixProfile(window_length=8, max_history=50).fit(X)
+    assert stream.matrix_profile_.shape == (43,)
+
+    # The newest subsequence is only compared with the last 50 points
+    stream_window = StreamingMatrixProfile(window_length=8).fit(X[70:])
+    assert_array_almost_equal(
+        stream.left_matrix_profile_[-1], stream_window.left_matrix_profile_[-1]
+    )
+    assert stream.left_index_profile_[-1] == stream_window.left_index_profile_[-1] + 70
+    assert np.all(stream.matrix_profile_ <= stream_window.matrix_profile_ + 1e-8)
+
+
+def test_streaming_matrix_profile_transform():
+    """Test that transform scores points without updating the stream."""
+    X = np.random.default_rng(0).normal(size=100)
+    stream = StreamingMatrixProfile(window_length=8)
+    scores = stream.fit_transform(X[:80])
+    assert scores.shape == (80,)
+    assert np.all(np.isnan(scores[:7]))
+    assert_array_almost_equal(scores[7:], stream.left_matrix_profile_)
+
+    scores = stream.transform(X[80:])
+    assert stream.n_timepoints_seen_ == 80
+    stream.update(X[80:])
+    assert_array_almost_equal(scores, stream.left_matrix_profile_[-20:])
+
+    # parameters are not changed and the state is rebuilt by fit
+    assert stream.get_params()["max_history"] is None
+    clone = stream.clone()
+    assert not hasattr(clone, "matrix_profile_")
+    clone.fit(X)
+    assert_array_almost_equal(clone.matrix_profile_, stream.matrix_profile_)
+    with pytest.raises(ValueError, match="max_history"):
+        StreamingMatrixProfile(window_length=8, max_history=5).fit(X)
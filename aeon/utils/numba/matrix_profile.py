@@ -0,0 +1,436 @@
+"""Compiled matrix profile computations.
+
+The matrix profiles are computed with a diagonal traversal of the distance matrix
+(STOMP/SCRIMP): along a diagonal, the dot product of two subsequences is updated in
+constant time from the one of the previous pair. Diagonals are independent, so they
+are split across numba threads. Processing only a random subset of the diagonals
+gives an approximate profile which converges to the exact one (anytime SCRIMP).
+"""
+
+__all__ = [
+    "sliding_mean_std",
+    "matrix_profile_self_join",
+    "matrix_profile_ab_join",
+    "multivariate_matrix_profile_self_join",
+]
+
+import numpy as np
+from numba import get_num_threads, njit, prange, set_num_threads
+from numba.core.config import NUMBA_NUM_THREADS
+from sklearn.utils import check_random_state
+
+from aeon.utils.validation import check_n_jobs
+
+# Subsequences with a standard deviation below this threshold are considered
+# constant when z-normalising.
+STD_THRESHOLD = 1e-8
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def sliding_mean_std(X: np.ndarray, m: int):
+    """Return the mean and standard deviation of all the subsequences of X.
+
+    Each window is computed independently, which avoids the loss of precision of
+    running sums on long series.
+
+    Parameters
+    ----------
+    X : np.ndarray, shape (n_timepoints,)
+        A univariate time series.
+    m : int
+        Length of the subsequences.
+
+    Returns
+    -------
+    mean : np.ndarray, shape (n_timepoints - m + 1,)
+        The mean of each subsequence of length m in X.
+    std : np.ndarray, shape (n_timepoints - m + 1,)
+        The standard deviation of each subsequence of length m in X.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.utils.numba.matrix_profile import sliding_mean_std
+    >>> mean, std = sliding_mean_std(np.array([1.0, 2.0, 3.0, 5.0]), 2)
+    >>> mean
+    array([1.5, 2.5, 4. ])
+    """
+    n_subs = X.shape[0] - m + 1
+    mean = np.zeros(n_subs)
+    std = np.zeros(n_subs)
+    for i in prange(n_subs):
+        _mean = 0.0
+        for t in range(m):
+            _mean += X[i + t]
+        _mean /= m
+        _var = 0.0
+        for t in range(m):
+            _var += (X[i + t] - _mean) ** 2
+        mean[i] = _mean
+        std[i] = np.sqrt(_var / m)
+    return mean, std
+
+
+def matrix_profile_self_join(
+    X, m, exclusion_zone=None, percentage=1.0, random_state=None, n_jobs=1
+):
+    """Compute the matrix profile of a time series with itself.
+
+    The matrix profile gives, for each subsequence of length m of X, the z-normalised
+    Euclidean distance to its nearest neighbour among the other subsequences of X,
+    excluding the trivial matches around it.
+
+    Parameters
+    ----------
+    X : np.ndarray, shape (n_timepoints,)
+        A univariate time series.
+    m : int
+        Length of the subsequences.
+    exclusion_zone : int, default=None
+        Subsequences starting at most exclusion_zone points from each other are not
+        compared. If None, m // 2 is used.
+    percentage : float, default=1.0
+        Fraction of the diagonals of the distance matrix to compute. If lower than
+        1, a random subset of the diagonals is used and the profile is an upper bound
+        of the exact one (anytime SCRIMP).
+    random_state : int, RandomState instance or None, default=None
+        Random state used to select the diagonals when percentage is lower than 1.
+    n_jobs : int, default=1
+        The number of threads used to compute the diagonals. ``-1`` means using all
+        processors.
+
+    Returns
+    -------
+    mp : np.ndarray, shape (n_timepoints - m + 1,)
+        The matrix profile.
+    ip : np.ndarray, shape (n_timepoints - m + 1,)
+        The index profile, i.e. the start of the nearest neighbour of each
+        subsequence, or -1 if no subsequence was compared.
+
+    References
+    ----------
+    .. [1] Zhu, Y., Zimmerman, Z., Senobari, N. S., Yeh, C. C. M., Funning, G.,
+    Mueen, A., Brisk, P. and Keogh, E. (2016). Matrix Profile II: Exploiting a Novel
+    Algorithm and GPUs to Break the One Hundred Million Barrier for Time Series Motifs
+    and Joins. IEEE ICDM 2016.
+    .. [2] Zhu, Y., Yeh, C. C. M., Zimmerman, Z., Kamgar, K. and Keogh, E. (2018).
+    Matrix Profile XI: SCRIMP++: Time Series Motif Discovery at Interactive Speeds.
+    IEEE ICDM 2018.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.utils.numba.matrix_profile import matrix_profile_self_join
+    >>> X = np.array([0.0, 1.0, 3.0, 2.0, 9.0, 1.0, 4.0, 2.0, 8.0, 0.0])
+    >>> mp, ip = matrix_profile_self_join(X, 3)
+    >>> ip
+    array([2, 5, 6, 7, 6, 1, 2, 3])
+    """
+    X = np.asarray(X, dtype=np.float64).flatten()
+    n_subs = X.shape[0] - m + 1
+    if exclusion_zone is None:
+        exclusion_zone = m // 2
+    means, stds = sliding_mean_std(X, m)
+    diagonals = _select_diagonals(
+        np.arange(exclusion_zone + 1, n_subs), percentage, random_state
+    )
+    return _run_parallel(_stomp_self_join, n_jobs, X, m, means, stds, diagonals, n_subs)
+
+
+def matrix_profile_ab_join(X, Y, m, percentage=1.0, random_state=None, n_jobs=1):
+    """Compute the matrix profiles between two time series.
+
+    The matrix profile of X against Y gives, for each subsequence of length m of X,
+    the z-normalised Euclidean distance to its nearest neighbour among the
+    subsequences of Y. Both the profile of X against Y and the one of Y against X are
+    obtained from the same distances, so they are computed together.
+
+    Parameters
+    ----------
+    X : np.ndarray, shape (n_timepoints,)
+        A univariate time series.
+    Y : np.ndarray, shape (m_timepoints,)
+        A univariate time series.
+    m : int
+        Length of the subsequences.
+    percentage : float, default=1.0
+        Fraction of the diagonals of the distance matrix to compute. If lower than
+        1, a random subset of the diagonals is used and the profiles are upper bounds
+        of the exact ones (anytime SCRIMP).
+    random_state : int, RandomState instance or None, default=None
+        Random state used to select the diagonals when percentage is lower than 1.
+    n_jobs : int, default=1
+        The number of threads used to compute the diagonals. ``-1`` means using all
+        processors.
+
+    Returns
+    -------
+    mp_ab : np.ndarray, shape (n_timepoints - m + 1,)
+        The matrix profile of X against Y.
+    ip_ab : np.ndarray, shape (n_timepoints - m + 1,)
+        The index in Y of the nearest neighbour of each subsequence of X.
+    mp_ba : np.ndarray, shape (m_timepoints - m + 1,)
+        The matrix profile of Y against X.
+    ip_ba : np.ndarray, shape (m_timepoints - m + 1,)
+        The index in X of the nearest neighbour of each subsequence of Y.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.utils.numba.matrix_profile import matrix_profile_ab_join
+    >>> X = np.array([1.0, 3.0, 2.0, 6.0, 4.0, 1.0])
+    >>> Y = np.array([5.0, 2.0, 6.0, 3.0, 0.0])
+    >>> mp_ab, ip_ab, mp_ba, ip_ba = matrix_profile_ab_join(X, Y, 3)
+    >>> ip_ab
+    array([1, 0, 1, 2])
+    """
+    X = np.asarray(X, dtype=np.float64).flatten()
+    Y = np.asarray(Y, dtype=np.float64).flatten()
+    n_subs_x = X.shape[0] - m + 1
+    n_subs_y = Y.shape[0] - m + 1
+    X_means, X_stds = sliding_mean_std(X, m)
+    Y_means, Y_stds = sliding_mean_std(Y, m)
+    # Diagonal k holds the pairs (i, i + k) of subsequences of X and Y
+    diagonals = _select_diagonals(
+        np.arange(-(n_subs_x - 1), n_subs_y), percentage, random_state
+    )
+    return _run_parallel(
+        _stomp_ab_join,
+        n_jobs,
+        X,
+        Y,
+        m,
+        X_means,
+        X_stds,
+        Y_means,
+        Y_stds,
+        diagonals,
+    )
+
+
+def multivariate_matrix_profile_self_join(
+    X, m, exclusion_zone=None, percentage=1.0, random_state=None, n_jobs=1
+):
+    """Compute the multivariate matrix profile of a time series with itself.
+
+    Following mSTAMP, the k-dimensional matrix profile gives, for each subsequence,
+    the distance to its nearest neighbour when only the k best matching channels of
+    each pair of subsequences are used. The distance between two multivariate
+    subsequences over k channels is the mean of their k smallest z-normalised
+    Euclidean distances over the channels.
+
+    Parameters
+    ----------
+    X : np.ndarray, shape (n_channels, n_timepoints)
+        A multivariate time series.
+    m : int
+        Length of the subsequences.
+    exclusion_zone : int, default=None
+        Subsequences starting at most exclusion_zone points from each other are not
+        compared. If None, m // 2 is used.
+    percentage : float, default=1.0
+        Fraction of the diagonals of the distance matrix to compute. If lower than
+        1, a random subset of the diagonals is used and the profiles are upper bounds
+        of the exact ones (anytime SCRIMP).
+    random_state : int, RandomState instance or None, default=None
+        Random state used to select the diagonals when percentage is lower than 1.
+    n_jobs : int, default=1
+        The number of threads used to compute the diagonals. ``-1`` means using all
+        processors.
+
+    Returns
+    -------
+    mp : np.ndarray, shape (n_channels, n_timepoints - m + 1)
+        The matrix profiles, ``mp[k]`` being the (k + 1)-dimensional one.
+    ip : np.ndarray, shape (n_channels, n_timepoints - m + 1)
+        The index profiles matching each matrix profile.
+
+    References
+    ----------
+    .. [1] Yeh, C. C. M., Kavantzas, N. and Keogh, E. (2017). Matrix Profile VI:
+    Meaningful Multidimensional Motif Discovery. IEEE ICDM 2017.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.utils.numba.matrix_profile import (
+    ...     multivariate_matrix_profile_self_join
+    ... )
+    >>> X = np.array([
+    ...     [0.0, 1.0, 3.0, 2.0, 9.0, 1.0, 4.0, 2.0, 8.0, 0.0],
+    ...     [1.0, 3.0, 2.0, 6.0, 4.0, 1.0, 3.0, 2.0, 6.0, 5.0],
+    ... ])
+    >>> mp, ip = multivariate_matrix_profile_self_join(X, 3)
+    >>> mp.shape
+    (2, 8)
+    """
+    X = np.asarray(X, dtype=np.float64)
+    if X.ndim == 1:
+        X = X.reshape(1, -1)
+    n_channels = X.shape[0]
+    n_subs = X.shape[1] - m + 1
+    if exclusion_zone is None:
+        exclusion_zone = m // 2
+    means = np.zeros((n_channels, n_subs))
+    stds = np.zeros((n_channels, n_subs))
+    for c in range(n_channels):
+        means[c], stds[c] = sliding_mean_std(X[c], m)
+    diagonals = _select_diagonals(
+        np.arange(exclusion_zone + 1, n_subs), percentage, random_state
+    )
+    return _run_parallel(
+        _mstamp_self_join, n_jobs, X, m, means, stds, diagonals, n_subs
+    )
+
+
+def _select_diagonals(diagonals, percentage, random_state):
+    if percentage < 1.0:
+        rng = check_random_state(random_state)
+        n_diagonals = int(np.ceil(percentage * diagonals.shape[0]))
+        diagonals = rng.permutation(diagonals)[:n_diagonals]
+    return diagonals.astype(np.int64)
+
+
+def _run_parallel(kernel, n_jobs, *args):
+    prev_threads = get_num_threads()
+    n_threads = min(check_n_jobs(n_jobs), NUMBA_NUM_THREADS)
+    set_num_threads(n_threads)
+    try:
+        return kernel(*args, n_threads)
+    finally:
+        set_num_threads(prev_threads)
+
+
+@njit(cache=True, fastmath=True)
+def _z_normalised_distance(qt, mean_x, std_x, mean_y, std_y, m):
+    if std_x < STD_THRESHOLD or std_y < STD_THRESHOLD:
+        # Two constant subsequences are equal once z-normalised, a constant one is
+        # at distance sqrt(m) of any other.
+        if std_x < STD_THRESHOLD and std_y < STD_THRESHOLD:
+            return 0.0
+        return np.sqrt(m)
+    correlation = (qt - m * mean_x * mean_y) / (m * std_x * std_y)
+    return np.sqrt(max(2 * m * (1 - correlation), 0.0))
+
+
+@njit(cache=True, fastmath=True)
+def _reduce_profiles(mp, ip):
+    n_chunks, n_subs = mp.shape
+    best_mp = mp[0].copy()
+    best_ip = ip[0].copy()
+    for c in range(1, n_chunks):
+        for i in range(n_subs):
+            if mp[c, i] < best_mp[i] or (
+                mp[c, i] == best_mp[i] and ip[c, i] >= 0 and ip[c, i] < best_ip[i]
+            ):
+                best_mp[i] = mp[c, i]
+                best_ip[i] = ip[c, i]
+    return best_mp, best_ip
+
+
+@njit(cache=True, fastmath=True)
+def _update(mp, ip, c, i, j, dist):
+    if dist < mp[c, i] or (dist == mp[c, i] and j < ip[c, i]):
+        mp[c, i] = dist
+        ip[c, i] = j
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _stomp_self_join(X, m, means, stds, diagonals, n_subs, n_chunks):
+    n_diagonals = diagonals.shape[0]
+    n_chunks = max(1, min(n_chunks, n_diagonals))
+    mp = np.full((n_chunks, n_subs), np.inf)
+    ip = np.full((n_chunks, n_subs), -1, dtype=np.int64)
+
+    # Diagonals are interleaved between chunks to balance their lengths
+    for c in prange(n_chunks):
+        for d in range(c, n_diagonals, n_chunks):
+            k = diagonals[d]
+            qt = 0.0
+            for t in range(m):
+                qt += X[t] * X[k + t]
+            for i in range(n_subs - k):
+                j = i + k
+                if i > 0:
+                    qt += X[i + m - 1] * X[j + m - 1] - X[i - 1] * X[j - 1]
+                dist = _z_normalised_distance(
+                    qt, means[i], stds[i], means[j], stds[j], m
+                )
+                _update(mp, ip, c, i, j, dist)
+                _update(mp, ip, c, j, i, dist)
+
+    return _reduce_profiles(mp, ip)
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _stomp_ab_join(X, Y, m, X_means, X_stds, Y_means, Y_stds, diagonals, n_chunks):
+    n_subs_x = X.shape[0] - m + 1
+    n_subs_y = Y.shape[0] - m + 1
+    n_diagonals = diagonals.shape[0]
+    n_chunks = max(1, min(n_chunks, n_diagonals))
+    mp_ab = np.full((n_chunks, n_subs_x), np.inf)
+    ip_ab = np.full((n_chunks, n_subs_x), -1, dtype=np.int64)
+    mp_ba = np.full((n_chunks, n_subs_y), np.inf)
+    ip_ba = np.full((n_chunks, n_subs_y), -1, dtype=np.int64)
+
+    for c in prange(n_chunks):
+        for d in range(c, n_diagonals, n_chunks):
+            k = diagonals[d]
+            i_start = max(0, -k)
+            i_end = min(n_subs_x, n_subs_y - k)
+            qt = 0.0
+            for t in range(m):
+                qt += X[i_start + t] * Y[i_start + k + t]
+            for i in range(i_start, i_end):
+                j = i + k
+                if i > i_start:
+                    qt += X[i + m - 1] * Y[j + m - 1] - X[i - 1] * Y[j - 1]
+                dist = _z_normalised_distance(
+                    qt, X_means[i], X_stds[i], Y_means[j], Y_stds[j], m
+                )
+                _update(mp_ab, ip_ab, c, i, j, dist)
+                _update(mp_ba, ip_ba, c, j, i, dist)
+
+    mp_ab, ip_ab = _reduce_profiles(mp_ab, ip_ab)
+    mp_ba, ip_ba = _reduce_profiles(mp_ba, ip_ba)
+    return mp_ab, ip_ab, mp_ba, ip_ba
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _mstamp_self_join(X, m, means, stds, diagonals, n_subs, n_chunks):
+    n_channels = X.shape[0]
+    n_diagonals = diagonals.shape[0]
+    n_chunks = max(1, min(n_chunks, n_diagonals))
+    mp = np.full((n_chunks, n_channels * n_subs), np.inf)
+    ip = np.full((n_chunks, n_channels * n_subs), -1, dtype=np.int64)
+
+    for c in prange(n_chunks):
+        qt = np.zeros(n_channels)
+        dist = np.zeros(n_channels)
+        for d in range(c, n_diagonals, n_chunks):
+            k = diagonals[d]
+            for i in range(n_subs - k):
+                j = i + k
+                for ch in range(n_channels):
+                    if i == 0:
+                        qt[ch] = 0.0
+                        for t in range(m):
+                            qt[ch] += X[ch, t] * X[ch, k + t]
+                    else:
+                        qt[ch] += (
+                            X[ch, i + m - 1] * X[ch, j + m - 1]
+                            - X[ch, i - 1] * X[ch, j - 1]
+                        )
+                    dist[ch] = _z_normalised_distance(
+                        qt[ch], means[ch, i], stds[ch, i], means[ch, j], stds[ch, j], m
+                    )
+                # The k-dimensional distance uses the k best matching channels
+                dist_sorted = np.sort(dist)
+                cum_dist = 0.0
+                for ch in range(n_channels):
+                    cum_dist += dist_sorted[ch]
+                    _update(mp, ip, c, ch * n_subs + i, j, cum_dist / (ch + 1))
+                    _update(mp, ip, c, ch * n_subs + j, i, cum_dist / (ch + 1))
+
+    mp, ip = _reduce_profiles(mp, ip)
+    return mp.reshape((n_channels, n_subs)), ip.reshape((n_channels, n_subs))
@@ -0,0 +1,113 @@
+"""Tests for the compiled matrix profile functions."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from aeon.utils.numba.matrix_profile import (
+    matrix_profile_ab_join,
+    matrix_profile_self_join,
+    multivariate_matrix_profile_self_join,
+    sliding_mean_std,
+)
+
+
+def _brute_force_distances(X, Y, m):
+    X_subs = np.array([X[i : i + m] for i in range(X.shape[0] - m + 1)])
+    Y_subs = np.array([Y[i : i + m] for i in range(Y.shape[0] - m + 1)])
+    X_subs = (X_subs - X_subs.mean(axis=1, keepdims=True)) / X_subs.std(
+        axis=1, keepdims=True
+    )
+    Y_subs = (Y_subs - Y_subs.mean(axis=1, keepdims=True)) / Y_subs.std(
+        axis=1, keepdims=True
+    )
+    return np.sqrt(((X_subs[:, None, :] - Y_subs[None, :, :]) ** 2).sum(axis=-1))
+
+
+def test_sliding_mean_std():
+    """Test the mean and std of the subsequences against numpy."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(loc=1e4, size=50)
+    mean, std = sliding_mean_std(X, 7)
+    subs = np.array([X[i : i + 7] for i in range(44)])
+    assert_array_almost_equal(mean, subs.mean(axis=1))
+    assert_array_almost_equal(std, subs.std(axis=1))
+
+
+@pytest.mark.parametrize("m", [4, 5])
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_matrix_profile_self_join(m, n_jobs):
+    """Test the self join against the brute force distance matrix."""
+    X = np.random.default_rng(0).normal(size=60)
+    dist = _brute_force_distances(X, X, m)
+    n_subs = dist.shape[0]
+    idx = np.arange(n_subs)
+    dist[np.abs(idx[:, None] - idx[None, :]) <= m // 2] = np.inf
+
+    mp, ip = matrix_profile_self_join(X, m, n_jobs=n_jobs)
+    assert_array_almost_equal(mp, dist.min(axis=1))
+    assert_array_equal(ip, dist.argmin(axis=1))
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_matrix_profile_ab_join(n_jobs):
+    """Test the AB join against the brute force distance matrix."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=40)
+    Y = rng.normal(size=55)
+    dist = _brute_force_distances(X, Y, 6)
+
+    mp_ab, ip_ab, mp_ba, ip_ba = matrix_profile_ab_join(X, Y, 6, n_jobs=n_jobs)
+    assert_array_almost_equal(mp_ab, dist.min(axis=1))
+    assert_array_equal(ip_ab, dist.argmin(axis=1))
+    assert_array_almost_equal(mp_ba, dist.min(axis=0))
+    assert_array_equal(ip_ba, dist.argmin(axis=0))
+
+
+def test_matrix_profile_constant_subsequences():
+    """Test the distances involving constant subsequences."""
+    X = np.array([1.0, 1.0, 1.0, 1.0, 0.0, 2.0, 1.0, 3.0, 1.0, 1.0, 1.0, 1.0])
+    mp, ip = matrix_profile_self_join(X, 3)
+    assert mp[0] == 0.0 and ip[0] == 8
+    mp_ab, _, _, _ = matrix_profile_ab_join(X[:3], X[4:8], 3)
+    assert_array_almost_equal(mp_ab, [np.sqrt(3)])
+
+
+def test_matrix_profile_approximate():
+    """Test that the anytime mode gives an upper bound of the exact profile."""
+    X = np.random.default_rng(0).normal(size=100)
+    mp, _ = matrix_profile_self_join(X, 8)
+    mp_approx, ip_approx = matrix_profile_self_join(
+        X, 8, percentage=0.3, random_state=0
+    )
+    assert np.all(mp_approx >= mp - 1e-8)
+    assert np.any(mp_approx > mp)
+    found = ip_approx >= 0
+    dist = _brute_force_distances(X, X, 8)
+    assert_array_almost_equal(
+        mp_approx[found], dist[np.flatnonzero(found), ip_approx[found]]
+    )
+
+    mp_full, _ = matrix_profile_self_join(X, 8, percentage=1.0, random_state=0)
+    assert_array_almost_equal(mp_full, mp)
+
+
+def test_multivariate_matrix_profile_self_join():
+    """Test the mSTAMP profiles against the brute force distance matrices."""
+    X = np.random.default_rng(0).normal(size=(3, 50))
+    m = 6
+    dist = np.stack([_brute_force_distances(x, x, m) for x in X])
+    # k-dimensional distances are the means of the k smallest channel distances
+    dist = np.cumsum(np.sort(dist, axis=0), axis=0) / np.arange(1, 4)[:, None, None]
+    n_subs = dist.shape[1]
+    idx = np.arange(n_subs)
+    dist[:, np.abs(idx[:, None] - idx[None, :]) <= m // 2] = np.inf
+
+    mp, ip = multivariate_matrix_profile_self_join(X, m, n_jobs=2)
+    assert_array_almost_equal(mp, dist.min(axis=2))
+    assert_array_equal(ip, dist.argmin(axis=2))
+
+    mp_1d, ip_1d = matrix_profile_self_join(X[1], m)
+    mp, ip = multivariate_matrix_profile_self_join(X[1:2], m)
+    assert_array_almost_equal(mp[0], mp_1d)
+    assert_array_equal(ip[0], ip_1d)
@@ -0,0 +1,48 @@
+"""Tests for the numba warm-up functions."""
+
+import os
+
+import pytest
+
+from aeon.distances import squared_distance
+from aeon.utils.numba.warmup import (
+    build_numba_cache,
+    register_warmup_kernel,
+    warmup_estimators,
+    warmup_kernels,
+)
+
+
+def test_register_warmup_kernel():
+    """Test the validation of registered kernels."""
+    with pytest.raises(ValueError, match="module:function"):
+        register_warmup_kernel("squared_distance", ["1d"])
+    with pytest.raises(ValueError, match="Unknown warm-up input"):
+        register_warmup_kernel("aeon.distances:squared_distance", ["4d"])
+    with pytest.raises(ValueError, match="not registered"):
+        warmup_kernels(["aeon.distances:unknown_distance"])
+
+
+def test_warmup_kernels():
+    """Test that kernels are compiled for each registered input."""
+    times = warmup_kernels(["aeon.distances:squared_distance"])
+    assert list(times.keys()) == ["aeon.distances:squared_distance"]
+    # 1D and 2D inputs, univariate and multivariate are the same type
+    assert len(squared_distance.signatures) >= 2
+
+
+def test_warmup_estimators():
+    """Test that estimators are fitted on univariate and multivariate data."""
+    name = "aeon.transformations.collection.convolution_based:MiniRocket"
+    times = warmup_estimators([name])
+    assert list(times.keys()) == [name]
+    assert times[name] > 0
+
+
+def test_build_numba_cache(tmp_path):
+    """Test that the cache is written and the report covers each kernel."""
+    kernel = "aeon.distances:squared_distance"
+    report = build_numba_cache(str(tmp_path), kernels=[kernel], estimators=[])
+    assert list(report.index) == [kernel]
+    assert list(report.columns) == ["cold", "warm", "saved"]
+    assert len(os.listdir(tmp_path)) > 0
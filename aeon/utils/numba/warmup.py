@@ -0,0 +1,289 @@
+"""Numba compilation warm-up and cache building.
+
+Most ``aeon`` kernels are compiled with ``@njit(cache=True)``, so the compiled
+machine code is written to disk and reused by later processes. The first process
+still pays the compilation time for each kernel and signature it uses. The functions
+in this module compile registered kernels and estimators on small example inputs so
+that the cache can be built ahead of time, for example when building a container
+image.
+
+The cache location is controlled by the ``NUMBA_CACHE_DIR`` environment variable,
+which has to be set before ``aeon`` or ``numba`` are imported. A cache directory
+built with :func:`build_numba_cache` can be copied into an image and used by setting
+``NUMBA_CACHE_DIR`` to its new location. Numba only reuses cache entries for source
+files with the same path and modification time as when the cache was built, so
+``aeon`` has to be installed in the same location.
+"""
+
+__all__ = [
+    "register_warmup_kernel",
+    "warmup_kernels",
+    "warmup_estimators",
+    "build_numba_cache",
+]
+
+import json
+import os
+import subprocess
+import sys
+import time
+from importlib import import_module
+
+import numpy as np
+import pandas as pd
+
+# example inputs, float64 series of 20 time points
+_WARMUP_INPUTS = {
+    "1d": (20,),
+    "2d_univariate": (1, 20),
+    "2d_multivariate": (3, 20),
+    "3d_univariate": (5, 1, 20),
+    "3d_multivariate": (5, 3, 20),
+}
+
+_SERIES_INPUTS = ["1d", "2d_univariate", "2d_multivariate"]
+_COLLECTION_INPUTS = ["3d_univariate", "3d_multivariate"]
+
+# registered kernels, "module:function" -> (input names, number of array arguments)
+_WARMUP_KERNELS = {}
+
+_WARMUP_ESTIMATORS = [
+    "aeon.classification.convolution_based:RocketClassifier",
+    "aeon.classification.distance_based:KNeighborsTimeSeriesClassifier",
+    "aeon.classification.dictionary_based:BOSSEnsemble",
+    "aeon.classification.dictionary_based:TemporalDictionaryEnsemble",
+    "aeon.transformations.collection.catch22:Catch22",
+    "aeon.classification.interval_based:DrCIFClassifier",
+    "aeon.classification.shapelet_based:ShapeletTransformClassifier",
+    "aeon.clustering:TimeSeriesKMeans",
+    "aeon.regression.convolution_based:RocketRegressor",
+    "aeon.transformations.collection.convolution_based:MiniRocket",
+]
+
+
+def register_warmup_kernel(kernel, inputs, n_args=1):
+    """Register a numba kernel to be compiled by :func:`warmup_kernels`.
+
+    Parameters
+    ----------
+    kernel : str
+        The kernel to compile, as ``"module:function"``.
+    inputs : list of str
+        The example inputs to compile the kernel for. Valid names are ``"1d"``,
+        ``"2d_univariate"``, ``"2d_multivariate"``, ``"3d_univariate"`` and
+        ``"3d_multivariate"``.
+    n_args : int, default=1
+        The number of array arguments the kernel is called with, each of the same
+        shape.
+
+    Examples
+    --------
+    >>> from aeon.utils.numba.warmup import register_warmup_kernel
+    >>> register_warmup_kernel(
+    ...     "aeon.distances:shape_dtw_distance", ["1d", "2d_multivariate"], n_args=2
+    ... )
+    """
+    if ":" not in kernel:
+        raise ValueError(f"kernel must be given as 'module:function', found {kernel}.")
+    for name in inputs:
+        if name not in _WARMUP_INPUTS:
+            raise ValueError(
+                f"Unknown warm-up input {name}, valid inputs are "
+                f"{list(_WARMUP_INPUTS.keys())}."
+            )
+    _WARMUP_KERNELS[kernel] = (list(inputs), n_args)
+
+
+def warmup_kernels(kernels=None):
+    """Compile numba kernels for their registered example inputs.
+
+    Each kernel is called once per registered input, which compiles it and any
+    kernels it calls for float64 arrays of that shape. Kernels compiled with
+    ``cache=True`` are written to the numba cache.
+
+    Parameters
+    ----------
+    kernels : list of str or None, default=None
+        The registered kernels to compile, as ``"module:function"``. If None, all
+        registered kernels are compiled.
+
+    Returns
+    -------
+    times : dict
+        The time in seconds spent importing and calling each kernel.
+
+    Examples
+    --------
+    >>> from aeon.utils.numba.warmup import warmup_kernels
+    >>> times = warmup_kernels(["aeon.distances:euclidean_distance"])
+    """
+    if kernels is None:
+        kernels = list(_WARMUP_KERNELS.keys())
+
+    rng = np.random.RandomState(0)
+    times = {}
+    for kernel in kernels:
+        if kernel not in _WARMUP_KERNELS:
+            raise ValueError(f"Kernel {kernel} is not registered for warm-up.")
+        inputs, n_args = _WARMUP_KERNELS[kernel]
+
+        start = time.time()
+        func = _import_object(kernel)
+        for name in inputs:
+            func(*[rng.normal(size=_WARMUP_INPUTS[name]) for _ in range(n_args)])
+        times[kernel] = time.time() - start
+
+    return times
+
+
+def warmup_estimators(estimators=None):
+    """Compile the numba kernels used by estimators by fitting them on small data.
+
+    Each estimator is constructed with its test parameters and a fixed random state,
+    and fitted, then used to predict or transform, on a univariate collection of 10
+    series of length 20. If the estimator is capable of it, the same is done on a
+    multivariate collection.
+
+    Parameters
+    ----------
+    estimators : list of str or None, default=None
+        The estimators to warm up, as ``"module:class"``. If None, a default set of
+        classifiers, regressors, clusterers and transformers is used.
+
+    Returns
+    -------
+    times : dict
+        The time in seconds spent importing, fitting and predicting with each
+        estimator.
+    """
+    if estimators is None:
+        estimators = _WARMUP_ESTIMATORS
+
+    rng = np.random.RandomState(0)
+    X_univariate = rng.normal(size=(10, 1, 20))
+    X_multivariate = rng.normal(size=(10, 2, 20))
+    y = np.array([0, 1] * 5)
+
+    times = {}
+    for name in estimators:
+        # kernels with explicit signatures are compiled on import
+        start = time.time()
+        cls = _import_object(name)
+        datasets = [X_univariate]
+        if cls.get_class_tag("capability:multivariate", False):
+            datasets.append(X_multivariate)
+
+        for X in datasets:
+            estimator = cls.create_test_instance()
+            if "random_state" in estimator.get_params():
+                estimator.set_params(random_state=0)
+            y_fit = y.astype(float) if _is_regressor(estimator) else y
+            if hasattr(estimator, "predict"):
+                estimator.fit(X, y_fit)
+                estimator.predict(X)
+            else:
+                estimator.fit_transform(X, y_fit)
+        times[name] = time.time() - start
+
+    return times
+
+
+def build_numba_cache(cache_dir, kernels=None, estimators=None):
+    """Build a numba cache directory and report the cold start time it saves.
+
+    The kernels and estimators are warmed up twice in new Python processes using
+    ``cache_dir`` as ``NUMBA_CACHE_DIR``. The first process compiles and writes the
+    cache, the second loads it. For an accurate report ``cache_dir`` should be empty
+    or not exist.
+
+    Parameters
+    ----------
+    cache_dir : str
+        The directory to write the numba cache to.
+    kernels : list of str or None, default=None
+        The registered kernels to compile, see :func:`warmup_kernels`. If None, all
+        registered kernels are compiled.
+    estimators : list of str or None, default=None
+        The estimators to warm up, see :func:`warmup_estimators`. If None, the
+        default set of estimators is used.
+
+    Returns
+    -------
+    report : pd.DataFrame
+        The time in seconds of each kernel and estimator without the cache
+        ("cold") and with the cache ("warm"), and the difference ("saved").
+    """
+    cache_dir = os.path.abspath(cache_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    cold = _run_warmup_process(cache_dir, kernels, estimators)
+    warm = _run_warmup_process(cache_dir, kernels, estimators)
+
+    report = pd.DataFrame({"cold": cold, "warm": warm})
+    report["saved"] = report["cold"] - report["warm"]
+    return report
+
+
+def _run_warmup_process(cache_dir, kernels, estimators):
+    env = os.environ.copy()
+    env["NUMBA_CACHE_DIR"] = cache_dir
+    code = (
+        "import json, sys\n"
+        "from aeon.utils.numba.warmup import warmup_estimators, warmup_kernels\n"
+        "kernels, estimators = json.loads(sys.argv[1]), json.loads(sys.argv[2])\n"
+        "times = {}\n"
+        "times.update(warmup_kernels(kernels))\n"
+        "times.update(warmup_estimators(estimators))\n"
+        "print(json.dumps(times))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code, json.dumps(kernels), json.dumps(estimators)],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"numba warm-up process failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _import_object(path):
+    module, name = path.split(":")
+    return getattr(import_module(module), name)
+
+
+def _is_regressor(estimator):
+    from aeon.regression.base import BaseRegressor
+
+    return isinstance(estimator, BaseRegressor)
+
+
+for _distance in [
+    "euclidean",
+    "squared",
+    "manhattan",
+    "dtw",
+    "ddtw",
+    "wdtw",
+    "wddtw",
+    "adtw",
+    "lcss",
+    "erp",
+    "edr",
+    "twe",
+    "msm",
+]:
+    register_warmup_kernel(
+        f"aeon.distances:{_distance}_distance", _SERIES_INPUTS, n_args=2
+    )
+    register_warmup_kernel(
+        f"aeon.distances:{_distance}_pairwise_distance", _COLLECTION_INPUTS
+    )
+register_warmup_kernel("aeon.utils.numba.general:z_normalise_series", ["1d"])
+register_warmup_kernel(
+    "aeon.utils.numba.general:z_normalise_series_2d",
+    ["2d_univariate", "2d_multivariate"],
+)
+register_warmup_kernel(
+    "aeon.utils.numba.general:z_normalise_series_3d", _COLLECTION_INPUTS
+)
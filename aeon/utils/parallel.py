@@ -0,0 +1,76 @@
+"""Parallel execution backends for loops over independent function calls."""
+
+__all__ = ["parallelize", "PARALLEL_BACKENDS"]
+
+from aeon.utils.validation._dependencies import _check_soft_dependencies
+
+PARALLEL_BACKENDS = [None, "loky", "threading", "multiprocessing", "dask"]
+
+
+def parallelize(fun, iterable, meta=None, backend=None, backend_params=None):
+    """Apply a function to each element of an iterable, possibly in parallel.
+
+    The results are always returned in the order of ``iterable``, independent of the
+    backend and of the order in which the calls finish.
+
+    Parameters
+    ----------
+    fun : callable
+        The function to apply, called as ``fun(x, meta=meta)`` for each ``x`` in
+        ``iterable``. For the ``"loky"``, ``"multiprocessing"`` and ``"dask"`` backends
+        ``fun``, the elements of ``iterable`` and ``meta`` have to be picklable.
+    iterable : iterable
+        The elements to apply ``fun`` to.
+    meta : dict or None, default=None
+        Arguments passed to every call of ``fun``.
+    backend : str or None, default=None
+        The backend to execute the calls with, one of:
+
+        - None: sequential loop in the current process.
+        - "loky", "threading", "multiprocessing": ``joblib.Parallel`` with the given
+          backend.
+        - "dask": ``dask.delayed`` calls computed with ``dask.compute``, requires
+          ``dask`` to be installed.
+    backend_params : dict or None, default=None
+        Additional arguments passed to the backend. For the joblib backends these are
+        passed to ``joblib.Parallel``, with ``n_jobs=-1`` unless given. For
+        ``"dask"`` these are passed to ``dask.compute``, for example ``scheduler``.
+        Ignored if ``backend`` is None.
+
+    Returns
+    -------
+    results : list
+        ``fun(x, meta=meta)`` for each ``x`` in ``iterable``, in the same order.
+
+    Examples
+    --------
+    >>> from aeon.utils.parallel import parallelize
+    >>> def power(x, meta):
+    ...     return x ** meta["exponent"]
+    >>> parallelize(power, [1, 2, 3], meta={"exponent": 2}, backend="threading")
+    [1, 4, 9]
+    """
+    if backend not in PARALLEL_BACKENDS:
+        raise ValueError(
+            f"backend must be one of {PARALLEL_BACKENDS}, but found {backend}."
+        )
+    if backend_params is None:
+        backend_params = {}
+
+    if backend is None:
+        return [fun(x, meta=meta) for x in iterable]
+    elif backend == "dask":
+        _check_soft_dependencies("dask", obj="parallelize")
+        from dask import compute, delayed
+
+        return list(
+            compute(*[delayed(fun)(x, meta=meta) for x in iterable], **backend_params)
+        )
+    else:
+        from joblib import Parallel, delayed
+
+        params = {"n_jobs": -1}
+        params.update(backend_params)
+        return Parallel(backend=backend, **params)(
+            delayed(fun)(x, meta=meta) for x in iterable
+        )
@@ -0,0 +1,28 @@
+"""Tests for the parallel execution backends."""
+
+import pytest
+
+from aeon.utils.parallel import parallelize
+from aeon.utils.validation._dependencies import _check_soft_dependencies
+
+
+def _square_plus(x, meta):
+    return x**2 + meta["add"]
+
+
+BACKENDS = [None, "loky", "threading", "multiprocessing"]
+if _check_soft_dependencies("dask", severity="none"):
+    BACKENDS.append("dask")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_parallelize(backend):
+    """Test that all backends return the results in order."""
+    results = parallelize(_square_plus, range(20), meta={"add": 1}, backend=backend)
+    assert results == [x**2 + 1 for x in range(20)]
+
+
+def test_parallelize_invalid_backend():
+    """Test that an unknown backend raises an error."""
+    with pytest.raises(ValueError, match="backend must be one of"):
+        parallelize(_square_plus, range(3), meta={"add": 1}, backend="spark")